@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark parsere HTML pe paginile salvate de scraper-e (logs/debug_*.html).
+Pentru fiecare backend disponibil (lxml, selectolax, html.parser) măsoară parsarea paginii
+și extragerea textului complet (soup_text), mediana din N repetări. Pentru selectolax „parse” e
+arborele BeautifulSoup construit cu lxml (ca în scraper-e), iar „text” e extras cu selectolax.
+
+Rulare:
+    python benchmark_parsers.py
+    python benchmark_parsers.py --pattern "logs/debug_*.html" --repeat 5
+"""
+import argparse
+import glob
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from src.core.parsing import available_backends, make_soup, soup_text
+
+
+def _median_ms(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parsere HTML pe logs/debug_*.html")
+    parser.add_argument("--pattern", default=str(Path(__file__).resolve().parent / "logs" / "debug_*.html"))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    files = sorted(glob.glob(args.pattern))
+    if not files:
+        print(f"[!] Nicio pagină găsită: {args.pattern} (rulează un import ca să se salveze logs/debug_*.html)")
+        return 1
+    backends = available_backends()
+    print(f"[*] {len(files)} pagini, backend-uri: {', '.join(backends)}, {args.repeat} repetări\n")
+
+    header = f"{'Pagina':<48} {'KB':>6}" + "".join(f" {b + ' parse':>18} {b + ' text':>17}" for b in backends)
+    print(header)
+    print("-" * len(header))
+    totals = {b: [0.0, 0.0] for b in backends}
+    for path in files:
+        markup = Path(path).read_bytes()
+        row = f"{Path(path).name[:48]:<48} {len(markup) / 1024:>6.0f}"
+        for backend in backends:
+            parse_ms = _median_ms(lambda: make_soup(markup, backend=backend), args.repeat)
+            # Textul se măsoară pe un arbore nou la fiecare repetare (soup_text e memorat pe soup)
+            soups = [make_soup(markup, backend=backend) for _ in range(args.repeat)]
+            text_ms = _median_ms(lambda: soup_text(soups.pop(), "\n"), args.repeat)
+            totals[backend][0] += parse_ms
+            totals[backend][1] += text_ms
+            row += f" {parse_ms:>15.1f} ms {text_ms:>14.1f} ms"
+        print(row)
+
+    print("\nTotal per pagină (medie):")
+    baseline = sum(totals["html.parser"]) / len(files)
+    for backend in backends:
+        per_page = sum(totals[backend]) / len(files)
+        speedup = baseline / per_page if per_page else 0
+        print(f"   {backend:<12} {per_page:>8.1f} ms/pagină  (×{speedup:.1f} față de html.parser)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
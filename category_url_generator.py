@@ -19,7 +19,11 @@ except:
     pass
 import requests
 from pathlib import Path
-import time
+
+from src.core.ratelimit import configure_host
+
+# Rate limit MobileSentrix (încetinește singur la 429/403/5xx) în loc de sleep fix între teste
+_LIMITER = configure_host("mobilesentrix.eu", requests_per_second=3, max_in_flight=1)
 
 
 def test_url(url, headers=None):
@@ -28,7 +32,9 @@ def test_url(url, headers=None):
         headers = {'User-Agent': 'Mozilla/5.0'}
     
     try:
-        response = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
+        with _LIMITER.slot() as outcome:
+            response = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
+            outcome["status"] = response.status_code
         return response.status_code == 200
     except:
         return False
@@ -121,8 +127,6 @@ def generate_category_urls():
             
             if found:
                 break
-            
-            time.sleep(0.3)  # Rate limit
         
         if not found:
             print(f"  [--] {category_name:30} -> Niciun URL valid")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test de regresie pentru motorul de categorii (src/core/categories.py).
+Pentru fiecare link din category_links.csv construiește câteva variante de intrare (nume din slug,
+descriere = categoria furnizorului, taguri, cod manual) și compară slug-ul WebGSM + calea Woo cu
+rezultatele salvate în category_regression.csv.
+
+Rulare:
+    python check_categories.py            # compară (exit 1 la diferențe)
+    python check_categories.py --update   # rescrie category_regression.csv după o schimbare intenționată
+"""
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+from src.core.categories import CATEGORY_CODE_MAP, category_engine
+
+ROOT = Path(__file__).resolve().parent
+FIELDS = ["link", "variant", "slug", "woo_path"]
+
+
+def iter_cases(csv_path):
+    """(link, variantă, kwargs pentru classify) – aceleași intrări la fiecare rulare."""
+    codes = sorted(CATEGORY_CODE_MAP) + ["XYZ"]
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        for i, row in enumerate(csv.DictReader(f)):
+            link = (row.get("Link Produs") or "").strip()
+            supplier_cat = (row.get("Categoria") or "").strip()
+            slug = link.rstrip("/").split("/")[-1].split("?")[0]
+            name = slug.replace("-", " ")
+            yield link, "name", {"product_name": name}
+            yield link, "name+desc", {"product_name": name, "description": supplier_cat}
+            yield link, "slug+tags", {"product_name": "", "url_slug": slug, "tags": supplier_cat}
+            yield link, "manual", {"product_name": name, "manual_code": codes[i % len(codes)].lower()}
+
+
+def compute(csv_path, classify=None):
+    classify = classify or category_engine().classify
+    rows = []
+    for link, variant, kwargs in iter_cases(csv_path):
+        slug, woo_path = classify(**kwargs)
+        rows.append({"link": link, "variant": variant, "slug": slug, "woo_path": woo_path})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regresie categorii pe category_links.csv")
+    parser.add_argument("--csv", default=str(ROOT / "category_links.csv"))
+    parser.add_argument("--expected", default=str(ROOT / "category_regression.csv"))
+    parser.add_argument("--update", action="store_true", help="rescrie fișierul de referință")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = compute(args.csv)
+    elapsed = time.perf_counter() - start
+    print(f"[*] {len(rows)} clasificări în {elapsed * 1000:.0f} ms")
+
+    if args.update:
+        with open(args.expected, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"[OK] Referință scrisă: {args.expected}")
+        return 0
+
+    with open(args.expected, encoding="utf-8", newline="") as f:
+        expected = list(csv.DictReader(f))
+    if len(expected) != len(rows):
+        print(f"[!] Număr diferit de cazuri: {len(rows)} față de {len(expected)} în referință (rulează cu --update?)")
+        return 1
+    diffs = [(exp, got) for exp, got in zip(expected, rows) if exp != got]
+    for exp, got in diffs[:20]:
+        print(f"[!] {got['variant']:<10} {got['link']}\n"
+              f"      așteptat: {exp['slug']} | {exp['woo_path']}\n"
+              f"      obținut:  {got['slug']} | {got['woo_path']}")
+    if diffs:
+        print(f"[!] {len(diffs)} diferențe din {len(rows)}")
+        return 1
+    print(f"[OK] Identic cu referința ({len(rows)} cazuri)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Verifică dacă Ollama răspunde pe rețea (pentru scraper din VM).
-Citește OLLAMA_URL din .env sau folosește http://localhost:11434.
-Rulează din VM: python check_ollama.py
+Verifică dacă Ollama răspunde pe rețea (pentru scraper din VM) și pre-încarcă modelul.
+Citește OLLAMA_URL, OLLAMA_MODEL și OLLAMA_KEEP_ALIVE din .env (implicit http://localhost:11434).
+Rulează din VM: python check_ollama.py            # verificare + încărcare model (raportează timpul de încărcare)
+                python check_ollama.py --no-load  # doar verificarea conexiunii
 """
+import argparse
 import os
 import sys
 
@@ -34,11 +36,61 @@ def check_ollama(base_url=None, timeout=5):
     except Exception as e:
         return False, f"Eroare: {e}"
 
+def import_num_ctx():
+    """num_ctx trimis de import (aceeași regulă ca ImportProduse._ollama_num_ctx): OLLAMA_NUM_CTX dacă e setat,
+    altfel 0 (valoarea serverului) sau BATCH_NUM_CTX când loturile Ollama sunt active."""
+    raw = os.getenv("OLLAMA_NUM_CTX", "").strip()
+    try:
+        if raw:
+            return max(0, int(raw))
+    except ValueError:
+        pass
+    try:
+        batch_size = int(os.getenv("OLLAMA_BATCH_SIZE", "1").strip() or 1)
+    except ValueError:
+        batch_size = 1
+    output = (os.getenv("OLLAMA_OUTPUT") or "json").strip().lower()
+    if batch_size > 1 and output != "lines":
+        from src.core.ollama_fields import BATCH_NUM_CTX
+        return BATCH_NUM_CTX
+    return 0
+
+def warm_up(base_url, model, keep_alive="30m", timeout=300, num_ctx=0):
+    """Încarcă modelul în memoria serverului (cu același num_ctx ca importul). Returnează (ok: bool, msg: str)."""
+    try:
+        from src.core.ollama_warmup import preload_model
+    except ImportError as e:
+        return False, f"Nu pot încărca src.core.ollama_warmup: {e}"
+    try:
+        info = preload_model(base_url, model, keep_alive=keep_alive, timeout=timeout,
+                             options={"num_ctx": num_ctx} if num_ctx else None)
+    except Exception as e:
+        return False, f"Eroare la încărcarea modelului {model}: {e}"
+    if info["already_loaded"]:
+        return True, f"OK – modelul {model} era deja încărcat (keep_alive {keep_alive}, răspuns în {info['wall_s']:.1f}s)"
+    return True, f"OK – modelul {model} încărcat în {info['load_s']:.1f}s (keep_alive {keep_alive})"
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Verificare Ollama + pre-încărcare model")
+    parser.add_argument("--no-load", action="store_true", help="doar verifică conexiunea, fără încărcarea modelului")
+    args = parser.parse_args()
+
     url = os.getenv("OLLAMA_URL", "").strip() or "http://localhost:11434"
     print(f"Verific Ollama la: {url}")
     ok, msg = check_ollama(url)
     print(msg)
+    if ok and not args.no_load:
+        model = os.getenv("OLLAMA_MODEL", "").strip() or "llama3.2"
+        keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "").strip() or "30m"
+        try:
+            timeout = int(os.getenv("OLLAMA_TIMEOUT", "300").strip() or 300)
+        except ValueError:
+            timeout = 300
+        num_ctx = import_num_ctx()
+        print(f"Încarc modelul: {model}")
+        ok, msg = warm_up(url, model, keep_alive=keep_alive, timeout=timeout, num_ctx=num_ctx)
+        print(msg)
     sys.exit(0 if ok else 1)
 
 if __name__ == "__main__":
@@ -26,12 +26,14 @@ import requests
 from bs4 import BeautifulSoup
 from pathlib import Path
 import csv
-import time
 import json
 from urllib.parse import urljoin, urlparse
 from collections import defaultdict
 import re
 
+from src.core.http import RateLimitedAdapter, host_label
+from src.core.ratelimit import configure_host
+
 
 class CategoryLinksExtractor:
     def __init__(self):
@@ -41,11 +43,10 @@ class CategoryLinksExtractor:
         self.base_url = "https://www.mobilesentrix.eu"
         self.categories = defaultdict(list)  # {category_name: [product_links]}
         self.session = requests.Session()
-        # Retry logic
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-        retry_strategy = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Rate limit per host (1 req/s, încetinește singur la 429/403/5xx) în loc de sleep fix;
+        # retry (3 încercări, backoff cu jitter, Retry-After) din politica comună a adapter-ului
+        configure_host(host_label(self.base_url), requests_per_second=1, max_in_flight=1)
+        adapter = RateLimitedAdapter()
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -167,7 +168,6 @@ class CategoryLinksExtractor:
                     break
                 
                 page += 1
-                time.sleep(1)  # Rate limit
                 
             except Exception as e:
                 print(f" (Eroare: {e})")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rulare headless (fără Tkinter) a importului: scrape → enrich → upload imagini → CSV WebGSM.
+Același pipeline ca butonul din GUI (ImportProduse.run_import_job), util pentru rulări
+programate pe server Linux (cron) și pentru mai mulți furnizori în procese paralele.
+
+Exemple:
+    python -m import_cli import --supplier foneday --input suppliers/foneday/sku_list.txt
+    python -m import_cli import --supplier foneday --supplier mmsmobile --parallel 2
+    python -m import_cli suppliers
+"""
+import argparse
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from import_gui import ImportProduse, ScraperFactory
+from src.core import LogSink
+
+
+class _Value:
+    """Înlocuitor minimal pentru tk.Variable (get/set) – rularea headless nu are root Tk."""
+
+    def __init__(self, value=None):
+        self._value = value
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+
+
+class HeadlessImporter(ImportProduse):
+    """ImportProduse fără GUI: opțiunile vin din argumente, log-ul merge la stdout (LogSink)."""
+
+    interactive = False
+
+    def __init__(self, convert_price=True, exchange_rate=None, resume=True, download_images=True, log_prefix="import"):
+        self.root = None
+        # Fără GUI: nu păstrăm coadă pentru tab-ul Log, mesajele merg direct la stdout (+ fișier opțional)
+        log_sink = LogSink(ui_queue=False)
+        # Fișier de log separat per furnizor – procesele paralele nu rotesc același fișier
+        self._init_state(log_sink, log_prefix=log_prefix)
+        # După load_config (.env încărcat): stdout respectă LOG_LEVEL, ca tab-ul Log din GUI
+        log_sink.add_stream_sink(sys.stdout, min_level=os.getenv('LOG_LEVEL', 'INFO'))
+
+        # Aceleași opțiuni ca în tab-ul Import (fără popup-uri: badge / selecție manuală oprite)
+        self.download_images_var = _Value(download_images)
+        self.optimize_images_var = _Value(False)
+        self.convert_price_var = _Value(convert_price)
+        self.extract_description_var = _Value(True)
+        self.badge_preview_var = _Value(False)
+        self.image_selection_var = _Value(False)
+        self.resume_run_var = _Value(resume)
+        self.progress_var = _Value("")
+        self.exchange_rate_var = _Value(str(exchange_rate or self.config.get('EXCHANGE_RATE', '4.97')))
+
+    def set_progress(self, text):
+        # Fără GUI nu există timer care să aplice textul – _Value e sigur de setat direct
+        self.progress_var.set(text)
+
+
+def _run_supplier_job(supplier_name, sku_file, csv_filename, convert_price, exchange_rate, resume):
+    """Un job complet pentru un furnizor (rulează și în proces separat). Returnează sumarul run_import_job."""
+    app = HeadlessImporter(convert_price=convert_price, exchange_rate=exchange_rate, resume=resume,
+                           log_prefix=f"import_{supplier_name}")
+    app.running = True
+
+    # Ctrl+C / SIGTERM → oprire curată: CSV parțial valid + jurnal pentru reluare
+    def _stop(signum, frame):
+        app.log("⏹️ Semnal de oprire primit – termin produsele în lucru și închid CSV-ul", "WARNING")
+        app.running = False
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGINT, _stop)
+        signal.signal(signal.SIGTERM, _stop)
+    try:
+        return app.run_import_job(supplier_name, str(sku_file), csv_filename=csv_filename)
+    finally:
+        app.running = False
+        app.log_sink.close()
+
+
+def _cmd_import(args):
+    suppliers = []
+    for value in args.supplier:
+        suppliers.extend(s.strip().lower() for s in value.split(',') if s.strip())
+    if not suppliers:
+        print("✗ Specifică cel puțin un furnizor (--supplier)", file=sys.stderr)
+        return 2
+    if args.input and len(suppliers) > 1:
+        print("✗ --input se poate folosi doar cu un singur furnizor (altfel se ia sku_list din config)", file=sys.stderr)
+        return 2
+
+    jobs = []
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    for name in suppliers:
+        if not ScraperFactory or not ScraperFactory.load_supplier_config(name):
+            print(f"✗ Furnizor necunoscut sau fără config.json: {name}", file=sys.stderr)
+            return 2
+        sku_file = Path(args.input) if args.input else ScraperFactory.get_sku_list_path(name)
+        if not sku_file or not sku_file.exists():
+            print(f"✗ Fișierul SKU nu există: {sku_file}", file=sys.stderr)
+            return 2
+        # Nume CSV unic per furnizor – procesele paralele nu se suprascriu
+        csv_filename = args.output if (args.output and len(suppliers) == 1) else f"export_webgsm_{name}_{timestamp}.csv"
+        jobs.append((name, sku_file, csv_filename, not args.no_price_convert, args.exchange_rate, not args.no_resume))
+
+    summaries = {}
+    if len(jobs) == 1 or args.parallel <= 1:
+        for job in jobs:
+            summaries[job[0]] = _run_supplier_job(*job)
+    else:
+        with ProcessPoolExecutor(max_workers=min(args.parallel, len(jobs))) as pool:
+            futures = {job[0]: pool.submit(_run_supplier_job, *job) for job in jobs}
+            for name, future in futures.items():
+                try:
+                    summaries[name] = future.result()
+                except Exception as e:
+                    print(f"✗ [{name}] Eroare critică: {e}", file=sys.stderr)
+                    summaries[name] = None
+
+    exit_code = 0
+    for name, summary in summaries.items():
+        if not summary:
+            exit_code = 2
+            continue
+        print(f"📊 {name}: {summary['success']}/{summary['total']} produse, "
+              f"erori scraping {summary['errors']}, erori export {summary['export_errors']}, "
+              f"CSV: {summary['csv_path'] or '-'}, raport: {summary.get('report_path') or '-'}")
+        if summary['errors'] or summary['export_errors']:
+            exit_code = max(exit_code, 1)
+    return exit_code
+
+
+def _cmd_suppliers(args):
+    for supp in (ScraperFactory.list_available_suppliers() if ScraperFactory else []):
+        print(f"{supp['name']:<20} {supp['display_name']}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="import_cli",
+        description="Import produse furnizori → CSV WebGSM, fără interfață grafică.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="Rulează importul pentru unul sau mai mulți furnizori")
+    p_import.add_argument("--supplier", action="append", required=True,
+                          help="Furnizor (nume folder din suppliers/); repetabil sau separat prin virgulă")
+    p_import.add_argument("--input", help="Fișier SKU/URL (implicit sku_list_file din config-ul furnizorului)")
+    p_import.add_argument("--output", help="Nume fișier CSV în data/ (doar pentru un singur furnizor)")
+    p_import.add_argument("--parallel", type=int, default=1,
+                          help="Câți furnizori rulează simultan, în procese separate (implicit 1)")
+    p_import.add_argument("--exchange-rate", help="Curs EUR → RON (implicit EXCHANGE_RATE din .env)")
+    p_import.add_argument("--no-price-convert", action="store_true", help="Păstrează prețul în EUR")
+    p_import.add_argument("--no-resume", action="store_true", help="Ignoră jurnalul rulării întrerupte")
+    p_import.set_defaults(func=_cmd_import)
+
+    p_suppliers = sub.add_parser("suppliers", help="Listează furnizorii activi")
+    p_suppliers.set_defaults(func=_cmd_suppliers)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
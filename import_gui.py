@@ -13,15 +13,20 @@ try:
 except:
     pass
 
-import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox, filedialog, colorchooser
+try:
+    import tkinter as tk
+    from tkinter import ttk, scrolledtext, messagebox, filedialog, colorchooser
+    # PIL.ImageTk importă tkinter la import → tot aici, altfel modulul cade fără Tk
+    from PIL import ImageTk
+except ImportError:
+    # Server fără Tk: modulul rămâne importabil pentru rularea headless (import_cli.py)
+    tk = ttk = scrolledtext = messagebox = filedialog = colorchooser = ImageTk = None
 import json
 import threading
 from datetime import datetime
 from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
 from dotenv import load_dotenv, set_key
 import re
@@ -46,12 +51,51 @@ except ImportError:
     except ImportError:
         ScraperFactory = None
 
+# Pipeline cu etape + CSV incremental (fără dependențe externe; sys.path e setat mai sus)
+from src.core import (
+    CircuitOpenError, HttpCache, LogSink, RetryPolicy, RunJournal, RunMetrics, StagedPipeline, StreamingCsvWriter,
+    KeyValueCache, TranslationCache, build_http_session, configure_host, configure_retry, make_soup, soup_text, structured_product, timed,
+)
+from src.core.categories import CATEGORY_CODE_MAP, UNCATEGORIZED, KeywordRules, category_engine, load_keyword_rules
+from src.core.http import host_label
+from src.core.retry import IDEMPOTENT_METHODS
+from src.core.keywords import KeywordMatcher, RankedKeywords
+from src.core.ollama_stream import stream_generate
+from src.core.ollama_warmup import RELOAD_THRESHOLD_S, preload_model, response_timings
+from src.core.ollama_fields import (
+    BATCH_NUM_CTX, BATCH_SCHEMA, BATCH_SYSTEM, FIELDS_NUM_PREDICT, FIELDS_SCHEMA, OUTPUT_FORMATS, batch_tokens,
+    build_batch_prompt, build_fields_prompt, fields_cache_key, fields_system, parse_batch_json, parse_fields_json,
+    parse_fields_response,
+)
+from src.core.translate_batch import BatchTranslator
+
 # Max imagini per produs în CSV. Imagini sunt deja uploadate de script pe WordPress;
 # CSV conține doar link-uri către aceste imagini – limitarea reduce volumul per rând la import.
 MAX_IMAGES_IN_CSV = 5
 # Versiune fix imagini batch (variante culoare același prefix URL) – verifică în log la START
 SCRAPER_IMAGE_BUILD = "2026-06-25-ms-id"
 
+# Coloane CSV WebGSM (export complet și export doar imagini folosesc același header)
+WEBGSM_CSV_FIELDNAMES = [
+    'ID', 'Type', 'SKU', 'GTIN, UPC, EAN, or ISBN', 'Name', 'Published', 'Is featured?',
+    'Visibility in catalog', 'Short description', 'Description',
+    'Tax status', 'Tax class', 'In stock?', 'Stock', 'Low stock amount', 'Backorders allowed?',
+    'Regular price', 'Categories', 'Tags', 'Images', 'Parent', 'Allow customer reviews?',
+    # ATRIBUTE WOOCOMMERCE (5 atribute x 4 coloane)
+    'Attribute 1 name', 'Attribute 1 value(s)', 'Attribute 1 visible', 'Attribute 1 global',
+    'Attribute 2 name', 'Attribute 2 value(s)', 'Attribute 2 visible', 'Attribute 2 global',
+    'Attribute 3 name', 'Attribute 3 value(s)', 'Attribute 3 visible', 'Attribute 3 global',
+    'Attribute 4 name', 'Attribute 4 value(s)', 'Attribute 4 visible', 'Attribute 4 global',
+    'Attribute 5 name', 'Attribute 5 value(s)', 'Attribute 5 visible', 'Attribute 5 global',
+    # ACF META
+    'meta:gtin_ean', 'meta:sku_furnizor', 'meta:furnizor_activ',
+    'meta:pret_achizitie', 'meta:locatie_stoc', 'meta:garantie_luni',
+    'meta:coduri_compatibilitate', 'meta:ic_movable', 'meta:truetone_support',
+    'meta:source_url',
+    # SEO RANK MATH
+    'meta:rank_math_title', 'meta:rank_math_description', 'meta:rank_math_focus_keyword'
+]
+
 # Mapare categorie → Tip Produs (pentru Atribut 5 în CSV)
 CATEGORY_TO_TYPE = {
     'Baterii': 'Baterie', 'Ecrane': 'Ecran', 'Difuzoare': 'Difuzor', 'Camere': 'Camera',
@@ -62,70 +106,99 @@ CATEGORY_TO_TYPE = {
     'Kituri Complete': 'Unealtă', 'Huse & Carcase': 'Husă', 'Adezivi & Consumabile': 'Consumabil',
 }
 
-# Coduri categorie manuale (sku_list: link | COD) – prioritate față de Ollama
-# Ierarhie: PIESE 3 niveluri (Piese > Piese {Brand} > Tip), UNELTE/ACCESORII 2 niveluri
-# Slug-uri categorii NU EXISTĂ în site – nu folosi: accesorii-service, accesorii-service-xiaomi,
-# baterii-iphone-piese, camere-iphone-piese, ecrane-telefoane, baterii-telefoane
-CATEGORY_CODE_MAP = {
-    # PIESE (3 nivele)
-    'SCR': {'cat': 'Ecrane', 'top': 'Piese', 'prefix': 'SCR'},
-    'BAT': {'cat': 'Baterii', 'top': 'Piese', 'prefix': 'BAT'},
-    'CAM': {'cat': 'Camere', 'top': 'Piese', 'prefix': 'CAM'},
-    'CHG': {'cat': 'Mufe Încărcare', 'top': 'Piese', 'prefix': 'CHG'},
-    'FLX': {'cat': 'Flexuri', 'top': 'Piese', 'prefix': 'FLX'},
-    'SPK': {'cat': 'Difuzoare', 'top': 'Piese', 'prefix': 'SPK'},
-    'CAS': {'cat': 'Carcase', 'top': 'Piese', 'prefix': 'CAS'},
-    'STC': {'cat': 'Sticlă', 'top': 'Piese', 'prefix': 'STC'},
-    # UNELTE (2 nivele)
-    'TOOL': {'cat': 'Unelte', 'sub': 'Șurubelnițe', 'prefix': 'TOOL'},
-    'PENS': {'cat': 'Unelte', 'sub': 'Pensete', 'prefix': 'PENS'},
-    'SOLD': {'cat': 'Unelte', 'sub': 'Stații Lipit', 'prefix': 'SOLD'},
-    'SEP': {'cat': 'Unelte', 'sub': 'Separatoare Ecrane', 'prefix': 'SEP'},
-    'MICRO': {'cat': 'Unelte', 'sub': 'Microscoape', 'prefix': 'MICRO'},
-    'PROG': {'cat': 'Unelte', 'sub': 'Programatoare', 'prefix': 'PROG'},
-    'KIT': {'cat': 'Unelte', 'sub': 'Kituri Complete', 'prefix': 'KIT'},
-    'EQP': {'cat': 'Unelte', 'prefix': 'EQP'},
-    # ACCESORII (2 nivele)
-    'HUSA': {'cat': 'Accesorii', 'sub': 'Huse & Carcase', 'prefix': 'HUSA'},
-    'FOIL': {'cat': 'Accesorii', 'sub': 'Folii Protecție', 'prefix': 'FOIL'},
-    'CBL': {'cat': 'Accesorii', 'sub': 'Cabluri & Încărcătoare', 'prefix': 'CBL'},
-    'CNS': {'cat': 'Accesorii', 'sub': 'Adezivi & Consumabile', 'prefix': 'CNS'},
-}
-
-# PIESE: tip piesă (nivel 3) – ordinea contează (cele mai specifice primele)
-# SCR, BAT, CAM, CHG, FLX, SPK, CAS conform mapării finale
-PIESE_TIP_KEYWORDS = (
-    (['screen', 'display', 'lcd', 'oled', 'amoled', 'ecran', 'digitizer', 'touch'], 'Ecrane'),
-    (['battery', 'baterie', 'acumulator', 'mah'], 'Baterii'),
-    (['camera', 'cameră', 'megapixel', ' mp ', 'lens'], 'Camere'),
-    (['charging port', 'mufa', 'dock', 'connector', 'lightning', 'usb-c port', 'usb-c', 'conector încărcare'], 'Mufe Încărcare'),
-    (['flex', 'ribbon', 'cable flex', 'flex cable'], 'Flexuri'),
-    (['speaker', 'difuzor', 'earpiece', 'buzzer', 'ringer', 'casca'], 'Difuzoare'),
-    (['housing', 'frame', 'carcasa', 'back cover', 'back glass', 'chassis', 'carcase'], 'Carcase'),
-    (['sticla', 'glass', 'geam'], 'Sticlă'),
-    (['buton', 'button', 'power', 'volume', 'home'], 'Butoane'),
+# Model compatibil (extract_product_attributes) – ordinea contează: cele mai specifice primele
+MODEL_PATTERNS = (
+    ('iphone 17 pro max', 'iPhone 17 Pro Max'),
+    ('iphone 17 pro', 'iPhone 17 Pro'),
+    ('iphone 17 plus', 'iPhone 17 Plus'),
+    ('iphone 17 air', 'iPhone 17 Air'),
+    ('iphone 17', 'iPhone 17'),
+    ('iphone 16 pro max', 'iPhone 16 Pro Max'),
+    ('iphone 16 pro', 'iPhone 16 Pro'),
+    ('iphone 16 plus', 'iPhone 16 Plus'),
+    ('iphone 16', 'iPhone 16'),
+    ('iphone 15 pro max', 'iPhone 15 Pro Max'),
+    ('iphone 15 pro', 'iPhone 15 Pro'),
+    ('iphone 15 plus', 'iPhone 15 Plus'),
+    ('iphone 15', 'iPhone 15'),
+    ('iphone 14 pro max', 'iPhone 14 Pro Max'),
+    ('iphone 14 pro', 'iPhone 14 Pro'),
+    ('iphone 14 plus', 'iPhone 14 Plus'),
+    ('iphone 14', 'iPhone 14'),
+    ('iphone 13 pro max', 'iPhone 13 Pro Max'),
+    ('iphone 13 pro', 'iPhone 13 Pro'),
+    ('iphone 13 mini', 'iPhone 13 Mini'),
+    ('iphone 13', 'iPhone 13'),
+    ('iphone 12 pro max', 'iPhone 12 Pro Max'),
+    ('iphone 12 pro', 'iPhone 12 Pro'),
+    ('iphone 12 mini', 'iPhone 12 Mini'),
+    ('iphone 12', 'iPhone 12'),
+    ('iphone 11 pro max', 'iPhone 11 Pro Max'),
+    ('iphone 11 pro', 'iPhone 11 Pro'),
+    ('iphone 11', 'iPhone 11'),
+    ('iphone xs max', 'iPhone XS Max'),
+    ('iphone xs', 'iPhone XS'),
+    ('iphone xr', 'iPhone XR'),
+    ('iphone x', 'iPhone X'),
+    ('iphone se', 'iPhone SE'),
+    ('galaxy s24 ultra', 'Galaxy S24 Ultra'),
+    ('galaxy s24+', 'Galaxy S24+'),
+    ('galaxy s24', 'Galaxy S24'),
+    ('galaxy s23 ultra', 'Galaxy S23 Ultra'),
+    ('galaxy s23+', 'Galaxy S23+'),
+    ('galaxy s23', 'Galaxy S23'),
+    ('galaxy s22 ultra', 'Galaxy S22 Ultra'),
+    ('galaxy s22', 'Galaxy S22'),
+    ('galaxy s21 ultra', 'Galaxy S21 Ultra'),
+    ('galaxy s21', 'Galaxy S21'),
+    ('galaxy z fold 5', 'Galaxy Z Fold 5'),
+    ('galaxy z fold 4', 'Galaxy Z Fold 4'),
+    ('galaxy z flip 5', 'Galaxy Z Flip 5'),
+    ('galaxy z flip 4', 'Galaxy Z Flip 4'),
+    ('galaxy a54', 'Galaxy A54'),
+    ('galaxy a53', 'Galaxy A53'),
+    ('galaxy a52', 'Galaxy A52'),
+    ('galaxy a51', 'Galaxy A51'),
+    ('galaxy a34', 'Galaxy A34'),
+    ('galaxy a14', 'Galaxy A14'),
+    ('pixel 8 pro', 'Pixel 8 Pro'),
+    ('pixel 8', 'Pixel 8'),
+    ('pixel 7 pro', 'Pixel 7 Pro'),
+    ('pixel 7', 'Pixel 7'),
 )
 
-# UNELTE: subcategorii nivel 2 (Unelte > Subcategorie)
-UNELTE_SUBCAT_KEYWORDS = (
-    (['screwdriver', 'surubelnita', 'șurubelniță', 'screw driver'], 'Șurubelnițe'),
-    (['tweezer', 'penseta', 'pensetă', 'pry', 'spudger'], 'Pensete'),
-    (['soldering', 'station', 'lipit', 'hot air', 'rework', 'preheater', 'rework station'], 'Stații Lipit'),
-    (['separator', 'separatoare', 'lcd separator', 'screen separator'], 'Separatoare Ecrane'),
-    (['microscop', 'microscope', 'magnifier', 'lupa'], 'Microscoape'),
-    (['programmer', 'programator', 'box', 'dongle', 'jc', 'jcid'], 'Programatoare'),
-    (['kit', 'set', 'tool set', 'repair kit'], 'Kituri Complete'),
+# Brand piesă – primul brand din listă cu un cuvânt prezent în ' titlu descriere ' câștigă
+BRAND_PIESA_PATTERNS = (
+    ('Qianli', ['qianli', '(qianli)']),
+    ('iBridge', ['ibridge']),
+    ('Mijia', ['mijia']),
+    ('Xiaomi', ['xiaomi', '(xiaomi)']),
+    ('Ampsentrix', ['ampsentrix']),
+    ('JK', [' jk ', ' jk-', '(jk)', 'jk incell', 'jk soft']),
+    ('ZY', [' zy ', ' zy-', '(zy)', 'zy soft']),
+    ('GX', [' gx ', ' gx-', '(gx)', 'gx soft', 'gx hard']),
+    ('Hex', [' hex ', ' hex-', '(hex)', 'hex ']),
+    ('Genuine', ['genuine']),
+    ('RJ', [' rj ', ' rj-', '(rj)', 'rj incell']),
+    ('Foxconn', ['foxconn']),
+    ('BOE', [' boe ', '(boe)']),
+    ('Tianma', ['tianma']),
 )
 
-# Accesorii: subcategorii nivel 2 (Accesorii > Subcategorie)
-ACCESORII_SUBCAT_KEYWORDS = (
-    (['case', 'husa', 'husă', 'cover', 'bumper', 'carcasă', 'carcasa', 'housing', 'back cover'], 'Huse & Carcase'),
-    (['protector', 'folie', 'tempered', 'glass protector', 'screen protector', 'protector ecran', 'uv film', 'film protector', 'matt privacy', 'privacy film'], 'Folii Protecție'),
-    (['cable', 'cablu', 'charger', 'încărcător', 'incarcator', 'usb', 'lightning cable', 'adapter', 'adaptor'], 'Cabluri & Încărcătoare'),
-    (['adhesive', 'adeziv', 'glue', 'b7000', 't7000', 'oca', 'tape', 'sticker', 'banda', 'consumabil', 'loca'], 'Adezivi & Consumabile'),
+# Cuvinte testate de regulile de calitate / tehnologie / baterie / refresh rate din extract_product_attributes
+ATTRIBUTE_FLAG_KEYWORDS = (
+    'used oem pull', 'oem pull', 'service pack', 'original', 'genuine', 'genuine oem', 'aftermarket plus',
+    'premium', 'oem', 'refurbished', 'refurb', '(original)', 'aftermarket', 'apple', 'samsung', 'iphone',
+    'battery', 'baterie', 'acumulator', 'accumulator', 'replacement battery', 'baterii',
+    'display', 'screen', 'lcd', 'oled', 'ecran', 'assembly', 'soft', 'soft oled', ': soft)', ': soft ', ': soft',
+    ':soft', 'hard oled', ': hard)', ': hard ', ':hard', 'amoled', 'incell', 'in-cell', 'tft',
+    '120hz', '120 hz', '90hz', '90 hz',
 )
-# Prioritate Folii înainte de Unelte (UV film / film protector → Folii Protecție)
-ACCESORII_FOLII_KEYWORDS = ('protector', 'folie', 'tempered', 'glass protector', 'screen protector', 'uv film', 'film protector', 'matt privacy', 'privacy film')
+_MODEL_TABLE = RankedKeywords(MODEL_PATTERNS)
+_BRAND_PIESA_TABLE = RankedKeywords((kw, brand) for brand, keywords in BRAND_PIESA_PATTERNS for kw in keywords)
+# Un singur automat pentru toate tabelele de atribute → titlul + descrierea se parcurg o singură dată
+_ATTRIBUTE_MATCHER = KeywordMatcher(_MODEL_TABLE.keywords + _BRAND_PIESA_TABLE.keywords + list(ATTRIBUTE_FLAG_KEYWORDS))
+_EDGE_KEYWORDS = tuple(kw for kw in _ATTRIBUTE_MATCHER.keywords if kw[0] == ' ' or kw[-1] == ' ')
 
 # Fișiere badge: branduri/model/tehnologie custom + ultima confirmare (stil + date)
 BADGE_CUSTOM_BRANDS_FILE = 'data/badge_custom_brands.txt'
@@ -1372,17 +1445,39 @@ class ImageSelectionWindow:
 
 
 class ImportProduse:
+    # False în rularea headless (import_cli.py): fără popup-uri de selecție imagini / badge
+    interactive = True
+    # RunMetrics pentru rularea curentă (timpi per etapă); None în afara unui import
+    metrics = None
+    _http = None
+    _http_lock = threading.Lock()
+    _page_caches = None
+    _ollama_host = None
+
     def __init__(self, root):
         self.root = root
         self.root.title("Export Produse MobileSentrix → CSV (cu Imagini)")
         self.root.geometry("900x700")
         self.root.resizable(True, True)
         
+        # Log thread-safe: workerii scriu în coadă, GUI-ul golește coada pe timer
+        self._init_state(LogSink())
+        
+        # Setup GUI
+        self.setup_gui()
+        self.root.after(100, self._drain_log_queue)
+        
+    def _init_state(self, log_sink, log_prefix="import"):
+        """Starea comună GUI / headless (import_cli.HeadlessImporter), fără nimic din Tk."""
         # Variabile – .env din același folder cu scriptul (nu din cwd), ca pe Windows să fie găsit mereu
         self._script_dir = Path(__file__).resolve().parent
         self.env_file = self._script_dir / ".env"
         self.config = {}
         self.running = False
+        self.log_sink = log_sink
+        self._pending_progress = None
+        # Rezultate generate în lot (prefetch_ollama_fields), preluate o singură dată de ollama_generate_product_fields
+        self._ollama_prefetched = {}
         
         # Creare directoare (în folderul scriptului)
         (self._script_dir / "logs").mkdir(exist_ok=True)
@@ -1391,13 +1486,12 @@ class ImportProduse:
         
         # Load config
         self.load_config()
+        self.log_sink.set_ui_level(os.getenv('LOG_LEVEL', 'INFO'))
+        self._setup_log_files(prefix=log_prefix)
         
         # Load category rules (keyword → category path)
         self.category_rules = self.load_category_rules()
-        
-        # Setup GUI
-        self.setup_gui()
-        
+
     def setup_gui(self):
         """Creează interfața grafică"""
         
@@ -1492,6 +1586,7 @@ class ImportProduse:
         self.extract_description_var = tk.BooleanVar(value=True)
         self.badge_preview_var = tk.BooleanVar(value=False)
         self.image_selection_var = tk.BooleanVar(value=False)
+        self.resume_run_var = tk.BooleanVar(value=True)
         
         # Text roșu de avertizare – vizibil doar când bifa de badge e activată
         self._badge_warning_label = tk.Label(
@@ -1521,6 +1616,8 @@ class ImportProduse:
                        variable=self.image_selection_var).grid(row=5, column=0, sticky='w', padx=5, pady=2)
         ttk.Checkbutton(frame_options, text="Extrage descriere în română", 
                        variable=self.extract_description_var).grid(row=6, column=0, sticky='w', padx=5, pady=2)
+        ttk.Checkbutton(frame_options, text="Reia rularea întreruptă (jurnal în logs/ – sare peste produsele deja terminate)", 
+                       variable=self.resume_run_var).grid(row=7, column=0, sticky='w', padx=5, pady=2)
         
         # Progress
         frame_progress = ttk.Frame(parent)
@@ -1686,13 +1783,49 @@ class ImportProduse:
                   command=lambda: os.startfile(str(self._script_dir / "logs"))).pack(side='left', padx=5)
         
     def log(self, message, level='INFO'):
-        """Adaugă mesaj în log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] [{level}] {message}\n"
-        
-        self.log_text.insert(tk.END, log_entry)
-        self.log_text.see(tk.END)
-        self.root.update()
+        """Adaugă mesaj în log. Sigur din orice thread: doar pune mesajul în coadă;
+        tab-ul Log e actualizat în batch de _drain_log_queue (fără root.update() per linie)."""
+        self.log_sink.emit(message, level)
+
+    def set_progress(self, text):
+        """Textul de progres; sigur din orice thread: doar îl reține, _drain_log_queue îl afișează pe thread-ul GUI."""
+        self._pending_progress = text
+
+    def _drain_log_queue(self):
+        """Timer GUI: golește coada de log într-o singură inserare în log_text (+ ultimul text de progres)."""
+        records = []
+        try:
+            records = self.log_sink.drain()
+            if records and hasattr(self, 'log_text'):
+                self.log_text.insert(tk.END, ''.join(rec.format_line() + '\n' for rec in records))
+                self.log_text.see(tk.END)
+            progress, self._pending_progress = self._pending_progress, None
+            if progress is not None:
+                self.progress_var.set(progress)
+        except Exception as e:
+            print(f"✗ Eroare afișare log: {e}")
+        # Mai des când vin mesaje, mai rar când e liniște
+        self.root.after(50 if records else 200, self._drain_log_queue)
+
+    def _setup_log_files(self, prefix="import"):
+        """Fișier de log rotativ opțional în logs/<prefix>.log|.jsonl (LOG_FILE=text|jsonl|both în .env; gol = dezactivat)."""
+        mode = (os.getenv('LOG_FILE') or '').strip()
+        if not mode:
+            return
+        try:
+            max_mb = float(os.getenv('LOG_MAX_MB', '5') or 5)
+            backups = int(os.getenv('LOG_BACKUPS', '3') or 3)
+        except ValueError:
+            max_mb, backups = 5, 3
+        try:
+            paths = self.log_sink.add_file_sinks(
+                self._script_dir / "logs", mode=mode, max_mb=max_mb, backups=backups,
+                min_level=os.getenv('LOG_LEVEL', 'INFO'), prefix=prefix,
+            )
+            for path in paths:
+                print(f"✓ Log în fișier: {path}")
+        except Exception as e:
+            print(f"✗ Nu pot deschide fișierul de log: {e}")
     
     def cleanup_orphans(self):
         """Curăță produse orfane din WooCommerce (înainte de import)"""
@@ -1822,7 +1955,8 @@ class ImportProduse:
             'EXCHANGE_RATE': '4.97',
             'OLLAMA_URL': '',
             'OLLAMA_MODEL': 'llama3.2',
-            'OLLAMA_TIMEOUT': 300
+            'OLLAMA_TIMEOUT': 300,
+            'OLLAMA_PARALLEL': 1
         }
         
         # Încarcă din .env dacă există
@@ -1834,6 +1968,10 @@ class ImportProduse:
                     _ollama_timeout = int(_ollama_timeout)
                 except ValueError:
                     _ollama_timeout = 300
+                try:
+                    _ollama_parallel = int(os.getenv('OLLAMA_PARALLEL', '1').strip() or 1)
+                except ValueError:
+                    _ollama_parallel = 1
                 self.config = {
                     'WOOCOMMERCE_URL': os.getenv('WOOCOMMERCE_URL', 'https://webgsm.ro'),
                     'WOOCOMMERCE_CONSUMER_KEY': os.getenv('WOOCOMMERCE_CONSUMER_KEY', ''),
@@ -1841,7 +1979,8 @@ class ImportProduse:
                     'EXCHANGE_RATE': os.getenv('EXCHANGE_RATE', '4.97'),
                     'OLLAMA_URL': os.getenv('OLLAMA_URL', '').strip(),
                     'OLLAMA_MODEL': os.getenv('OLLAMA_MODEL', 'llama3.2').strip() or 'llama3.2',
-                    'OLLAMA_TIMEOUT': max(120, min(_ollama_timeout, 600))
+                    'OLLAMA_TIMEOUT': max(120, min(_ollama_timeout, 600)),
+                    'OLLAMA_PARALLEL': max(1, min(_ollama_parallel, 8))
                 }
                 print(f"✓ Config încărcat din .env: {self.config}")
             except Exception as e:
@@ -1975,7 +2114,7 @@ class ImportProduse:
         """
         text_lower = (page_text or '').lower()
         if hasattr(soup, 'get_text'):
-            text_lower = (soup.get_text() + ' ' + text_lower).lower()
+            text_lower = (soup_text(soup) + ' ' + text_lower).lower()
 
         preorder_indicators = [
             'pre-order', 'preorder', 'pre order', 'coming soon',
@@ -2139,93 +2278,29 @@ class ImportProduse:
         Returnează: pa_model, pa_calitate, pa_brand-piesa, pa_tehnologie
         """
         text = f"{product_name} {description}".lower()
+        # O singură trecere peste titlu + descriere pentru toate tabelele de mai jos (model, calitate, brand, tehnologie)
+        found = _ATTRIBUTE_MATCHER.found(text)
+        # Brand piesă se caută în ' text ': cuvintele cu spațiu la margine (' jk ', 'hex ') pot atinge și capetele
+        padded_text = f' {text} '
+        padded_found = found | {kw for kw in _EDGE_KEYWORDS if padded_text.startswith(kw) or padded_text.endswith(kw)}
 
-        # MODEL COMPATIBIL (ordinea contează - cele mai specifice primele)
-        model = ''
-        model_patterns = [
-            ('iphone 17 pro max', 'iPhone 17 Pro Max'),
-            ('iphone 17 pro', 'iPhone 17 Pro'),
-            ('iphone 17 plus', 'iPhone 17 Plus'),
-            ('iphone 17 air', 'iPhone 17 Air'),
-            ('iphone 17', 'iPhone 17'),
-            ('iphone 16 pro max', 'iPhone 16 Pro Max'),
-            ('iphone 16 pro', 'iPhone 16 Pro'),
-            ('iphone 16 plus', 'iPhone 16 Plus'),
-            ('iphone 16', 'iPhone 16'),
-            ('iphone 15 pro max', 'iPhone 15 Pro Max'),
-            ('iphone 15 pro', 'iPhone 15 Pro'),
-            ('iphone 15 plus', 'iPhone 15 Plus'),
-            ('iphone 15', 'iPhone 15'),
-            ('iphone 14 pro max', 'iPhone 14 Pro Max'),
-            ('iphone 14 pro', 'iPhone 14 Pro'),
-            ('iphone 14 plus', 'iPhone 14 Plus'),
-            ('iphone 14', 'iPhone 14'),
-            ('iphone 13 pro max', 'iPhone 13 Pro Max'),
-            ('iphone 13 pro', 'iPhone 13 Pro'),
-            ('iphone 13 mini', 'iPhone 13 Mini'),
-            ('iphone 13', 'iPhone 13'),
-            ('iphone 12 pro max', 'iPhone 12 Pro Max'),
-            ('iphone 12 pro', 'iPhone 12 Pro'),
-            ('iphone 12 mini', 'iPhone 12 Mini'),
-            ('iphone 12', 'iPhone 12'),
-            ('iphone 11 pro max', 'iPhone 11 Pro Max'),
-            ('iphone 11 pro', 'iPhone 11 Pro'),
-            ('iphone 11', 'iPhone 11'),
-            ('iphone xs max', 'iPhone XS Max'),
-            ('iphone xs', 'iPhone XS'),
-            ('iphone xr', 'iPhone XR'),
-            ('iphone x', 'iPhone X'),
-            ('iphone se', 'iPhone SE'),
-            ('galaxy s24 ultra', 'Galaxy S24 Ultra'),
-            ('galaxy s24+', 'Galaxy S24+'),
-            ('galaxy s24', 'Galaxy S24'),
-            ('galaxy s23 ultra', 'Galaxy S23 Ultra'),
-            ('galaxy s23+', 'Galaxy S23+'),
-            ('galaxy s23', 'Galaxy S23'),
-            ('galaxy s22 ultra', 'Galaxy S22 Ultra'),
-            ('galaxy s22', 'Galaxy S22'),
-            ('galaxy s21 ultra', 'Galaxy S21 Ultra'),
-            ('galaxy s21', 'Galaxy S21'),
-            ('galaxy z fold 5', 'Galaxy Z Fold 5'),
-            ('galaxy z fold 4', 'Galaxy Z Fold 4'),
-            ('galaxy z flip 5', 'Galaxy Z Flip 5'),
-            ('galaxy z flip 4', 'Galaxy Z Flip 4'),
-            ('galaxy a54', 'Galaxy A54'),
-            ('galaxy a53', 'Galaxy A53'),
-            ('galaxy a52', 'Galaxy A52'),
-            ('galaxy a51', 'Galaxy A51'),
-            ('galaxy a34', 'Galaxy A34'),
-            ('galaxy a14', 'Galaxy A14'),
-            ('pixel 8 pro', 'Pixel 8 Pro'),
-            ('pixel 8', 'Pixel 8'),
-            ('pixel 7 pro', 'Pixel 7 Pro'),
-            ('pixel 7', 'Pixel 7'),
-        ]
-        for pattern, value in model_patterns:
-            if pattern in text:
-                model = value
-                break
+        # MODEL COMPATIBIL (MODEL_PATTERNS – ordinea contează, cele mai specifice primele)
+        model = _MODEL_TABLE.best(found, '')
 
         # Fallback: extrage model din URL slug (ex: .../iphone-17-aftermarket-plus-soft...)
         if not model and product_url:
             slug_lower = product_url.rstrip('/').split('/')[-1].replace('-', ' ')
-            for pattern, value in model_patterns:
-                if pattern in slug_lower:
-                    model = value
-                    break
+            model = _MODEL_TABLE.first_in(slug_lower, '')
 
         # Fallback obligatoriu iPhone: dacă titlul conține "iPhone" + cifre/termeni, extrage modelul
-        if not model and 'iphone' in text:
+        if not model and 'iphone' in found:
             iphone_match = re.search(
                 r'iphone\s+(\d+\s*(?:pro\s*max|pro|plus|mini|air)?|\d+)',
                 f"{product_name} {description}", re.I
             )
             if iphone_match:
                 model_raw = iphone_match.group(0).strip()  # "iPhone 17" sau "iPhone 14 Pro Max"
-                for pattern, value in model_patterns:
-                    if pattern in model_raw.lower():
-                        model = value
-                        break
+                model = _MODEL_TABLE.first_in(model_raw.lower(), '')
                 if not model:
                     model = model_raw.title()
 
@@ -2235,61 +2310,39 @@ class ImportProduse:
 
         # CALITATE (Logică WebGSM: Genuine OEM -> Service Pack, Used OEM Pull -> Original din Dezmembrări)
         calitate = 'Aftermarket'
-        if 'used oem pull' in text or 'oem pull' in text:
+        if 'used oem pull' in found or 'oem pull' in found:
             calitate = 'Original din Dezmembrări'
-        elif 'service pack' in text or ('original' in text and 'genuine' in text):
+        elif 'service pack' in found or ('original' in found and 'genuine' in found):
             calitate = 'Service Pack'
-        elif 'genuine oem' in text or 'genuine' in text:
+        elif 'genuine oem' in found or 'genuine' in found:
             calitate = 'Service Pack'
-        elif 'aftermarket plus' in text:
+        elif 'aftermarket plus' in found:
             calitate = 'Aftermarket Plus'
-        elif 'premium' in text or ('oem' in text and 'premium' in text):
+        elif 'premium' in found or ('oem' in found and 'premium' in found):
             calitate = 'Premium OEM'
-        elif 'oem' in text:
+        elif 'oem' in found:
             calitate = 'Premium OEM'
-        elif 'refurbished' in text or 'refurb' in text:
+        elif 'refurbished' in found or 'refurb' in found:
             calitate = 'Refurbished'
-        elif '(original)' in text:
+        elif '(original)' in found:
             calitate = 'Original'
-        elif re.search(r'\boriginal\b', text) and 'aftermarket' not in text and 'oem pull' not in text and 'genuine' not in text and 'service pack' not in text:
+        elif re.search(r'\boriginal\b', text) and 'aftermarket' not in found and 'oem pull' not in found and 'genuine' not in found and 'service pack' not in found:
             calitate = 'Original'
 
         # Doar la MPS Mobile: bateriile au adesea „OEM”/„original” în titlu/descriere din greșeală → forțăm Aftermarket
         supp = (supplier_name or '').lower().strip()
-        is_battery = any(x in text for x in ['battery', 'baterie', 'acumulator', 'accumulator', 'replacement battery', 'baterii'])
+        is_battery = any(x in found for x in ['battery', 'baterie', 'acumulator', 'accumulator', 'replacement battery', 'baterii'])
         if supp == 'mpsmobile' and is_battery and calitate in ('Premium OEM', 'Original'):
             calitate = 'Aftermarket'
 
         # BRAND PIESA - extragere din titlul original (EN): Ampsentrix, JK, ZY, GX, Hex, Genuine
-        brand_piesa = ''
-        brand_patterns = [
-            ('Qianli', ['qianli', '(qianli)']),
-            ('iBridge', ['ibridge']),
-            ('Mijia', ['mijia']),
-            ('Xiaomi', ['xiaomi', '(xiaomi)']),
-            ('Ampsentrix', ['ampsentrix']),
-            ('JK', [' jk ', ' jk-', '(jk)', 'jk incell', 'jk soft']),
-            ('ZY', [' zy ', ' zy-', '(zy)', 'zy soft']),
-            ('GX', [' gx ', ' gx-', '(gx)', 'gx soft', 'gx hard']),
-            ('Hex', [' hex ', ' hex-', '(hex)', 'hex ']),
-            ('Genuine', ['genuine']),
-            ('RJ', [' rj ', ' rj-', '(rj)', 'rj incell']),
-            ('Foxconn', ['foxconn']),
-            ('BOE', [' boe ', '(boe)']),
-            ('Tianma', ['tianma']),
-        ]
-        padded_name = f' {product_name} '.lower()
-        padded_text = f' {product_name} {description} '.lower()
-        for brand, keywords in brand_patterns:
-            if any(kw in padded_text for kw in keywords):
-                brand_piesa = brand
-                break
+        brand_piesa = _BRAND_PIESA_TABLE.best(padded_found, '')
         if not brand_piesa:
-            if 'apple' in text and ('original' in text or 'genuine' in text or 'service pack' in text):
+            if 'apple' in found and ('original' in found or 'genuine' in found or 'service pack' in found):
                 brand_piesa = 'Apple Original'
-            elif 'samsung' in text and ('original' in text or 'genuine' in text or 'service pack' in text):
+            elif 'samsung' in found and ('original' in found or 'genuine' in found or 'service pack' in found):
                 brand_piesa = 'Samsung Original'
-            elif 'oem' in text or calitate in ('Premium OEM', 'Service Pack'):
+            elif 'oem' in found or calitate in ('Premium OEM', 'Service Pack'):
                 brand_piesa = 'Premium OEM'
         # Doar la MPS Mobile: la baterii nu afișa Premium OEM / Apple Original / Samsung Original
         if supp == 'mpsmobile' and is_battery and brand_piesa in ('Premium OEM', 'Apple Original', 'Samsung Original'):
@@ -2298,37 +2351,37 @@ class ImportProduse:
 
         # TEHNOLOGIE - din titlul original (EN): OLED, Soft OLED, Incell, TFT
         tehnologie = ''
-        if any(x in text for x in ['display', 'screen', 'lcd', 'oled', 'ecran', 'assembly']):
-            if 'soft' in text and 'oled' in text:
+        if any(x in found for x in ['display', 'screen', 'lcd', 'oled', 'ecran', 'assembly']):
+            if 'soft' in found and 'oled' in found:
                 tehnologie = 'Soft OLED'
-            elif 'soft oled' in text:
+            elif 'soft oled' in found:
                 tehnologie = 'Soft OLED'
-            elif ': soft)' in text or ': soft ' in text or ': soft' in text or ':soft' in text:
+            elif ': soft)' in found or ': soft ' in found or ': soft' in found or ':soft' in found:
                 # Pattern MobileSentrix: "(Aftermarket Plus: Soft)"
                 tehnologie = 'Soft OLED'
-            elif 'hard oled' in text:
+            elif 'hard oled' in found:
                 tehnologie = 'Hard OLED'
-            elif ': hard)' in text or ': hard ' in text or ':hard' in text:
+            elif ': hard)' in found or ': hard ' in found or ':hard' in found:
                 # Pattern MobileSentrix: "(Aftermarket Plus: Hard)"
                 tehnologie = 'Hard OLED'
-            elif 'amoled' in text:
+            elif 'amoled' in found:
                 tehnologie = 'AMOLED'
-            elif 'oled' in text and ('original' in text or 'genuine' in text):
+            elif 'oled' in found and ('original' in found or 'genuine' in found):
                 tehnologie = 'OLED Original'
-            elif 'oled' in text:
+            elif 'oled' in found:
                 tehnologie = 'OLED'
-            elif 'incell' in text or 'in-cell' in text:
+            elif 'incell' in found or 'in-cell' in found:
                 tehnologie = 'Incell'
-            elif 'tft' in text:
+            elif 'tft' in found:
                 tehnologie = 'TFT'
-            elif 'lcd' in text:
+            elif 'lcd' in found:
                 tehnologie = 'LCD'
 
         # 🎯 Detectare 120Hz / 90Hz din titlu
         self._detected_refresh_rate = ''
-        if '120hz' in text or '120 hz' in text:
+        if '120hz' in found or '120 hz' in found:
             self._detected_refresh_rate = '120Hz'
-        elif '90hz' in text or '90 hz' in text:
+        elif '90hz' in found or '90 hz' in found:
             self._detected_refresh_rate = '90Hz'
 
         return {
@@ -2362,175 +2415,9 @@ class ImportProduse:
         Determină slug-ul categoriei WooCommerce conform arborelui WebGSM.
         Returnează doar slug-uri valide: ecrane-iphone, baterii-samsung, mufe-incarcare-iphone,
         surubelnite, folii-protectie, etc. NU folosește: accesorii-service, ecrane-telefoane, baterii-iphone-piese.
+        Regulile (brand, piese, unelte, accesorii, dispozitive) sunt în src/core/categories.py (WEBGSM_SLUG_RULES).
         """
-        text = ((product_name or '') + ' ' + (description or '') + ' ' + (product_type or '')).lower()
-
-        # === DETECTARE BRAND ===
-        brand = None
-        if any(x in text for x in ['iphone', 'apple', 'ios']):
-            brand = 'iphone'
-        elif any(x in text for x in ['samsung', 'galaxy']):
-            brand = 'samsung'
-        elif any(x in text for x in ['huawei', 'honor', 'mate ', 'p30', 'p40', 'p50', 'p60']):
-            brand = 'huawei'
-        elif any(x in text for x in ['xiaomi', 'redmi', 'poco', 'mi ']):
-            brand = 'xiaomi'
-        elif any(x in text for x in ['pixel', 'google']):
-            brand = 'google'
-        elif any(x in text for x in ['oneplus', 'one plus']):
-            brand = 'oneplus'
-
-        # === PIESE: Ecrane / Display ===
-        if any(x in text for x in ['ecran', 'display', 'lcd', 'oled', 'screen', 'touchscreen']):
-            if brand == 'iphone':
-                return 'ecrane-iphone'
-            if brand == 'samsung':
-                return 'ecrane-samsung'
-            if brand == 'huawei':
-                return 'ecrane-huawei'
-            if brand == 'xiaomi':
-                return 'ecrane-xiaomi'
-            return 'piese'
-
-        # === PIESE: Baterii ===
-        if any(x in text for x in ['baterie', 'battery', 'acumulator', 'accumulator']):
-            if brand == 'iphone':
-                return 'baterii-iphone'
-            if brand == 'samsung':
-                return 'baterii-samsung'
-            if brand == 'huawei':
-                return 'baterii-huawei'
-            if brand == 'xiaomi':
-                return 'baterii-xiaomi'
-            return 'piese'
-
-        # === PIESE: Camere ===
-        if any(x in text for x in ['camera', 'cameră', 'foto', 'lens', 'lentila']):
-            if brand == 'iphone':
-                return 'camere-iphone'
-            if brand == 'samsung':
-                return 'camere-samsung'
-            if brand == 'huawei':
-                return 'camere-huawei'
-            if brand == 'xiaomi':
-                return 'camere-xiaomi'
-            return 'piese'
-
-        # === PIESE: Mufe încărcare ===
-        if any(x in text for x in ['mufă', 'mufa', 'charging port', 'port încărcare', 'usb-c', 'lightning connector', 'dock connector']):
-            if brand == 'iphone':
-                return 'mufe-incarcare-iphone'
-            if brand == 'samsung':
-                return 'mufe-incarcare-samsung'
-            return 'piese'
-
-        # === PIESE: Flexuri ===
-        if any(x in text for x in ['flex', 'cablu flex', 'ribbon', 'flat cable']):
-            if brand == 'iphone':
-                return 'flexuri-iphone'
-            if brand == 'samsung':
-                return 'flexuri-samsung'
-            return 'piese'
-
-        # === PIESE: Carcase ===
-        if any(x in text for x in ['carcasă', 'carcasa', 'back cover', 'housing', 'back glass', 'capac spate']):
-            if brand == 'iphone':
-                return 'carcase-iphone'
-            return 'piese'
-
-        # === PIESE: Difuzoare ===
-        if any(x in text for x in ['difuzor', 'speaker', 'buzzer', 'earpiece', 'loud speaker']):
-            if brand == 'iphone':
-                return 'difuzoare-iphone'
-            return 'piese'
-
-        # === UNELTE ===
-        if any(x in text for x in ['șurubelniță', 'surubelnita', 'screwdriver', 'torx', 'pentalobe', 'phillips']):
-            return 'surubelnite'
-        if any(x in text for x in ['pensetă', 'penseta', 'tweezer', 'pincetă']):
-            return 'pensete'
-        if any(x in text for x in ['stație lipit', 'statie lipit', 'soldering station', 'hot air', 'pistol aer cald']):
-            return 'statii-lipit'
-        if any(x in text for x in ['separator', 'lcd separator', 'screen separator']):
-            return 'separatoare-ecrane'
-        if any(x in text for x in ['microscop', 'microscope', 'lupa', 'magnifier']):
-            return 'microscoape'
-        if any(x in text for x in ['programator', 'programmer', 'box', 'jc', 'qianli', 'i2c']):
-            return 'programatoare'
-        if any(x in text for x in ['kit', 'set complet', 'tool kit']):
-            return 'kituri-complete'
-
-        # === ACCESORII ===
-        if any(x in text for x in ['husă', 'husa', 'case', 'cover', 'protector']):
-            return 'huse-carcase'
-        if any(x in text for x in ['folie', 'screen protector', 'tempered glass', 'sticlă securizată']):
-            return 'folii-protectie'
-        if any(x in text for x in ['cablu', 'cable', 'încărcător', 'charger', 'adaptor', 'adapter']):
-            return 'cabluri-incarcatoare'
-        if any(x in text for x in ['adeziv', 'adhesive', 'b7000', 't7000', 'b8000', 'banda dublu adezivă', 'sticker']):
-            return 'adezivi-consumabile'
-
-        # === DISPOZITIVE ===
-        if any(x in text for x in ['telefon second', 'second hand', 'folosit', 'used phone']):
-            return 'telefoane-folosite'
-        if any(x in text for x in ['refurbished', 'recondiționat', 'renewed']):
-            return 'telefoane-refurbished'
-        if any(x in text for x in ['tabletă', 'tablet', 'ipad']):
-            return 'tablete'
-        if any(x in text for x in ['smartwatch', 'ceas smart', 'apple watch', 'galaxy watch']):
-            return 'smartwatch'
-
-        # === DEFAULT: brand cunoscut → piese-{brand}, altfel piese ===
-        if brand == 'iphone':
-            return 'piese-iphone'
-        if brand == 'samsung':
-            return 'piese-samsung'
-        if brand == 'huawei':
-            return 'piese-huawei'
-        if brand == 'xiaomi':
-            return 'piese-xiaomi'
-        return 'piese'
-
-    def _detect_brand_for_category(self, name_lower):
-        """Inferă brandul pentru ramura Piese (Piese > Piese {Brand} > ...). Prioritate: iPhone/Apple, Samsung/Galaxy, Huawei/Honor, Xiaomi/Redmi/Poco, OnePlus."""
-        if 'iphone' in name_lower or 'apple' in name_lower:
-            return 'iPhone'
-        if 'samsung' in name_lower or 'galaxy' in name_lower:
-            return 'Samsung'
-        if 'huawei' in name_lower or 'honor' in name_lower:
-            return 'Huawei'
-        if 'xiaomi' in name_lower or 'redmi' in name_lower or 'poco' in name_lower:
-            return 'Xiaomi'
-        if 'oneplus' in name_lower:
-            return 'OnePlus'
-        if 'google' in name_lower or 'pixel' in name_lower:
-            return 'Google'
-        if 'motorola' in name_lower or 'moto ' in name_lower:
-            return 'Motorola'
-        if 'ipad' in name_lower:
-            return 'iPad'
-        return None
-
-    def _detect_piese_tip(self, combined):
-        """Detectează tipul piesei (nivel 3 sub Piese) din text."""
-        for keywords, tip_name in PIESE_TIP_KEYWORDS:
-            if any(kw in combined for kw in keywords):
-                return tip_name
-        return 'Alte Piese'
-
-    def _detect_unelte_sub(self, combined):
-        """Detectează subcategoria Unelte (Unelte > Subcategorie)."""
-        for keywords, sub_name in UNELTE_SUBCAT_KEYWORDS:
-            if any(kw in combined for kw in keywords):
-                return sub_name
-        return 'Șurubelnițe'  # default
-
-    def _detect_accesorii_sub(self, combined):
-        """Detectează subcategoria Accesorii (Accesorii > Subcategorie)."""
-        for keywords, sub_name in ACCESORII_SUBCAT_KEYWORDS:
-            if any(kw in combined for kw in keywords):
-                return sub_name
-        return 'Adezivi & Consumabile'  # default
+        return category_engine().webgsm_slug(product_name, product_type, description)
 
     def get_woo_category(self, product_name, product_type='', manual_code=None, description='', url_slug='', tags=''):
         """
@@ -2540,65 +2427,13 @@ class ImportProduse:
         - ACCESORII (2 nivele): Accesorii > Subcategorie
         - Nimic detectat: Uncategorized + log pentru review.
         """
-        name_lower = (product_name or '').lower()
-        type_lower = (product_type or '').lower()
-        slug_lower = (url_slug or '').replace('-', ' ').lower()
-        desc_snippet = (description or '')[:500].lower()
-        tags_lower = (tags or '').lower()
-        # Prioritate: titlu > slug > descriere > taguri (toate în combined pentru matching)
-        combined = ' '.join(filter(None, [name_lower, type_lower, slug_lower, desc_snippet, tags_lower]))
-
-        # —— Prioritate: cod manual din sku_list (link | COD) ——
-        if manual_code and isinstance(manual_code, str):
-            manual_code = manual_code.strip().upper()
-            if manual_code in CATEGORY_CODE_MAP:
-                m = CATEGORY_CODE_MAP[manual_code]
-                top = m.get('top') or m.get('cat')
-                if top == 'Piese':
-                    cat_name = m.get('cat', '')
-                    brand = self._detect_brand_for_category(name_lower) or self._detect_brand_for_category(combined) or 'iPhone'
-                    return f"Piese > Piese {brand} > {cat_name}"
-                if m.get('cat') == 'Unelte':
-                    sub = m.get('sub') or self._detect_unelte_sub(combined)
-                    return f"Unelte > {sub}"
-                if m.get('cat') == 'Accesorii':
-                    return f"Accesorii > {m.get('sub', 'Adezivi & Consumabile')}"
-                if m.get('sub'):
-                    return f"Accesorii > {m.get('sub')}"
-                return f"Unelte > {self._detect_unelte_sub(combined)}"
-
-        # —— Auto: PIESE (3 nivele) – detectare BRAND + TIP ——
-        brand = self._detect_brand_for_category(name_lower) or self._detect_brand_for_category(combined)
-        if brand:
-            tip = self._detect_piese_tip(combined)
-            return f"Piese > Piese {brand} > {tip}"
-
-        # —— Auto: ACCESORII Folii ÎNAINTE de Unelte ——
-        if any(kw in combined for kw in ACCESORII_FOLII_KEYWORDS):
-            return "Accesorii > Folii Protecție"
-
-        # —— Auto: UNELTE (2 nivele) ——
-        for keywords, _ in UNELTE_SUBCAT_KEYWORDS:
-            if any(kw in combined for kw in keywords):
-                sub = self._detect_unelte_sub(combined)
-                return f"Unelte > {sub}"
-        if any(x in combined for x in ['tool', 'unealtă', 'unealta', 'statie', 'station', 'preheater', 'separator', 'microscop', 'tester', 'diagnostic', 'programmer', 'programator', 'kit', 'repair kit']):
-            sub = self._detect_unelte_sub(combined)
-            return f"Unelte > {sub}"
-
-        # —— Auto: ACCESORII (2 nivele) – doar dacă avem keyword accesorii ——
-        sub = self._detect_accesorii_sub(combined)
-        if sub != 'Adezivi & Consumabile':
-            return f"Accesorii > {sub}"
-        if any(kw in combined for kw in ['case', 'husa', 'cable', 'charger', 'adeziv', 'tape', 'b7000', 'folie', 'protector', 'cover', 'bumper']):
-            return f"Accesorii > {sub}"
-
-        # —— Nimic detectat: Uncategorized + log ——
-        try:
-            self.log(f"   ⚠ Categorie necunoscută pentru: {product_name[:50]}... → Uncategorized (review manual)", "WARNING")
-        except Exception:
-            pass
-        return "Uncategorized"
+        category = category_engine().woo_path(product_name, product_type, manual_code, description, url_slug, tags)
+        if category == UNCATEGORIZED:
+            try:
+                self.log(f"   ⚠ Categorie necunoscută pentru: {product_name[:50]}... → Uncategorized (review manual)", "WARNING")
+            except Exception:
+                pass
+        return category
 
     def extract_phone_model(self, product_name):
         """
@@ -2844,6 +2679,10 @@ class ImportProduse:
             r = requests.get(f"{base_url}/api/tags", timeout=10)
             if r.status_code == 200:
                 self.log(f"✓ Ollama vizibil la {base_url}", "SUCCESS")
+                if self.config.get('OLLAMA_URL', '').strip():
+                    # Încarcă modelul acum (în fundal) ca primul import să nu aștepte după el; timpul apare în Log
+                    self.log(f"🤖 Pre-încarc modelul {self.config.get('OLLAMA_MODEL', 'llama3.2')}...", "INFO")
+                    self.warm_up_ollama()
                 messagebox.showinfo("Ollama", f"OK – Ollama răspunde la:\n{base_url}\n\nScraperul din VM poate folosi Ollama.")
             else:
                 self.log(f"✗ Ollama a răspuns cu status {r.status_code}", "WARNING")
@@ -2890,7 +2729,7 @@ class ImportProduse:
         self.progress_bar.stop()
         self.btn_start.config(state='normal')
         self.btn_stop.config(state='disabled')
-        self.progress_var.set("Import oprit")
+        self.set_progress("Import oprit")
 
     def start_images_only_from_sku(self):
         """
@@ -3247,7 +3086,7 @@ class ImportProduse:
 
                     try:
                         self.log(f"      🌐 Descarc imagine [{img_idx}]: {url[:80]}...", "INFO")
-                        resp = requests.get(url, timeout=30)
+                        resp = self._http_session().get(url, timeout=30)
                         if resp.status_code != 200:
                             self.log(f"         ✗ HTTP {resp.status_code} la download", "WARNING")
                             continue
@@ -3362,7 +3201,7 @@ class ImportProduse:
         supplier = (supplier_name or product_data.get('furnizor_activ') or '').lower()
         # Pentru mmsmobile și mpsmobile afișăm mereu popup când sunt mai multe imagini; altfel doar dacă e bifat
         show_popup = supplier in ('mmsmobile', 'mpsmobile') or self.image_selection_var.get()
-        if not show_popup:
+        if not show_popup or not self.interactive:
             return images_list
 
         product_name = product_data.get('name', 'Produs necunoscut')
@@ -3501,11 +3340,6 @@ class ImportProduse:
     def run_import(self):
         """Execută exportul în CSV format WebGSM cu upload imagini pe WordPress"""
         try:
-            self.log("=" * 70, "INFO")
-            self.log(f"🚀 START PROCESARE PRODUSE (Mod: CSV WebGSM + Upload Imagini)", "INFO")
-            self.log(f"🔧 Build imagini: {SCRAPER_IMAGE_BUILD} (așteptat ms_XXXXX în nume fișiere)", "INFO")
-            self.log("=" * 70, "INFO")
-
             # Furnizor selectat și config
             supplier_display = self.supplier_var.get() if hasattr(self, 'supplier_var') else "MobileSentrix.eu"
             supplier_name = "mobilesentrix"
@@ -3513,52 +3347,137 @@ class ImportProduse:
                 supp = next((s for s in self._suppliers_list if s["display_name"] == supplier_display), None)
                 if supp:
                     supplier_name = supp["name"]
-            supplier_config = ScraperFactory.load_supplier_config(supplier_name) if ScraperFactory else None
-            if not supplier_config:
-                supplier_config = {}
-            scraper = ScraperFactory.get_scraper(supplier_name, self) if ScraperFactory else None
-            self.log(f"📦 Furnizor: {supplier_display} ({supplier_name})", "INFO")
-            if supplier_config.get("skip_images"):
-                self.log("   ⚠️ Imagini oprite pentru acest furnizor (watermark)", "INFO")
-
-            # Citește SKU-uri (listă dict: url, code opțional din "link | COD")
             sku_file_path = getattr(self, '_resolved_sku_file', None) or self.sku_file_var.get()
-            sku_items = self.read_sku_file(sku_file_path)
-            self.log(f"📋 Găsite {len(sku_items)} intrări pentru procesare", "INFO")
 
-            success_count = 0
-            error_count = 0
-            sku_counter = 0  # Counter global pentru SKU-uri WebGSM
-            products_data = []  # Lista pentru CSV
+            summary = self.run_import_job(supplier_name, sku_file_path, supplier_display)
 
-            for idx, item in enumerate(sku_items, 1):
-                if not self.running:
-                    break
+            csv_info = f"\nFișier CSV: {summary['csv_filename']}" if summary['csv_filename'] else ""
+            messagebox.showinfo("Finalizat",
+                f"Procesare WebGSM finalizată!\n\nProduse procesate: {summary['success']}\nErori: {summary['errors']}{csv_info}\nFolderul imagini: images/")
 
-                url_or_sku = item['url']
+            # Deschide folderul data cu CSV-ul
+            if summary['csv_path']:
+                os.startfile(str(self._script_dir / "data"))
+
+        except Exception as e:
+            self.log(f"✗ Eroare critică: {e}", "ERROR")
+            messagebox.showerror("Eroare", f"Eroare critică:\n{e}")
+
+        finally:
+            self.progress_bar.stop()
+            self.btn_start.config(state='normal')
+            self.btn_stop.config(state='disabled')
+            self.set_progress("Export finalizat")
+            self.running = False
+
+    def run_import_job(self, supplier_name, sku_file_path, supplier_display=None, csv_filename=None):
+        """Rulează importul complet (scrape → enrich → upload → CSV) pentru un furnizor și o listă SKU.
+        Nu atinge widget-uri Tk direct – folosit de GUI (run_import) și de rularea headless (import_cli.py).
+        csv_filename: nume fișier în data/ (implicit export_webgsm_<timestamp>.csv).
+        Returnează dict sumar: success, errors, export_errors, total, csv_path, csv_filename, report_path.
+        """
+        self.log("=" * 70, "INFO")
+        self.log(f"🚀 START PROCESARE PRODUSE (Mod: CSV WebGSM + Upload Imagini)", "INFO")
+        self.log(f"🔧 Build imagini: {SCRAPER_IMAGE_BUILD} (așteptat ms_XXXXX în nume fișiere)", "INFO")
+        self.log("=" * 70, "INFO")
+        # Timpi per etapă (scrape, Ollama, traducere, imagini, upload, rând CSV) → raport lângă CSV
+        self.metrics = RunMetrics()
+        self._translations().reset_stats()
+        if self._ollama_fields_cache() is not None:
+            self._ollama_fields_cache().reset_stats()
+        with self._http_lock:
+            self._ollama_prefetched.clear()  # rezultate de lot rămase de la o rulare anterioară
+
+        supplier_config = ScraperFactory.load_supplier_config(supplier_name) if ScraperFactory else None
+        if not supplier_config:
+            supplier_config = {}
+        scraper = ScraperFactory.get_scraper(supplier_name, self) if ScraperFactory else None
+        self.log(f"📦 Furnizor: {supplier_display or supplier_config.get('display_name', supplier_name)} ({supplier_name})", "INFO")
+        if supplier_config.get("skip_images"):
+            self.log("   ⚠️ Imagini oprite pentru acest furnizor (watermark)", "INFO")
+
+        # Citește SKU-uri (listă dict: url, code opțional din "link | COD")
+        sku_items = self.read_sku_file(sku_file_path)
+        self.log(f"📋 Găsite {len(sku_items)} intrări pentru procesare", "INFO")
+
+        success_count = 0
+        error_count = 0
+        sku_counter = 0  # Counter global pentru SKU-uri WebGSM
+
+        # Workeri paralel pentru scraping (config furnizor: "scrape_workers", implicit 1 = secvențial)
+        try:
+            scrape_workers = max(1, int(supplier_config.get("scrape_workers", 1) or 1))
+        except (TypeError, ValueError):
+            scrape_workers = 1
+        if scrape_workers > 1:
+            self.log(f"⚡ Scraping paralel: {scrape_workers} workeri (ordinea din listă se păstrează)", "INFO")
+        total_items = len(sku_items)
+
+        # Jurnal checkpoint: furnizor + linie din listă → etape terminate (scrape/enrich/upload/row)
+        journal = RunJournal.for_run(self._script_dir / "logs", supplier_name, sku_file_path)
+        journal_inputs = RunJournal.inputs_hash(sku_file_path, supplier_config)
+        if not self.resume_run_var.get():
+            journal.discard()
+        else:
+            try:
+                resume_max_age = float(os.getenv('RESUME_MAX_AGE_HOURS', '24').strip() or 24)
+            except ValueError:
+                resume_max_age = 24.0
+            stale = journal.stale_reason(journal_inputs, resume_max_age)
+            if stale:
+                self.log(f"🗑️ Jurnal {journal.path.name} ignorat ({stale}) – pornesc de la zero", "WARNING")
+                journal.discard()
+        journal.start(journal_inputs)
+        for item in sku_items:
+            item['journal_key'] = RunJournal.item_key(supplier_name, item['url'], item.get('code'))
+        resumed_rows = sum(1 for item in sku_items if journal.has(item['journal_key'], 'row'))
+        if resumed_rows:
+            self.log(f"♻️ Reluare rulare întreruptă: {resumed_rows}/{total_items} produse deja complete în jurnal ({journal.path.name})", "INFO")
+
+        def scrape_one(idx, item):
+            url_or_sku = item['url']
+            manual_code = item.get('code')
+            cached_product = journal.get(item['journal_key'], 'scrape')
+            if cached_product:
+                self.set_progress(f"Procesez produs {idx}/{total_items} (din jurnal)")
+                self.log(f"[{idx}/{total_items}] ♻️ Date produs din jurnal (fără re-scrape): {url_or_sku[:70]}", "INFO")
+                return cached_product
+            display_label = f"{url_or_sku[:55]}..." if len(url_or_sku) > 58 else url_or_sku
+            if manual_code:
+                display_label += f" | {manual_code}"
+            self.set_progress(f"Procesez produs {idx}/{total_items}: {display_label}")
+            self.log(f"\n" + "="*70, "INFO")
+            self.log(f"[{idx}/{total_items}] 🔵 START procesare: {display_label}", "INFO")
+            self.log(f"="*70, "INFO")
+            if manual_code and manual_code.strip().upper() in CATEGORY_CODE_MAP:
+                self.log(f"   📌 Cod manual: {manual_code} → categorie și prefix SKU din legendă", "INFO")
+            # Scraping: prin scraper (multi-furnizor) sau direct MobileSentrix
+            with self.metrics.timer(f"scrape.{supplier_name}"):
+                if scraper:
+                    return scraper.scrape_product(url_or_sku)
+                return self.scrape_product(
+                    url_or_sku,
+                    skip_images=supplier_config.get("skip_images", False),
+                    supplier_name=supplier_config.get("name", "mobilesentrix"),
+                )
+
+        def scraped_products():
+            """Sursa pipeline-ului: scraping + selecție imagini / badge (popup-uri pe thread-ul importului)."""
+            nonlocal success_count, error_count
+            for idx, item, product_data, scrape_error in self._iter_scrape_results(sku_items, scrape_one, scrape_workers):
                 manual_code = item.get('code')
-                display_label = f"{url_or_sku[:55]}..." if len(url_or_sku) > 58 else url_or_sku
-                if manual_code:
-                    display_label += f" | {manual_code}"
-                    if manual_code.strip().upper() in CATEGORY_CODE_MAP:
-                        self.log(f"   📌 Cod manual: {manual_code} → categorie și prefix SKU din legendă", "INFO")
-                self.progress_var.set(f"Procesez produs {idx}/{len(sku_items)}: {display_label}")
-                self.log(f"\n" + "="*70, "INFO")
-                self.log(f"[{idx}/{len(sku_items)}] 🔵 START procesare: {display_label}", "INFO")
-                self.log(f"="*70, "INFO")
+                key = item['journal_key']
 
                 try:
-                    # Scraping: prin scraper (multi-furnizor) sau direct MobileSentrix
-                    if scraper:
-                        product_data = scraper.scrape_product(url_or_sku)
-                    else:
-                        product_data = self.scrape_product(
-                            url_or_sku,
-                            skip_images=supplier_config.get("skip_images", False),
-                            supplier_name=supplier_config.get("name", "mobilesentrix"),
-                        )
+                    if scrape_error is not None:
+                        raise scrape_error
 
-                    if product_data:
+                    if product_data and journal.has(key, 'scrape'):
+                        # Selecția imaginilor / badge-urile au fost făcute la rularea anterioară
+                        success_count += 1
+                    elif product_data:
+                        if scrape_workers > 1:
+                            self.log(f"[{idx}/{total_items}] ⬅️ Rezultat: {item['url'][:70]}", "INFO")
                         # Cod manual din sku_list (link | COD) are prioritate pentru categorie
                         product_data['manual_category_code'] = manual_code
 
@@ -3578,61 +3497,244 @@ class ImportProduse:
 
                         success_count += 1
                         self.log(f"✓ Produs procesat! SKU furnizor: {sku_furnizor}", "SUCCESS")
-
-                        products_data.append(product_data)
+                        journal.record(key, 'scrape', product_data)
                     else:
                         error_count += 1
-                        self.log(f"✗ Nu s-au putut extrage datele produsului", "ERROR")
+                        self.log(f"✗ [{idx}/{total_items}] Nu s-au putut extrage datele produsului", "ERROR")
+                        continue
 
                 except Exception as e:
                     error_count += 1
-                    self.log(f"✗ Eroare: {e}", "ERROR")
+                    self.log(f"✗ [{idx}/{total_items}] Eroare: {e}", "ERROR")
+                    continue
 
-            # CREARE CSV
-            csv_filename = None
-            csv_path = None
-            if products_data:
-                self.log("\n" + "=" * 70, "INFO")
-                self.log("📝 CREARE FIȘIER CSV WEBGSM...", "INFO")
-                self.log("=" * 70, "INFO")
+                yield idx, key, product_data
 
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                csv_filename = f"export_webgsm_{timestamp}.csv"
-                csv_path = self.export_to_csv(products_data, csv_filename)
+        # Etape după scraping (rulează în paralel cu scraping-ul produselor următoare):
+        # enrich (Ollama / traducere) → upload imagini WordPress → rând CSV
+        ollama_ok = self._log_text_engine()
+        if ollama_ok:
+            self.warm_up_ollama()
 
-                if csv_path:
-                    self.log(f"\n✅ CSV WebGSM creat: {csv_path}", "SUCCESS")
+        # Textele se pregătesc în loturi înainte de etapa enrich. Fără Ollama: titlurile / descrierile / tag-urile
+        # a TRANSLATE_BATCH_SIZE produse în câteva cereri Google comune. Cu Ollama (opțional, OLLAMA_BATCH_SIZE):
+        # produsele scurte din lot într-un singur prompt
+        if ollama_ok:
+            text_batch_size, prefetch_texts = self._ollama_batch_size(), self.prefetch_ollama_fields
+        else:
+            try:
+                text_batch_size = int(os.getenv('TRANSLATE_BATCH_SIZE', '8').strip() or 1)
+            except ValueError:
+                text_batch_size = 8
+            prefetch_texts = self.prefetch_translations
 
-            # Sumar final
+        # Etapă proprie în pipeline (thread separat): scraping-ul continuă cât timp lotul e tradus / generat
+        def stage_prefetch(jobs):
+            try:
+                prefetch_texts([p for _, key, p in jobs if not journal.has(key, 'enrich')])
+            except Exception as e:
+                self.log(f"⚠ Pregătire texte în lot eșuată – produsele se procesează individual: {e}", "WARNING")
+            return jobs
+
+        # Fiecare etapă verifică întâi jurnalul (ex. imaginile deja uploadate își păstrează URL-urile WordPress)
+        def stage_enrich(job):
+            idx, key, product = job
+            text = journal.get(key, 'enrich')
+            if text is None:
+                self.log(f"🔄 [{idx}/{total_items}] Text RO (enrich): {product.get('name', 'N/A')[:60]}", "INFO")
+                with self.metrics.timer("stage.enrich"):
+                    text = self._enrich_product_text(product, ollama_ok)
+                journal.record(key, 'enrich', text)
+            return idx, key, product, text
+
+        def stage_upload(job):
+            idx, key, product, text = job
+            image_urls = journal.get(key, 'upload')
+            uploaded = image_urls is not None
+            if image_urls is None:
+                with self.metrics.timer("stage.upload"):
+                    image_urls, uploaded = self._upload_product_images(product, text, idx)
+                # Imagini rămase pe URL-ul furnizorului (upload eșuat/sărit) → nu intră în jurnal, se reîncearcă la reluare
+                if uploaded:
+                    journal.record(key, 'upload', image_urls)
+                else:
+                    upload_incomplete.append(idx)
+            else:
+                self.log(f"   ♻️ [{idx}/{total_items}] {len(image_urls)} URL-uri imagini WordPress din jurnal (fără re-upload)", "INFO")
+            return idx, key, product, text, image_urls, uploaded
+
+        def stage_row(job):
+            idx, key, product, text, image_urls, uploaded = job
+            row = journal.get(key, 'row') if uploaded else None
+            if row is None:
+                row = self._build_csv_row(product, text, image_urls)
+                if uploaded:
+                    journal.record(key, 'row', row)
+            return idx, row
+
+        # CSV scris incremental: fiecare rând ajunge pe disc imediat ce produsul e gata
+        # (memorie constantă; la Stop / crash rămâne un CSV parțial valid)
+        if not csv_filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            csv_filename = f"export_webgsm_{timestamp}.csv"
+        csv_writer = self._open_webgsm_csv(csv_filename)
+        self.log(f"📄 CSV WebGSM (scris pe măsură ce produsele sunt gata): {csv_writer.path}", "INFO")
+        export_error_count = 0
+        upload_incomplete = []  # produse cu imagini rămase pe URL-ul furnizorului (se reîncearcă la reluare)
+
+        def collect_row(seq, value, error, stage):
+            nonlocal export_error_count
+            idx = value[0]
+            if error is not None:
+                export_error_count += 1
+                self.log(f"✗ [{idx}/{total_items}] Eroare etapa {stage}: {error}", "ERROR")
+                return
+            csv_writer.write_row(value[1])
+            self.metrics.item_done()
+            self.log(f"   📝 [{idx}/{total_items}] Rând CSV scris ({csv_writer.rows_written} total)", "INFO")
+
+        # Cu Ollama, etapa enrich poate rula pe mai multe produse deodată; sink-ul scrie rândurile tot în ordinea listei
+        enrich_workers = self._ollama_parallel() if ollama_ok else 1
+        if enrich_workers > 1:
+            self.log(f"⚡ Ollama paralel: {enrich_workers} produse generate simultan (ordinea din CSV se păstrează)", "INFO")
+        pipeline_stages = [("enrich", stage_enrich, enrich_workers), ("upload", stage_upload, 1), ("row", stage_row, 1)]
+        if text_batch_size > 1:
+            pipeline_stages.insert(0, ("prefetch", stage_prefetch, 1, text_batch_size))
+        try:
+            StagedPipeline(pipeline_stages, queue_size=max(4, enrich_workers * 2)).run(scraped_products(), collect_row)
+        finally:
+            csv_path = csv_writer.close()
+            if csv_path and not self.running:
+                self.log(f"⏹️ Import oprit – CSV parțial valid ({csv_writer.rows_written} rânduri): {csv_path}", "WARNING")
+
+        csv_filename = csv_writer.path.name if csv_path else None
+        # Scraper-ele din src/scraper au cache propriu; MobileSentrix trece prin _page_get
+        cache_line = (scraper.cache_summary() if scraper else None) or self._page_cache_summary(supplier_name)
+        if cache_line:
+            self.log(f"🗄️ Cache HTTP: {cache_line}", "INFO")
+        # Ultimele citiri din cache-uri (LRU) ținute în memorie → pe disc
+        self._translations().flush()
+        if any(self._translations().stats.values()):
+            self.log(f"🈯 Cache traduceri: {self._translations().summary()}", "INFO")
+        ollama_cache = self._ollama_fields_cache()
+        if ollama_cache is not None:
+            ollama_cache.flush()
+        if ollama_cache is not None and any(ollama_cache.stats.values()):
+            self.log(f"🤖 Cache Ollama: {ollama_cache.stats['hit']} produse din cache, "
+                     f"{ollama_cache.stats['miss']} generate ({len(ollama_cache)} intrări pe disc)", "INFO")
+        report_path = self._write_run_report(csv_path)
+        # Rulare completă fără erori → jurnalul nu mai e necesar; altfel îl păstrăm pentru reluare
+        if upload_incomplete:
+            self.log(f"⚠️ {len(upload_incomplete)} produse cu imagini neuploadate pe WordPress (URL furnizor în CSV) – "
+                     "se reîncearcă la următorul Start", "WARNING")
+        if self.running and not error_count and not export_error_count and not upload_incomplete:
+            journal.discard()
+        else:
+            self.log(f"💾 Jurnal păstrat ({journal.path.name}) – la următorul Start se reiau doar produsele neterminate", "INFO")
+        if csv_path:
             self.log("\n" + "=" * 70, "INFO")
-            self.log(f"📊 SUMAR PROCESARE WEBGSM:", "INFO")
-            self.log(f"   ✓ Produse procesate cu succes: {success_count}", "SUCCESS")
-            self.log(f"   ✗ Erori scraping: {error_count}", "ERROR")
-            self.log(f"   📦 Total intrări: {len(sku_items)}", "INFO")
-            self.log(f"   📁 Imagini salvate în: images/", "INFO")
-            if products_data:
-                self.log("   🏷️ SKU-uri utilizate: codurile furnizorului (ex. SKU MobileSentrix)", "INFO")
-            self.log("=" * 70, "INFO")
+            self._log_csv_done(csv_path, csv_writer.rows_written)
+            self.log(f"\n✅ CSV WebGSM creat: {csv_path}", "SUCCESS")
+
+        # Sumar final
+        self.log("\n" + "=" * 70, "INFO")
+        self.log(f"📊 SUMAR PROCESARE WEBGSM:", "INFO")
+        self.log(f"   ✓ Produse procesate cu succes: {success_count}", "SUCCESS")
+        self.log(f"   ✗ Erori scraping: {error_count}", "ERROR")
+        if export_error_count:
+            self.log(f"   ✗ Erori export (text / upload / rând CSV): {export_error_count}", "ERROR")
+        self.log(f"   📦 Total intrări: {len(sku_items)}", "INFO")
+        self.log(f"   📁 Imagini salvate în: images/", "INFO")
+        if csv_path:
+            self.log("   🏷️ SKU-uri utilizate: codurile furnizorului (ex. SKU MobileSentrix)", "INFO")
+        self.log("=" * 70, "INFO")
 
-            csv_info = f"\nFișier CSV: {csv_filename}" if csv_filename else ""
-            messagebox.showinfo("Finalizat",
-                f"Procesare WebGSM finalizată!\n\nProduse procesate: {success_count}\nErori: {error_count}{csv_info}\nFolderul imagini: images/")
+        return {
+            'success': success_count,
+            'errors': error_count,
+            'export_errors': export_error_count,
+            'total': len(sku_items),
+            'csv_path': csv_path,
+            'csv_filename': csv_filename,
+            'report_path': str(report_path) if report_path else None,
+        }
 
-            # Deschide folderul data cu CSV-ul
+    def _write_run_report(self, csv_path=None):
+        """Raport performanță (p50/p95/max per etapă, bytes, produse/min) lângă CSV sau în logs/."""
+        if not self.metrics:
+            return None
+        self.metrics.finish()
+        try:
             if csv_path:
-                os.startfile(str(self._script_dir / "data"))
-
+                report_path = Path(csv_path).with_suffix('.report.json')
+            else:
+                report_path = self._script_dir / "logs" / f"run_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            self.metrics.write_report(report_path)
+            for line in self.metrics.summary_lines():
+                self.log(line, "INFO")
+            self.log(f"   📈 Raport performanță: {report_path}", "INFO")
+            return report_path
         except Exception as e:
-            self.log(f"✗ Eroare critică: {e}", "ERROR")
-            messagebox.showerror("Eroare", f"Eroare critică:\n{e}")
+            self.log(f"   ⚠️ Raport performanță nescris: {e}", "WARNING")
+            return None
+        finally:
+            # Apelurile din afara unei rulări (ex. Export CSV manual) nu mai sunt măsurate
+            self.metrics = None
+
+    def _iter_scrape_results(self, sku_items, scrape_one, workers=1):
+        """Generează (idx, item, product_data, eroare) în ordinea din sku_list.
+        workers=1 → secvențial (ca înainte). workers>1 → pool de thread-uri cu maxim
+        2×workers cereri în zbor; rezultatele sunt livrate tot în ordinea de intrare.
+        La Stop (self.running=False) nu se mai trimit cereri noi, iar cele din coadă se anulează.
+        """
+        if workers <= 1:
+            for idx, item in enumerate(sku_items, 1):
+                if not self.running:
+                    return
+                try:
+                    yield idx, item, scrape_one(idx, item), None
+                except Exception as e:
+                    yield idx, item, None, e
+            return
+
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
 
+        def run_job(idx, item):
+            if not self.running:
+                return None
+            return scrape_one(idx, item)
+
+        pending = deque()
+        items_iter = iter(enumerate(sku_items, 1))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape")
+
+        def fill():
+            while self.running and len(pending) < workers * 2:
+                nxt = next(items_iter, None)
+                if nxt is None:
+                    return
+                idx, item = nxt
+                pending.append((idx, item, executor.submit(run_job, idx, item)))
+
+        try:
+            fill()
+            while pending:
+                idx, item, future = pending.popleft()
+                try:
+                    product_data, error = future.result(), None
+                except Exception as e:
+                    product_data, error = None, e
+                if not self.running:
+                    self.log("⏹️ Oprit de utilizator – rezultatele rămase din coadă sunt ignorate", "WARNING")
+                    return
+                yield idx, item, product_data, error
+                fill()
         finally:
-            self.progress_bar.stop()
-            self.btn_start.config(state='normal')
-            self.btn_stop.config(state='disabled')
-            self.progress_var.set("Export finalizat")
-            self.running = False
-    
+            for _, _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def read_sku_file(self, filepath):
         """Citește link-uri, EAN-uri sau SKU-uri din fișier.
         Acceptă:
@@ -3658,35 +3760,33 @@ class ImportProduse:
                     items.append({'url': line, 'code': None})
         return items
 
-    def load_category_rules(self, filepath="category_rules.txt"):
-        """Încarcă reguli de categorii (keyword | categorie) din fișier configurabil."""
-        rules = []
-        path = Path(filepath)
-        if not path.exists():
-            path = self._script_dir / filepath
-        if not path.exists():
-            return rules
-        with open(path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                parts = line.split('|')
-                if len(parts) >= 2:
-                    keyword = parts[0].strip().lower()
-                    category_path = parts[1].strip()
-                    if keyword and category_path:
-                        rules.append((keyword, category_path))
-        return rules
+    def load_category_rules(self, filepath=None):
+        """
+        Încarcă reguli de categorii (keyword | categorie) din fișier(e) configurabil(e), compilate într-un automat.
+        CATEGORY_RULES_FILES în .env: listă separată prin virgulă (ex. category_rules.txt,category_rules_generated.txt);
+        fișierele de la început au prioritate. Forma compilată e păstrată în cache/category_rules/.
+        """
+        names = [filepath] if filepath else [
+            n.strip() for n in (os.getenv('CATEGORY_RULES_FILES') or 'category_rules.txt').split(',') if n.strip()
+        ]
+        paths = []
+        for name in names:
+            path = Path(name)
+            if not path.exists():
+                path = self._script_dir / name
+            if path.exists():
+                paths.append(path)
+        try:
+            return load_keyword_rules(paths, cache_dir=self._script_dir / "cache" / "category_rules")
+        except Exception as e:
+            self.log(f"⚠️ Reguli categorii: {e}", "WARNING")
+            return KeywordRules([])
 
     def detect_category(self, product_name, tags):
-        """Returnează categoria pe baza keyword-urilor din nume + tag-uri."""
+        """Returnează categoria pe baza keyword-urilor din nume + tag-uri (prima regulă din fișier care apare)."""
         haystack = f"{product_name} {' '.join(tags)}".lower()
-        for keyword, category_path in self.category_rules:
-            if keyword in haystack:
-                return category_path
-        return "Uncategorized"
-    
+        return self.category_rules.match(haystack)
+
     def detect_warranty(self, product_name, category):
         """Detectează perioada de garanție pe baza categoriei și numelui produsului"""
         text = f"{product_name} {category}".lower()
@@ -3870,8 +3970,70 @@ class ImportProduse:
             base = f"{base}-{index}"
         return f"{base}.{ext}"
 
-    # ⚡ Cache traduceri - evită apeluri duplicate la Google Translate
-    _translation_cache = {}
+    # ⚡ Cache traduceri pe disc (comun rulărilor și furnizorilor) - evită apeluri duplicate la Google Translate
+    _translation_cache = None
+
+    def _translations(self):
+        """
+        TranslationCache din cache/translations.sqlite3.
+        TRANSLATION_CACHE_MAX (intrări, implicit 50000) și TRANSLATION_CACHE_TTL_DAYS (implicit 90) în .env.
+        """
+        with self._http_lock:
+            if self._translation_cache is None:
+                try:
+                    max_entries = int(os.getenv('TRANSLATION_CACHE_MAX', '50000').strip() or 0)
+                except ValueError:
+                    max_entries = 50000
+                try:
+                    ttl_days = float(os.getenv('TRANSLATION_CACHE_TTL_DAYS', '90').strip() or 0)
+                except ValueError:
+                    ttl_days = 90
+                self._translation_cache = TranslationCache(
+                    self._script_dir / "cache" / "translations.sqlite3",
+                    max_entries=max_entries,
+                    ttl_days=ttl_days,
+                    on_event=lambda kind: self.metrics and self.metrics.incr(f"translation_cache.{kind}"),
+                )
+            return self._translation_cache
+
+    # Cache generări Ollama pe disc (model + versiune prompt + intrări produs → câmpuri parsate)
+    _ollama_cache = None
+    # False după ce serverul Ollama a refuzat `format` cu schemă (versiune < 0.5)
+    _ollama_schema_ok = True
+    # Thread-ul de pre-încărcare a modelului (warm_up_ollama)
+    _ollama_warmup = None
+
+    def _ollama_output_format(self):
+        """OLLAMA_OUTPUT în .env: json (implicit, ieșire structurată) sau lines (formatul vechi NAME_RO: …)."""
+        output = (os.getenv('OLLAMA_OUTPUT') or 'json').strip().lower()
+        return output if output in OUTPUT_FORMATS else 'json'
+
+    def _ollama_fields_cache(self):
+        """
+        KeyValueCache din cache/ollama_fields.sqlite3 sau None (OLLAMA_CACHE=false în .env).
+        Cheia conține modelul și hash-ul promptului: schimbarea OLLAMA_MODEL sau a promptului invalidează automat.
+        OLLAMA_CACHE_MAX (intrări, implicit 20000) și OLLAMA_CACHE_TTL_DAYS (implicit 180) în .env.
+        """
+        if (os.getenv('OLLAMA_CACHE') or 'true').strip().lower() in ('0', 'false', 'no', 'off'):
+            return None
+        with self._http_lock:
+            if self._ollama_cache is None:
+                try:
+                    max_entries = int(os.getenv('OLLAMA_CACHE_MAX', '20000').strip() or 0)
+                except ValueError:
+                    max_entries = 20000
+                try:
+                    ttl_days = float(os.getenv('OLLAMA_CACHE_TTL_DAYS', '180').strip() or 0)
+                except ValueError:
+                    ttl_days = 180
+                self._ollama_cache = KeyValueCache(
+                    self._script_dir / "cache" / "ollama_fields.sqlite3",
+                    namespace="ollama",
+                    max_entries=max_entries,
+                    ttl_days=ttl_days,
+                    on_event=lambda kind: self.metrics and self.metrics.incr(f"ollama_cache.{kind}"),
+                )
+            return self._ollama_cache
 
     def _looks_like_slug(self, text):
         """True dacă textul arată ca un slug URL (multe cratime, puține spații)."""
@@ -3882,6 +4044,7 @@ class ImportProduse:
         # Slug tip: ibridge-a3-tail-plug-comprehensive-analysis-tester-qianli
         return hyphens >= 2 and spaces <= 1
 
+    @timed("ollama_title")
     def translate_via_ollama(self, text, prompt_type='title'):
         """Traduce/adaptează text prin API Ollama local (pentru slug-uri sau Componentă)."""
         base_url = self.config.get('OLLAMA_URL', '').strip()
@@ -3898,10 +4061,12 @@ class ImportProduse:
             prompt = "Translate to Romanian. Output ONLY the Romanian text, nothing else.\n\nEnglish: "
         prompt += text.strip()
         timeout_sec = self.config.get('OLLAMA_TIMEOUT', 300)
+        self._wait_ollama_warmup()
         try:
-            r = requests.post(
+            r = self._ollama_post(
                 url,
-                json={"model": model, "prompt": prompt, "stream": False},
+                json={"model": model, "prompt": prompt, "stream": False, "keep_alive": self._ollama_keep_alive(),
+                      "options": self._ollama_options()},
                 timeout=min(90, timeout_sec)
             )
             r.raise_for_status()
@@ -3913,6 +4078,7 @@ class ImportProduse:
             self.log(f"⚠ Ollama: {e}", "WARNING")
         return None
 
+    @timed("ollama")
     def ollama_generate_product_fields(self, source_url, name_en, description_en, pa_model, pa_calitate, pa_brand_piesa, pa_tehnologie, tags_en=''):
         """
         Generează toate câmpurile text pentru CSV (nume, descriere, SEO, tag-uri) prin Ollama.
@@ -3924,131 +4090,380 @@ class ImportProduse:
             return None
         model = self.config.get('OLLAMA_MODEL', 'llama3.2') or 'llama3.2'
         url = f"{base_url.rstrip('/')}/api/generate"
-        desc_full = (description_en or '')[:2800].replace('\n', ' ')
-        tags_line = f"Product tags from source (EN): {tags_en.strip()[:300]}" if tags_en and tags_en.strip() else "No tags from source."
-        prompt = f"""You are a product data specialist for a Romanian e-commerce site (WebGSM). Write ONLY in correct, fluent Romanian (gramatică corectă).
-
-SOURCE PRODUCT URL (read-only): {source_url}
-
-Product name (EN): {name_en}
-Description/specs from source (EN): {desc_full}
-{tags_line}
-Attributes: Model={pa_model or '-'}, Calitate={pa_calitate or '-'}, Brand={pa_brand_piesa or '-'}, Tehnologie={pa_tehnologie or '-'}
-
-Translate and adapt for our CSV. Keep the structure of the description (e.g. Net Weight, Compatibility, Product size, Speed) when present. Important: for diagnostic/testing devices use "tester" in Romanian (dispozitiv de testare), never "testator" (persoana care face testament). Output ONLY these lines, one per line:
-NAME_RO: <one line, product name in Romanian, SEO-friendly, grammatically correct>
-SHORT_DESC_RO: <one line, short description in Romanian, max 160 chars, fluent>
-DESC_RO: <full description in Romanian; KEEP structure (Greutate netă, Compatibilitate, Dimensiuni, Viteză etc.); use | for line breaks; grammatically correct>
-SEO_TITLE: <one line, max 60 chars>
-SEO_DESC: <one line, max 155 chars>
-FOCUS_KW: <one short phrase for SEO>
-TIP_PRODUS: <exactly one: Baterie, Ecran, Conector Încărcare, Cameră Spate, Șurub, Șurubelniță, Componentă, Flex, Carcasă, Difuzor, Buton, Garnitură, Tester, Folie protecție>
-TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g. wholesale screwdrivers -> șurubelnițe en-gros); otherwise suggest max 6 short tags; comma-separated, max 8 tags, grammatically correct Romanian>"""
+        field_inputs = (name_en, description_en, pa_model, pa_calitate, pa_brand_piesa, pa_tehnologie, tags_en)
+        output = self._ollama_output_format()
+        # Același produs (model + prompt + nume + descriere + atribute) → rezultatul salvat, fără generare nouă
+        cache = self._ollama_fields_cache()
+        cache_input = fields_cache_key(model, *field_inputs, output=output)
+        with self._http_lock:
+            prefetched = self._ollama_prefetched.pop(cache_input, None)
+        if prefetched is not None:
+            self.log(f"   ♻️ Ollama (generat în lot): {prefetched.get('name_ro', '')[:50]}", "INFO")
+            return prefetched
+        if cache is not None:
+            lookup = cache_input
+            if output == 'json' and not cache.has(cache_input):
+                # Produs generat într-un lot la o rulare anterioară (cheie cu versiunea promptului de lot)
+                batch_key = fields_cache_key(model, *field_inputs, output='batch')
+                if cache.has(batch_key):
+                    lookup = batch_key
+            cached = cache.get(lookup)
+            if cached is not None:
+                try:
+                    result = json.loads(cached)
+                    self.log(f"   ♻️ Ollama din cache ({model}): {result.get('name_ro', '')[:50]}", "INFO")
+                    return result
+                except ValueError:
+                    pass
+        prompt = build_fields_prompt(source_url, *field_inputs, output=output)
         timeout_sec = self.config.get('OLLAMA_TIMEOUT', 300)
-        for attempt in range(2):
+        self._wait_ollama_warmup()
+        try:
+            payload = {
+                "model": model, "prompt": prompt, "stream": False, "keep_alive": self._ollama_keep_alive(),
+                "options": self._ollama_options(num_predict=FIELDS_NUM_PREDICT),
+            }
+            if fields_system(output):
+                payload["system"] = fields_system(output)
+            if output == "json":
+                # Ollama >= 0.5 acceptă schema JSON; serverele mai vechi doar "json" (obiect liber)
+                payload["format"] = FIELDS_SCHEMA if self._ollama_schema_ok else "json"
+            # Retry la timeout (2 încercări, doar fără stream) + circuit breaker: vezi _ollama_post
             try:
-                r = requests.post(
-                    url,
-                    json={"model": model, "prompt": prompt, "stream": False},
-                    timeout=timeout_sec
-                )
-                r.raise_for_status()
-                out = r.json().get("response", "").strip()
-                if not out:
-                    return None
-                out = self.fix_romanian_diacritics(out)
-                result = {}
-                desc_ro_lines = []
-                in_desc_ro = False
-                key_prefixes = ("NAME_RO:", "SHORT_DESC_RO:", "DESC_RO:", "SEO_TITLE:", "SEO_DESC:", "FOCUS_KW:", "TIP_PRODUS:", "TAGS_RO:")
-                for line in out.splitlines():
-                    line_stripped = line.strip()
-                    if line_stripped.startswith("NAME_RO:"):
-                        in_desc_ro = False
-                        result["name_ro"] = line_stripped[8:].strip()
-                    elif line_stripped.startswith("SHORT_DESC_RO:"):
-                        in_desc_ro = False
-                        result["short_desc_ro"] = line_stripped[14:].strip()[:160]
-                    elif line_stripped.startswith("DESC_RO:"):
-                        in_desc_ro = True
-                        desc_ro_lines = [line_stripped[8:].strip()]
-                    elif in_desc_ro and not any(line_stripped.startswith(p) for p in key_prefixes if p != "DESC_RO:"):
-                        desc_ro_lines.append(line_stripped)
-                    elif line_stripped.startswith("SEO_TITLE:"):
-                        in_desc_ro = False
-                        result["seo_title"] = line_stripped[10:].strip()[:60]
-                    elif line_stripped.startswith("SEO_DESC:"):
-                        result["seo_desc"] = line_stripped[9:].strip()[:160]
-                    elif line_stripped.startswith("FOCUS_KW:"):
-                        result["focus_kw"] = line_stripped[9:].strip()
-                    elif line_stripped.startswith("TIP_PRODUS:"):
-                        result["tip_produs"] = line_stripped[11:].strip()
-                    elif line_stripped.startswith("TAGS_RO:"):
-                        result["tags_ro"] = line_stripped[8:].strip()[:500]
-                if desc_ro_lines:
-                    result["desc_ro"] = " ".join(desc_ro_lines).replace("|", "\n").strip()[:3000]
-                if result.get("name_ro"):
-                    return result
+                out, data, cut_off = self._ollama_fields_request(url, payload, timeout_sec, output)
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code != 400 or not isinstance(payload.get("format"), dict):
+                    raise
+                self._ollama_schema_ok = False
+                self.log("   ⚠ Serverul Ollama nu acceptă schema JSON – folosesc format=\"json\" (actualizați Ollama >= 0.5)", "WARNING")
+                payload["format"] = "json"
+                out, data, cut_off = self._ollama_fields_request(url, payload, timeout_sec, output)
+            if data:
+                self._record_ollama_timings(data, "ollama")
+            if cut_off and self.metrics:
+                self.metrics.incr("ollama.cut_off")
+            out = out.strip()
+            if not out:
                 return None
-            except (requests.exceptions.Timeout, requests.exceptions.ReadTimeout) as e:
-                self.log(f"⚠ Ollama timeout ({timeout_sec}s)" + (" – reîncerc..." if attempt == 0 else f": {e}"), "WARNING")
-                if attempt == 1:
-                    return None
-            except Exception as e:
-                self.log(f"⚠ Ollama (câmpuri produs): {e}", "WARNING")
-                return None
-        return None
+            out = self.fix_romanian_diacritics(out)
+            result = parse_fields_json(out) if output == "json" else parse_fields_response(out)
+            if result is None:
+                self.log(f"   ⚠ Ollama: răspuns fără câmpurile cerute ({output}) – folosesc traducerea Google", "WARNING")
+            if result and cache is not None:
+                cache.put(cache_input, json.dumps(result, ensure_ascii=False))
+            return result
+        except CircuitOpenError as e:
+            self.log(f"⚠ Ollama indisponibil temporar – folosesc traducerea Google: {e}", "WARNING")
+            return None
+        except (requests.exceptions.Timeout, requests.exceptions.ReadTimeout) as e:
+            # În stream, timeout-ul e între bucăți și apare după ce sesiunea a returnat – nu se mai reîncearcă
+            detail = "fără bucăți noi în stream" if self._ollama_stream() else "după reîncercare"
+            self.log(f"⚠ Ollama timeout ({timeout_sec}s, {detail}): {e}", "WARNING")
+            return None
+        except Exception as e:
+            self.log(f"⚠ Ollama (câmpuri produs): {e}", "WARNING")
+            return None
+
+    def _ollama_stream(self):
+        """OLLAMA_STREAM în .env (implicit true): câmpurile produsului se primesc pe bucăți."""
+        return (os.getenv('OLLAMA_STREAM') or 'true').strip().lower() not in ('0', 'false', 'no', 'off')
+
+    def _ollama_fields_request(self, url, payload, timeout_sec, output):
+        """
+        Cererea pentru câmpurile unui produs → (text, mesajul final cu timpii, oprit_devreme).
+        OLLAMA_STREAM=true (implicit): răspunsul vine pe bucăți, câmpurile gata apar în log, iar conexiunea se
+        închide imediat ce toate câmpurile sunt complete (modelul nu mai generează text inutil după ele).
+        """
+        if not self._ollama_stream():
+            r = self._ollama_post(url, json=payload, timeout=timeout_sec)
+            r.raise_for_status()
+            data = r.json()
+            return data.get("response", ""), data, False
+
+        def on_field(key, elapsed):
+            if key == 'name_ro':
+                self.log(f"   ✍️ Ollama [{elapsed:.1f}s]: nume gata, continuă descrierea / SEO...", "INFO")
+            else:
+                self.log(f"   ✍️ Ollama [{elapsed:.1f}s]: {key} gata", "DEBUG")
+
+        started = time.perf_counter()
+        out, data, cut_off = stream_generate(self._ollama_post, url, payload, timeout_sec, output=output, on_field=on_field)
+        if cut_off:
+            self.log(f"   ✂️ Ollama: toate câmpurile gata în {time.perf_counter() - started:.1f}s – generarea oprită "
+                     f"({len(out)} caractere)", "INFO")
+        return out, data, cut_off
 
     def translate_text(self, text, source='en', target='ro'):
         """Traduce text folosind Google Translate (cu cache + diacritice corecte)."""
         if not text or not text.strip():
             return text
+        return self.translate_many([text], source=source, target=target)[0]
 
-        # Verifică cache-ul (aceleași texte nu se mai traduc de două ori)
-        cache_key = f"{source}:{target}:{text.strip()[:200]}"
-        if cache_key in self._translation_cache:
-            return self._translation_cache[cache_key]
+    def translate_many(self, texts, source='en', target='ro'):
+        """
+        Traduce o listă de texte cu cât mai puține cereri Google Translate: textele din cache se iau de pe disc,
+        restul (fără duplicate) se împachetează în cereri de max 4500 caractere și rezultatele se mapează înapoi.
+        Textele la care traducerea eșuează rămân în original (și nu intră în cache).
+        """
+        return self._translate_many(texts, source, target)[0]
+
+    @timed("translate")
+    def _translate_many(self, texts, source, target):
+        """(traduceri, număr de cereri Google făcute)."""
+        results = list(texts)
+        cache = self._translations()
+        pending = {}  # text → pozițiile din listă (același titlu / tag la mai multe produse = o singură traducere)
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            if text in pending:
+                pending[text].append(i)
+                continue
+            cached = cache.get(text, source, target)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending[text] = [i]
+        if not pending:
+            return results, 0
 
         try:
             translator = GoogleTranslator(source=source, target=target)
-            # Împarte text în bucăți dacă e prea lung (max 5000 caractere)
-            max_length = 4500
-            if len(text) <= max_length:
-                translated = translator.translate(text)
-            else:
-                # Împarte în paragrafe și traduce separat
-                chunks = []
-                current_chunk = ""
+        except Exception as e:
+            self.log(f"⚠ Eroare traducere: {e}", "WARNING")
+            return results, 0
+        batch = BatchTranslator(translator.translate, on_error=lambda e: self.log(f"⚠ Eroare traducere: {e}", "WARNING"))
+        unique = list(pending)
+        for text, translated in zip(unique, batch.translate(unique)):
+            if translated is None:
+                continue
+            # Corectează sedilă → virgulă (ş→ș, ţ→ț) pentru română
+            if target == 'ro':
+                translated = self.fix_romanian_diacritics(translated)
+            # Salvează în cache pentru reutilizare
+            cache.put(text, source, target, translated)
+            for i in pending[text]:
+                results[i] = translated
+        if self.metrics:
+            self.metrics.incr("translate.requests", batch.requests)
+            self.metrics.incr("translate.texts", len(unique))
+        return results, batch.requests
+
+    def _translation_inputs(self, product):
+        """(nume, descriere scurtă, taguri) exact cum le traduce _enrich_product_text fără Ollama."""
+        clean_name = product.get('name', 'N/A')
+        if clean_name.endswith(' Copy'):
+            clean_name = clean_name[:-5]
+        clean_desc = product.get('description', '')[:500]
+        clean_desc = re.sub(r'https?://\S+', '', clean_desc).strip()
+        return clean_name, clean_desc, product.get('tags', '')
+
+    def _ollama_field_args(self, product):
+        """Argumentele ollama_generate_product_fields pentru un produs (aceleași în enrich și în modul lot)."""
+        clean_name, _, tags = self._translation_inputs(product)
+        return {
+            'source_url': product.get('source_url', ''),
+            'name_en': clean_name,
+            'description_en': product.get('description', ''),
+            'pa_model': product.get('pa_model', ''),
+            'pa_calitate': product.get('pa_calitate', 'Aftermarket'),
+            'pa_brand_piesa': product.get('pa_brand_piesa', ''),
+            'pa_tehnologie': product.get('pa_tehnologie', ''),
+            'tags_en': tags,
+        }
 
-                for paragraph in text.split('\n'):
-                    if len(current_chunk) + len(paragraph) + 1 <= max_length:
-                        current_chunk += paragraph + '\n'
-                    else:
-                        if current_chunk:
-                            chunks.append(current_chunk)
-                        current_chunk = paragraph + '\n'
+    def _ollama_batch_size(self):
+        """OLLAMA_BATCH_SIZE în .env (implicit 1 = fără loturi); doar cu OLLAMA_OUTPUT=json."""
+        if self._ollama_output_format() != 'json':
+            return 1
+        try:
+            return max(1, min(int(os.getenv('OLLAMA_BATCH_SIZE', '1').strip() or 1), 10))
+        except ValueError:
+            return 1
+
+    def _ollama_num_ctx(self):
+        """OLLAMA_NUM_CTX în .env: contextul trimis la fiecare cerere – aceeași valoare peste tot, altfel serverul
+        reîncarcă modelul. Nesetat: 0 = nu se trimite (valoarea serverului, loturile presupun atunci 2048), iar cu
+        loturi (OLLAMA_BATCH_SIZE > 1) BATCH_NUM_CTX, ca promptul unui lot să încapă."""
+        raw = (os.getenv('OLLAMA_NUM_CTX') or '').strip()
+        try:
+            if raw:
+                return max(0, int(raw))
+        except ValueError:
+            pass
+        return BATCH_NUM_CTX if self._ollama_batch_size() > 1 else 0
 
-                if current_chunk:
-                    chunks.append(current_chunk)
+    def _ollama_options(self, **options):
+        """options pentru /api/generate, cu num_ctx comun tuturor cererilor."""
+        if self._ollama_num_ctx():
+            options['num_ctx'] = self._ollama_num_ctx()
+        return options
 
-                # Traduce fiecare bucată
-                translated_chunks = []
-                for chunk in chunks:
-                    translated_chunks.append(translator.translate(chunk))
+    def _ollama_keep_alive(self):
+        """Cât timp păstrează serverul modelul (și prefixul de prompt procesat) în memorie după o cerere."""
+        return (os.getenv('OLLAMA_KEEP_ALIVE') or '30m').strip()
 
-                translated = '\n'.join(translated_chunks)
+    def warm_up_ollama(self):
+        """
+        Pre-încarcă OLLAMA_MODEL pe server (thread separat, scraping-ul continuă între timp) și setează keep_alive.
+        Prima generare așteaptă terminarea încărcării, deci timeout-ul ei nu mai include timpul de încărcare.
+        """
+        base_url = self.config.get('OLLAMA_URL', '').strip()
+        if not base_url:
+            return None
+        model = self.config.get('OLLAMA_MODEL', 'llama3.2') or 'llama3.2'
+        keep_alive = self._ollama_keep_alive()
+        timeout_sec = self.config.get('OLLAMA_TIMEOUT', 300)
 
-            # Corectează sedilă → virgulă (ş→ș, ţ→ț) pentru română
-            if target == 'ro':
-                translated = self.fix_romanian_diacritics(translated)
+        def run():
+            try:
+                # Cerere directă, nu prin _ollama_post: fără reîncercare (ar dura 2 × OLLAMA_TIMEOUT, mai mult decât
+                # așteaptă _wait_ollama_warmup) și fără circuit breaker – o încărcare lentă nu trebuie să trimită
+                # primele produse pe traducerea Google
+                info = preload_model(base_url, model, keep_alive=keep_alive, timeout=timeout_sec,
+                                     options=self._ollama_options())
+            except Exception as e:
+                self.log(f"⚠ Pre-încărcare model Ollama eșuată ({model}): {e}", "WARNING")
+                return
+            if self.metrics:
+                self.metrics.record("ollama.load", info['load_s'])
+            if info['already_loaded']:
+                self.log(f"🤖 Ollama: modelul {model} era deja încărcat (keep_alive {keep_alive})", "INFO")
+            else:
+                self.log(f"🤖 Ollama: modelul {model} încărcat în {info['load_s']:.1f}s (keep_alive {keep_alive})", "INFO")
 
-            # Salvează în cache pentru reutilizare
-            self._translation_cache[cache_key] = translated
-            return translated
+        thread = threading.Thread(target=run, name="ollama-warmup", daemon=True)
+        self._ollama_warmup = thread
+        thread.start()
+        return thread
+
+    def _wait_ollama_warmup(self):
+        """Blochează până se termină pre-încărcarea modelului (dacă rulează)."""
+        thread = self._ollama_warmup
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(self.config.get('OLLAMA_TIMEOUT', 300))
+
+    def _record_ollama_timings(self, data, label):
+        """Timpii raportați de Ollama: încărcarea modelului separat de procesarea promptului și generare."""
+        timings = response_timings(data)
+        if self.metrics:
+            self.metrics.record(f"{label}.prompt_eval", timings['prompt'])
+            self.metrics.record(f"{label}.generate", timings['generate'])
+            if timings['load'] > RELOAD_THRESHOLD_S:
+                self.metrics.record("ollama.load", timings['load'])
+        if timings['load'] > RELOAD_THRESHOLD_S:
+            self.log(f"   ⏳ Ollama a (re)încărcat modelul în {timings['load']:.1f}s – "
+                     f"dacă se repetă, măriți OLLAMA_KEEP_ALIVE (acum {self._ollama_keep_alive()})", "WARNING")
+
+    @timed("ollama_batch")
+    def prefetch_ollama_fields(self, products):
+        """
+        Mod lot (OLLAMA_BATCH_SIZE > 1): produsele scurte (descriere ≤ OLLAMA_BATCH_MAX_DESC caractere, ex. șuruburi,
+        unelte, folii) sunt generate câte OLLAMA_BATCH_SIZE într-un singur prompt. Rezultatele ajung în cache
+        (memorie + disc) și sunt preluate de ollama_generate_product_fields; produsele lipsă din răspuns
+        se generează apoi individual, ca de obicei. Returnează numărul de produse generate în lot.
+        """
+        batch_size = self._ollama_batch_size()
+        base_url = self.config.get('OLLAMA_URL', '').strip()
+        if batch_size <= 1 or not base_url:
+            return 0
+        try:
+            max_desc = int(os.getenv('OLLAMA_BATCH_MAX_DESC', '600').strip() or 600)
+        except ValueError:
+            max_desc = 600
+        model = self.config.get('OLLAMA_MODEL', 'llama3.2') or 'llama3.2'
+        cache = self._ollama_fields_cache()
 
+        pending = []  # (cheie produs individual, argumente, cheie cache lot)
+        seen = set()
+        for product in products:
+            args = self._ollama_field_args(product)
+            if len(args['description_en'] or '') > max_desc:
+                continue
+            fields = {k: v for k, v in args.items() if k != 'source_url'}
+            key = fields_cache_key(model, output='json', **fields)
+            batch_key = fields_cache_key(model, output='batch', **fields)
+            if key in seen or (cache is not None and (cache.has(key) or cache.has(batch_key))):
+                continue
+            seen.add(key)
+            pending.append((key, args, batch_key))
+
+        # Loturi de cel mult OLLAMA_BATCH_SIZE produse care încap în context (prompt + num_predict ≤ num_ctx);
+        # altfel serverul taie promptul / răspunsul și JSON-ul lotului iese trunchiat
+        num_ctx = self._ollama_num_ctx() or 2048
+        chunks, current = [], []
+        for item in pending:
+            candidate = current + [item]
+            if current and (len(candidate) > batch_size or batch_tokens(args for _, args, _ in candidate) > num_ctx):
+                chunks.append(current)
+                candidate = [item]
+            current = candidate
+        if current:
+            chunks.append(current)
+
+        generated = 0
+        for chunk in chunks:
+            if len(chunk) < 2:
+                continue  # un singur produs → cererea obișnuită, cu promptul individual
+            results = self._ollama_generate_batch(model, base_url, [args for _, args, _ in chunk])
+            with self._http_lock:
+                for i, (key, _, _) in enumerate(chunk, 1):
+                    if i in results:
+                        self._ollama_prefetched[key] = results[i]
+            if cache is not None:
+                for i, (_, _, batch_key) in enumerate(chunk, 1):
+                    if i in results:
+                        cache.put(batch_key, json.dumps(results[i], ensure_ascii=False))
+            generated += len(results)
+        return generated
+
+    def _ollama_generate_batch(self, model, base_url, args_list):
+        """O cerere /api/generate pentru mai multe produse → {id (1..n): câmpuri}; {} la eroare."""
+        url = f"{base_url.rstrip('/')}/api/generate"
+        payload = {
+            "model": model,
+            "system": BATCH_SYSTEM,
+            "prompt": build_batch_prompt(list(enumerate(args_list, 1))),
+            "stream": False,
+            "keep_alive": self._ollama_keep_alive(),
+            "format": BATCH_SCHEMA if self._ollama_schema_ok else "json",
+            "options": self._ollama_options(num_predict=FIELDS_NUM_PREDICT * len(args_list)),
+        }
+        timeout_sec = self.config.get('OLLAMA_TIMEOUT', 300)
+        self._wait_ollama_warmup()
+        started = time.perf_counter()
+        try:
+            r = self._ollama_post(url, json=payload, timeout=timeout_sec)
+            if r.status_code == 400 and isinstance(payload["format"], dict):
+                self._ollama_schema_ok = False
+                payload["format"] = "json"
+                r = self._ollama_post(url, json=payload, timeout=timeout_sec)
+            r.raise_for_status()
+            data = r.json()
+            self._record_ollama_timings(data, "ollama_batch")
+            results = parse_batch_json(self.fix_romanian_diacritics(data.get("response", "")))
+        except CircuitOpenError as e:
+            self.log(f"⚠ Ollama indisponibil temporar (lot): {e}", "WARNING")
+            return {}
         except Exception as e:
-            self.log(f"⚠ Eroare traducere: {e}", "WARNING")
-            return text  # Returnează textul original dacă traducerea eșuează
+            self.log(f"⚠ Ollama (lot de {len(args_list)} produse): {e} – se generează individual", "WARNING")
+            return {}
+        self.log(f"   🤖 Ollama lot: {len(results)}/{len(args_list)} produse într-o cerere "
+                 f"({time.perf_counter() - started:.1f}s)", "INFO")
+        return results
+
+    def prefetch_translations(self, products):
+        """
+        Traduce dintr-o dată textele mai multor produse (în lot) ca etapa enrich să le găsească în cache.
+        Returnează numărul de cereri Google făcute.
+        """
+        texts = [t for product in products for t in self._translation_inputs(product) if t and t.strip()]
+        if not texts:
+            return 0
+        _, made = self._translate_many(texts, 'en', 'ro')
+        if made:
+            self.log(f"🌍 Traducere în lot: {len(texts)} texte ({len(products)} produse) → {made} cereri Google Translate", "INFO")
+        return made
 
     def _build_description_html(self, lines):
         """
@@ -4122,438 +4537,499 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 out.append(p)
         return ', '.join(out) if out else (tip_ro or 'piese')
 
-    def export_to_csv(self, products_data, filename="export_produse.csv"):
-        """Exportă produsele în CSV format WebGSM cu atribute, ACF meta și SEO Rank Math"""
-        import csv
-
-        try:
-            csv_path = self._script_dir / "data" / filename
-            self.log(f"📄 Creez fișier CSV WebGSM: {csv_path}", "INFO")
-            self.log(f"⏳ Procesez {len(products_data)} produse cu upload imagini pe WordPress...", "INFO")
+    def _log_text_engine(self):
+        """Loghează motorul de text folosit (Ollama sau Google Translate). Returnează True dacă Ollama e configurat."""
+        ollama_ok = bool(self.config.get('OLLAMA_URL'))
+        if ollama_ok:
+            self.log(f"🤖 Ollama activ: {self.config.get('OLLAMA_URL')} – generează toate câmpurile (nume, descriere, SEO)", "INFO")
+        else:
+            self.log("🌍 Ollama neconfigurat (OLLAMA_URL gol în .env) – folosesc Google Translate + logică internă", "INFO")
+        return ollama_ok
+
+    def _enrich_product_text(self, product, ollama_ok):
+        """Etapa „enrich”: titlu, descrieri, categorii, SEO și tag-uri în română (Ollama / Google Translate).
+        Returnează dict cu textele finale folosite la construirea rândului CSV."""
+        # Atribute din scrape (folosite și de Ollama ca context)
+        clean_name, clean_desc, _ = self._translation_inputs(product)
+        pa_model = product.get('pa_model', '')
+        pa_calitate = product.get('pa_calitate', 'Aftermarket')
+        pa_brand_piesa = product.get('pa_brand_piesa', '')
+        pa_tehnologie = product.get('pa_tehnologie', '')
+        description_for_longtail = product.get('description', '')
+
+        ollama_data = None
+        if ollama_ok:
+            ollama_data = self.ollama_generate_product_fields(**self._ollama_field_args(product))
+        if ollama_data:
+            longtail_title = self.curata_text(ollama_data.get('name_ro', '')) or clean_name
+            tip_ro = ollama_data.get('tip_produs', 'Componentă')
+            clean_name_ro = longtail_title
+            self.log(f"   🤖 Ollama: Name={longtail_title[:50]}..., Tip={tip_ro}", "INFO")
+        else:
+            tip_ro = self._detect_tip_produs_ro(clean_name)
+            use_ollama_title = ollama_ok and (self._looks_like_slug(clean_name) or tip_ro == 'Componentă')
+            if use_ollama_title:
+                text_for_ollama = clean_name.replace('-', ' ')
+                clean_name_ro = self.translate_via_ollama(text_for_ollama, 'title')
+                if clean_name_ro is None:
+                    clean_name_ro = self.translate_text(clean_name, source='en', target='ro')
+                else:
+                    self.log(f"   🤖 Ollama (titlu): {clean_name} → {clean_name_ro}", "INFO")
+            else:
+                clean_name_ro = self.translate_text(clean_name, source='en', target='ro')
+                if clean_name_ro == clean_name and ollama_ok:
+                    clean_name_ro = self.translate_via_ollama(clean_name, 'title') or clean_name_ro
+            if not use_ollama_title:
+                self.log(f"   🌍 Titlu tradus: {clean_name} → {clean_name_ro}", "INFO")
+            longtail_attrs = {
+                'pa_model': pa_model, 'pa_calitate': pa_calitate,
+                'pa_brand_piesa': pa_brand_piesa, 'pa_tehnologie': pa_tehnologie,
+                'original_name': clean_name,
+            }
+            longtail_title = self.build_longtail_title(clean_name_ro, description_for_longtail, longtail_attrs)
+        self.log(f"   📝 Titlu (Name CSV): {longtail_title[:60]}...", "INFO")
+
+        # Short description și Description: din Ollama dacă avem, altfel logică internă
+        if ollama_data:
+            short_description = self.curata_text(ollama_data.get('short_desc_ro', ''))[:160]
+            if not short_description:
+                short_description = f"{tip_ro}. Garanție inclusă. Livrare rapidă în toată România."
+        else:
+            clean_desc_ro_tr = self.translate_text(clean_desc, source='en', target='ro')
+            self.log(f"   🌍 Descriere tradusă: {len(clean_desc)} → {len(clean_desc_ro_tr)} caractere", "INFO")
+            short_desc_parts = [tip_ro]
+            if pa_model:
+                short_desc_parts.append(pa_model)
+            if pa_tehnologie:
+                short_desc_parts.append(pa_tehnologie)
+            if pa_calitate and pa_calitate != 'Aftermarket':
+                short_desc_parts.append(f"calitate {pa_calitate}")
+            short_desc_intro = ' '.join(short_desc_parts)
+            short_description = f"{short_desc_intro}. Garanție inclusă. Livrare rapidă în toată România."
+            short_description = self.curata_text(short_description)[:160]
+
+        # Description: conform cerințelor – structură cu h2/h3 (titluri secțiune) și p (paragrafe)
+        # Linii "Titlu: conținut" → <h3>Titlu</h3><p>conținut</p>; restul → <p>...</p>
+        if ollama_data and ollama_data.get('desc_ro'):
+            raw_desc = self.curata_text(ollama_data['desc_ro'])
+            lines = [s.strip() for s in re.split(r'[\n|]+', raw_desc) if s.strip()]
+            clean_desc_ro = self._build_description_html(lines)
+            if not clean_desc_ro:
+                clean_desc_ro = '<p>' + html.escape(raw_desc[:2000]) + '</p>'
+        else:
+            raw_fallback = (product.get('description', '') or '')[:2000]
+            lines_fb = [s.strip() for s in re.split(r'[\n|]+', raw_fallback) if s.strip()]
+            clean_desc_ro = self._build_description_html(lines_fb)
+            if not clean_desc_ro:
+                clean_desc_ro = '<p>' + html.escape(raw_fallback) + '</p>'
+
+        # Categorii: Titlu > URL slug > Descriere > Taguri; folosit și pentru garanție
+        manual_code = product.get('manual_category_code')
+        url_slug = (product.get('source_url') or '').rstrip('/').split('/')[-1] or ''
+        categories = self.get_woo_category(
+            clean_name, tip_ro, manual_code=manual_code,
+            description=product.get('description', '')[:500],
+            url_slug=url_slug,
+            tags=product.get('tags', '')
+        )
 
-            with open(csv_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                fieldnames = [
-                    'ID', 'Type', 'SKU', 'GTIN, UPC, EAN, or ISBN', 'Name', 'Published', 'Is featured?',
-                    'Visibility in catalog', 'Short description', 'Description',
-                    'Tax status', 'Tax class', 'In stock?', 'Stock', 'Low stock amount', 'Backorders allowed?',
-                    'Regular price', 'Categories', 'Tags', 'Images', 'Parent', 'Allow customer reviews?',
-                    # ATRIBUTE WOOCOMMERCE (5 atribute x 4 coloane)
-                    'Attribute 1 name', 'Attribute 1 value(s)', 'Attribute 1 visible', 'Attribute 1 global',
-                    'Attribute 2 name', 'Attribute 2 value(s)', 'Attribute 2 visible', 'Attribute 2 global',
-                    'Attribute 3 name', 'Attribute 3 value(s)', 'Attribute 3 visible', 'Attribute 3 global',
-                    'Attribute 4 name', 'Attribute 4 value(s)', 'Attribute 4 visible', 'Attribute 4 global',
-                    'Attribute 5 name', 'Attribute 5 value(s)', 'Attribute 5 visible', 'Attribute 5 global',
-                    # ACF META
-                    'meta:gtin_ean', 'meta:sku_furnizor', 'meta:furnizor_activ',
-                    'meta:pret_achizitie', 'meta:locatie_stoc', 'meta:garantie_luni',
-                    'meta:coduri_compatibilitate', 'meta:ic_movable', 'meta:truetone_support',
-                    'meta:source_url',
-                    # SEO RANK MATH
-                    'meta:rank_math_title', 'meta:rank_math_description', 'meta:rank_math_focus_keyword'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+        # SEO Rank Math: din Ollama dacă avem, altfel funcții interne
+        if ollama_data:
+            seo_title = self.curata_text(ollama_data.get('seo_title', ''))[:60]
+            seo_description = self.curata_text(ollama_data.get('seo_desc', ''))[:160]
+            seo_keyword = self.curata_text(ollama_data.get('focus_kw', ''))
+            if not seo_title:
+                seo_title = longtail_title[:60]
+        else:
+            original_name = product.get('name', '')
+            seo_title = self.generate_seo_title(original_name, pa_model, pa_brand_piesa, pa_tehnologie)
+            seo_description = self.generate_seo_description(original_name, pa_model, pa_brand_piesa, pa_tehnologie, pa_calitate)
+            seo_keyword = self.generate_focus_keyword(original_name, pa_model)
+        self.log(f"   🔍 SEO: {seo_title[:60]}...", "INFO")
+
+        # Tags: din Ollama (TAGS_RO); dacă lipsesc sau sunt „nav/footer”, generăm din nume/categorie
+        if ollama_data and ollama_data.get('tags_ro'):
+            tags_value = self.curata_text(ollama_data['tags_ro'].strip())[:500]
+        else:
+            tags_value = product.get('tags', '')
+            if tags_value:
+                tags_value = self.translate_text(tags_value, source='en', target='ro')
+            # Detectare tag-uri greșite (navigare/footer: Eroare, Europa, Despre, Servicii...)
+            if self._tags_look_like_nav(tags_value):
+                tags_value = ''
+            if not tags_value or not tags_value.strip():
+                tags_value = self._generate_fallback_tags(
+                    longtail_title, categories, pa_model, pa_calitate, pa_tehnologie, tip_ro
+                )
 
-                writer.writeheader()
+        return {
+            'clean_name': clean_name,
+            'clean_name_ro': clean_name_ro,
+            'longtail_title': longtail_title,
+            'tip_ro': tip_ro,
+            'short_description': short_description,
+            'description_html': clean_desc_ro,
+            'categories': categories,
+            'seo_title': seo_title,
+            'seo_description': seo_description,
+            'seo_keyword': seo_keyword,
+            'tags': tags_value,
+        }
 
-                ollama_ok = bool(self.config.get('OLLAMA_URL'))
-                if ollama_ok:
-                    self.log(f"🤖 Ollama activ: {self.config.get('OLLAMA_URL')} – generează toate câmpurile (nume, descriere, SEO)", "INFO")
+    def _upload_product_images(self, product, text, idx):
+        """Etapa „upload”: copii cu nume SEO + upload paralel pe WordPress.
+        Returnează (URL-uri imagini în ordinea originală, max MAX_IMAGES_IN_CSV; True dacă toate
+        imaginile au ajuns pe WordPress – False dacă vreuna a rămas pe URL-ul furnizorului)."""
+        # ⚡ Upload PARALEL imagini pe WordPress (de la ~2min la ~30s)
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        longtail_title = text['longtail_title']
+        tip_ro = text['tip_ro']
+        image_urls = []
+        all_uploaded = True
+        if product.get('images'):
+            # Copie cu nume SEO pentru upload (păstrează originalul ms_XXXXX – nu strică batch-ul)
+            seo_title = longtail_title if (longtail_title and len(self.normalize_text(longtail_title)) >= 3) else ' '.join(filter(None, [tip_ro, product.get('pa_model', ''), product.get('pa_tehnologie', ''), product.get('pa_calitate', 'Aftermarket')])) or 'produs'
+            sku_tag = str(product.get('sku_furnizor') or product.get('sku') or idx)
+            images_dir = self._script_dir / "images"
+            for img_idx, img in enumerate(product['images']):
+                if isinstance(img, dict) and 'local_path' in img:
+                    old_path = Path(img['local_path'])
+                    if old_path.exists():
+                        ext = old_path.suffix.lstrip('.').lower() or 'jpg'
+                        seo_base = f"{seo_title} {sku_tag}" if sku_tag else seo_title
+                        new_name = self.generate_seo_filename(seo_base, ext, img_idx + 1)
+                        new_path = images_dir / new_name
+                        if old_path.resolve() != new_path.resolve():
+                            try:
+                                shutil.copy2(old_path, new_path)
+                                img['local_path'] = str(new_path)
+                                img['name'] = new_name
+                                self.log(f"   📁 Copie upload: {old_path.name} → {new_name}", "INFO")
+                            except Exception as e:
+                                self.log(f"   ⚠️ Copie {old_path.name}: {e}", "WARNING")
+            # Pregătește lista de imagini de uploadat
+            upload_tasks = []
+            fallback_urls = {}  # idx -> fallback URL
+            for img_idx, img in enumerate(product['images']):
+                img_path = None
+                if isinstance(img, dict):
+                    if 'local_path' in img:
+                        img_path = img['local_path']
                 else:
-                    self.log("🌍 Ollama neconfigurat (OLLAMA_URL gol în .env) – folosesc Google Translate + logică internă", "INFO")
-
-                for idx, product in enumerate(products_data, 1):
-                    self.log(f"🔄 Proceseaza produs {idx}/{len(products_data)}: {product.get('name', 'N/A')}", "INFO")
-
-                    # meta:source_url rămâne MEREU din scrape (link MobileSentrix) – nu se modifică niciodată
-                    source_url = product.get('source_url', '')
-
-                    # Atribute din scrape (folosite și de Ollama ca context)
-                    clean_name = product.get('name', 'N/A')
-                    if clean_name.endswith(' Copy'):
-                        clean_name = clean_name[:-5]
-                    pa_model = product.get('pa_model', '')
-                    pa_calitate = product.get('pa_calitate', 'Aftermarket')
-                    pa_brand_piesa = product.get('pa_brand_piesa', '')
-                    pa_tehnologie = product.get('pa_tehnologie', '')
-                    description_for_longtail = product.get('description', '')
-
-                    ollama_data = None
-                    if ollama_ok:
-                        ollama_data = self.ollama_generate_product_fields(
-                            source_url, clean_name, description_for_longtail,
-                            pa_model, pa_calitate, pa_brand_piesa, pa_tehnologie,
-                            product.get('tags', '')
-                        )
-                    if ollama_data:
-                        longtail_title = self.curata_text(ollama_data.get('name_ro', '')) or clean_name
-                        tip_ro = ollama_data.get('tip_produs', 'Componentă')
-                        clean_name_ro = longtail_title
-                        self.log(f"   🤖 Ollama: Name={longtail_title[:50]}..., Tip={tip_ro}", "INFO")
-                    else:
-                        tip_ro = self._detect_tip_produs_ro(clean_name)
-                        use_ollama_title = ollama_ok and (self._looks_like_slug(clean_name) or tip_ro == 'Componentă')
-                        if use_ollama_title:
-                            text_for_ollama = clean_name.replace('-', ' ')
-                            clean_name_ro = self.translate_via_ollama(text_for_ollama, 'title')
-                            if clean_name_ro is None:
-                                clean_name_ro = self.translate_text(clean_name, source='en', target='ro')
-                            else:
-                                self.log(f"   🤖 Ollama (titlu): {clean_name} → {clean_name_ro}", "INFO")
-                        else:
-                            clean_name_ro = self.translate_text(clean_name, source='en', target='ro')
-                            if clean_name_ro == clean_name and ollama_ok:
-                                clean_name_ro = self.translate_via_ollama(clean_name, 'title') or clean_name_ro
-                        if not use_ollama_title:
-                            self.log(f"   🌍 Titlu tradus: {clean_name} → {clean_name_ro}", "INFO")
-                        longtail_attrs = {
-                            'pa_model': pa_model, 'pa_calitate': pa_calitate,
-                            'pa_brand_piesa': pa_brand_piesa, 'pa_tehnologie': pa_tehnologie,
-                            'original_name': clean_name,
-                        }
-                        longtail_title = self.build_longtail_title(clean_name_ro, description_for_longtail, longtail_attrs)
-                    self.log(f"   📝 Titlu (Name CSV): {longtail_title[:60]}...", "INFO")
-
-                    # ⚡ Upload PARALEL imagini pe WordPress (de la ~2min la ~30s)
-                    from concurrent.futures import ThreadPoolExecutor, as_completed
-                    image_urls = []
-                    if product.get('images'):
-                        # Copie cu nume SEO pentru upload (păstrează originalul ms_XXXXX – nu strică batch-ul)
-                        seo_title = longtail_title if (longtail_title and len(self.normalize_text(longtail_title)) >= 3) else ' '.join(filter(None, [tip_ro, pa_model, pa_tehnologie, pa_calitate])) or 'produs'
-                        sku_tag = str(product.get('sku_furnizor') or product.get('sku') or idx)
-                        images_dir = self._script_dir / "images"
-                        for img_idx, img in enumerate(product['images']):
-                            if isinstance(img, dict) and 'local_path' in img:
-                                old_path = Path(img['local_path'])
-                                if old_path.exists():
-                                    ext = old_path.suffix.lstrip('.').lower() or 'jpg'
-                                    seo_base = f"{seo_title} {sku_tag}" if sku_tag else seo_title
-                                    new_name = self.generate_seo_filename(seo_base, ext, img_idx + 1)
-                                    new_path = images_dir / new_name
-                                    if old_path.resolve() != new_path.resolve():
-                                        try:
-                                            shutil.copy2(old_path, new_path)
-                                            img['local_path'] = str(new_path)
-                                            img['name'] = new_name
-                                            self.log(f"   📁 Copie upload: {old_path.name} → {new_name}", "INFO")
-                                        except Exception as e:
-                                            self.log(f"   ⚠️ Copie {old_path.name}: {e}", "WARNING")
-                        # Pregătește lista de imagini de uploadat
-                        upload_tasks = []
-                        fallback_urls = {}  # idx -> fallback URL
-                        for img_idx, img in enumerate(product['images']):
-                            img_path = None
-                            if isinstance(img, dict):
-                                if 'local_path' in img:
-                                    img_path = img['local_path']
-                            else:
-                                img_path = str(img)
-
-                            if img_path and Path(img_path).exists():
-                                upload_tasks.append((img_idx, img_path))
-                                if isinstance(img, dict) and 'src' in img:
-                                    fallback_urls[img_idx] = img['src']
-                            elif isinstance(img, dict) and 'src' in img:
-                                # Nu există local, folosește URL direct
-                                image_urls.append((img_idx, img['src']))
-
-                        if product.get('images') and not upload_tasks:
-                            self.log(
-                                f"   ⚠️ {len(product['images'])} imagini în memorie dar 0 fișiere locale – "
-                                "probabil cod vechi (nume colizionate) sau folder images/ gol. "
-                                f"Verifică build {SCRAPER_IMAGE_BUILD} și log «ms_XXXXX» la scrape.",
-                                "WARNING",
-                            )
-
-                        if upload_tasks:
-                            self.log(f"   📤 Upload {len(upload_tasks)} imagini pe WordPress (paralel)...", "INFO")
-
-                            def _upload_one(args):
-                                img_idx, img_path = args
-                                try:
-                                    result = self.upload_image_to_wordpress(img_path)
-                                    if result:
-                                        wp_url = result.get('src') if isinstance(result, dict) else result
-                                        return {'success': True, 'idx': img_idx, 'url': wp_url}
-                                    else:
-                                        fb = fallback_urls.get(img_idx, '')
-                                        return {'success': False, 'idx': img_idx, 'url': fb}
-                                except Exception as e:
-                                    fb = fallback_urls.get(img_idx, '')
-                                    return {'success': False, 'idx': img_idx, 'url': fb, 'error': str(e)}
-
-                            # Upload paralel: 3 thread-uri (nu supraîncărcăm WordPress)
-                            wp_results = []
-                            with ThreadPoolExecutor(max_workers=3) as executor:
-                                futures = {executor.submit(_upload_one, task): task for task in upload_tasks}
-                                for future in as_completed(futures):
-                                    res = future.result()
-                                    if res['success']:
-                                        wp_results.append((res['idx'], res['url']))
-                                        self.log(f"   ✓ [{res['idx']+1}] Uploadat pe WordPress", "SUCCESS")
-                                    elif res['url']:
-                                        wp_results.append((res['idx'], res['url']))
-                                        self.log(f"   ⚠ [{res['idx']+1}] Upload eșuat, URL original", "WARNING")
-                                    else:
-                                        self.log(f"   ✗ [{res['idx']+1}] Upload eșuat, fără fallback", "ERROR")
-
-                            # Combină cu URL-urile directe și sortează după index
-                            image_urls.extend(wp_results)
-
-                        # Sortează după index și extrage doar URL-urile (fără /test/ – site live)
-                        image_urls.sort(key=lambda x: x[0])
-                        image_urls = [self._normalize_image_url(url) for _, url in image_urls]
-
-                    # Limită nr. de link-uri (imagini deja pe site) în CSV – mai puține = import mai rapid
-                    if len(image_urls) > MAX_IMAGES_IN_CSV:
-                        image_urls = image_urls[:MAX_IMAGES_IN_CSV]
-                        self.log(f"   📷 CSV: max {MAX_IMAGES_IN_CSV} imagini/produs (import mai rapid)", "INFO")
-
-                    # Preț achiziție EUR (din scrape) – la fel ca la MobileSentrix; toți furnizorii populează price/pret_achizitie_eur
-                    _p = product.get('pret_achizitie_eur')
-                    if _p is None or _p == '':
-                        _p = product.get('price')
+                    img_path = str(img)
+
+                if img_path and Path(img_path).exists():
+                    upload_tasks.append((img_idx, img_path))
+                    if isinstance(img, dict) and 'src' in img:
+                        fallback_urls[img_idx] = img['src']
+                elif isinstance(img, dict) and 'src' in img:
+                    # Nu există local, folosește URL direct
+                    image_urls.append((img_idx, img['src']))
+                    all_uploaded = False
+
+            if product.get('images') and not upload_tasks:
+                all_uploaded = False
+                self.log(
+                    f"   ⚠️ {len(product['images'])} imagini în memorie dar 0 fișiere locale – "
+                    "probabil cod vechi (nume colizionate) sau folder images/ gol. "
+                    f"Verifică build {SCRAPER_IMAGE_BUILD} și log «ms_XXXXX» la scrape.",
+                    "WARNING",
+                )
+
+            if upload_tasks:
+                self.log(f"   📤 Upload {len(upload_tasks)} imagini pe WordPress (paralel)...", "INFO")
+
+                def _upload_one(args):
+                    img_idx, img_path = args
                     try:
-                        price_eur = float(_p) if _p not in (None, '') else 0.0
-                    except (TypeError, ValueError):
-                        price_eur = 0.0
-                    # Preț în RON: doar conversie la curs (fără adaos/TVA) – prețul din CSV = preț site în EUR × curs
-                    if self.convert_price_var.get():
-                        try:
-                            exchange_rate = float(self.exchange_rate_var.get().strip() or "4.97")
-                        except (ValueError, TypeError):
-                            exchange_rate = 4.97
-                        price_ron = round(price_eur * exchange_rate, 2)
-                    else:
-                        price_ron = price_eur
+                        result = self.upload_image_to_wordpress(img_path)
+                        if result:
+                            wp_url = result.get('src') if isinstance(result, dict) else result
+                            return {'success': True, 'idx': img_idx, 'url': wp_url}
+                        else:
+                            fb = fallback_urls.get(img_idx, '')
+                            return {'success': False, 'idx': img_idx, 'url': fb}
+                    except Exception as e:
+                        fb = fallback_urls.get(img_idx, '')
+                        return {'success': False, 'idx': img_idx, 'url': fb, 'error': str(e)}
 
-                    # Short description și Description: din Ollama dacă avem, altfel logică internă
-                    if ollama_data:
-                        short_description = self.curata_text(ollama_data.get('short_desc_ro', ''))[:160]
-                        if not short_description:
-                            short_description = f"{tip_ro}. Garanție inclusă. Livrare rapidă în toată România."
-                    else:
-                        clean_desc = product.get('description', '')[:500]
-                        clean_desc = re.sub(r'https?://\S+', '', clean_desc).strip()
-                        clean_desc_ro_tr = self.translate_text(clean_desc, source='en', target='ro')
-                        self.log(f"   🌍 Descriere tradusă: {len(clean_desc)} → {len(clean_desc_ro_tr)} caractere", "INFO")
-                        short_desc_parts = [tip_ro]
-                        if pa_model:
-                            short_desc_parts.append(pa_model)
-                        if pa_tehnologie:
-                            short_desc_parts.append(pa_tehnologie)
-                        if pa_calitate and pa_calitate != 'Aftermarket':
-                            short_desc_parts.append(f"calitate {pa_calitate}")
-                        short_desc_intro = ' '.join(short_desc_parts)
-                        short_description = f"{short_desc_intro}. Garanție inclusă. Livrare rapidă în toată România."
-                        short_description = self.curata_text(short_description)[:160]
-
-                    # Description: conform cerințelor – structură cu h2/h3 (titluri secțiune) și p (paragrafe)
-                    # Linii "Titlu: conținut" → <h3>Titlu</h3><p>conținut</p>; restul → <p>...</p>
-                    if ollama_data and ollama_data.get('desc_ro'):
-                        raw_desc = self.curata_text(ollama_data['desc_ro'])
-                        lines = [s.strip() for s in re.split(r'[\n|]+', raw_desc) if s.strip()]
-                        clean_desc_ro = self._build_description_html(lines)
-                        if not clean_desc_ro:
-                            clean_desc_ro = '<p>' + html.escape(raw_desc[:2000]) + '</p>'
-                    else:
-                        raw_fallback = (product.get('description', '') or '')[:2000]
-                        lines_fb = [s.strip() for s in re.split(r'[\n|]+', raw_fallback) if s.strip()]
-                        clean_desc_ro = self._build_description_html(lines_fb)
-                        if not clean_desc_ro:
-                            clean_desc_ro = '<p>' + html.escape(raw_fallback) + '</p>'
-
-                    # SKU: MEREU GOL – se generează în Supabase la import (100001, 100002, ...)
-                    sku_value = ''
-
-                    # EAN/GTIN: cod numeric 12-14 cifre de la MobileSentrix (meta:gtin_ean)
-                    ean_real = str(product.get('ean_real', '')).strip()
-                    sku_furn = str(product.get('sku_furnizor', '')).strip()
-                    ean_value = ''
-                    for raw in (ean_real, sku_furn):
-                        if not raw:
+                # Upload paralel: 3 thread-uri (nu supraîncărcăm WordPress)
+                wp_results = []
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    futures = {executor.submit(_upload_one, task): task for task in upload_tasks}
+                    for future in as_completed(futures):
+                        res = future.result()
+                        if res['success']:
+                            wp_results.append((res['idx'], res['url']))
+                            self.log(f"   ✓ [{res['idx']+1}] Uploadat pe WordPress", "SUCCESS")
                             continue
-                        s = raw
-                        if not s.isdigit():
-                            try:
-                                s = str(int(float(s)))
-                            except (ValueError, TypeError):
-                                s = re.sub(r'\D', '', s)
-                        if 12 <= len(s) <= 14:
-                            ean_value = s
-                            break
-                        if 8 <= len(s) <= 14 and not ean_value:
-                            ean_value = s
-                    if not ean_value and (ean_real or sku_furn):
-                        s = re.sub(r'\D', '', ean_real or sku_furn)
-                        if s:
-                            ean_value = s
-
-                    # EAN / SKU furnizor – cifre fără apostrof (afișare corectă)
-                    ean_text = ean_value if ean_value else ''
-
-                    # SKU furnizor: cod furnizor (ex. 107082130502) – fără apostrof
-                    sku_furnizor_raw = product.get('sku_furnizor', product.get('sku', ''))
-                    sku_furnizor = str(sku_furnizor_raw).strip() if sku_furnizor_raw else ''
-
-                    # Categorii: Titlu > URL slug > Descriere > Taguri; folosit și pentru garanție
-                    manual_code = product.get('manual_category_code')
-                    url_slug = (product.get('source_url') or '').rstrip('/').split('/')[-1] or ''
-                    categories = self.get_woo_category(
-                        clean_name, tip_ro, manual_code=manual_code,
-                        description=product.get('description', '')[:500],
-                        url_slug=url_slug,
-                        tags=product.get('tags', '')
-                    )
-                    # Detectează garanția (număr luni)
-                    warranty_text = self.detect_warranty(clean_name_ro, categories)
-                    # Convertește "12 luni" -> 12, "6 luni" -> 6, etc.
-                    warranty_months = re.search(r'(\d+)', warranty_text)
-                    warranty_months = warranty_months.group(1) if warranty_months else '12'
-                    self.log(f"   ⏱️ Garantie: {warranty_months} luni", "INFO")
-
-                    # Stoc MEREU 0 – nu avem stoc real (încă nu am comandat de la furnizor)
-                    in_stock = '0'
-                    stock_value = '0'
-                    availability = product.get('availability', 'in_stock')
-                    if availability == 'in_stock':
-                        locatie_stoc = product.get('locatie_stoc', 'depozit_central')
-                    elif availability == 'preorder':
-                        locatie_stoc = 'precomanda'
-                    else:
-                        locatie_stoc = 'indisponibil'
-
-                    # Filtru: scoatem URL-urile directe MobileSentrix din CSV; păstrăm doar imaginile de pe WordPress
-                    wp_before_filter = len(image_urls)
-                    image_urls = [u for u in image_urls if 'mobilesentrix.eu' not in u]
-                    if wp_before_filter and not image_urls:
-                        self.log(
-                            "   ⚠️ Upload WordPress eșuat – rămân doar URL-uri MobileSentrix (eliminate din CSV). "
-                            "Verifică WP_APP_PASSWORD / imagini locale în folderul images/.",
-                            "WARNING",
-                        )
+                        all_uploaded = False
+                        if res['url']:
+                            wp_results.append((res['idx'], res['url']))
+                            self.log(f"   ⚠ [{res['idx']+1}] Upload eșuat, URL original", "WARNING")
+                        else:
+                            self.log(f"   ✗ [{res['idx']+1}] Upload eșuat, fără fallback", "ERROR")
+
+                # Combină cu URL-urile directe și sortează după index
+                image_urls.extend(wp_results)
+
+            # Sortează după index și extrage doar URL-urile (fără /test/ – site live)
+            image_urls.sort(key=lambda x: x[0])
+            image_urls = [self._normalize_image_url(url) for _, url in image_urls]
+
+        # Limită nr. de link-uri (imagini deja pe site) în CSV – mai puține = import mai rapid
+        if len(image_urls) > MAX_IMAGES_IN_CSV:
+            image_urls = image_urls[:MAX_IMAGES_IN_CSV]
+            self.log(f"   📷 CSV: max {MAX_IMAGES_IN_CSV} imagini/produs (import mai rapid)", "INFO")
+        return image_urls, all_uploaded
+
+    @timed("csv_row")
+    def _build_csv_row(self, product, text, image_urls):
+        """Etapa „row”: asamblează rândul CSV WebGSM din textele îmbogățite și URL-urile imaginilor (fără rețea)."""
+        clean_name = text['clean_name']
+        longtail_title = text['longtail_title']
+        categories = text['categories']
+        pa_model = product.get('pa_model', '')
+        pa_calitate = product.get('pa_calitate', 'Aftermarket')
+        pa_brand_piesa = product.get('pa_brand_piesa', '')
+        pa_tehnologie = product.get('pa_tehnologie', '')
+
+        # Preț achiziție EUR (din scrape) – la fel ca la MobileSentrix; toți furnizorii populează price/pret_achizitie_eur
+        _p = product.get('pret_achizitie_eur')
+        if _p is None or _p == '':
+            _p = product.get('price')
+        try:
+            price_eur = float(_p) if _p not in (None, '') else 0.0
+        except (TypeError, ValueError):
+            price_eur = 0.0
+        # Preț în RON: doar conversie la curs (fără adaos/TVA) – prețul din CSV = preț site în EUR × curs
+        if self.convert_price_var.get():
+            try:
+                exchange_rate = float(self.exchange_rate_var.get().strip() or "4.97")
+            except (ValueError, TypeError):
+                exchange_rate = 4.97
+            price_ron = round(price_eur * exchange_rate, 2)
+        else:
+            price_ron = price_eur
+
+        # SKU: MEREU GOL – se generează în Supabase la import (100001, 100002, ...)
+        sku_value = ''
 
-                    # Combină toate imaginile
-                    all_images = ', '.join(image_urls) if image_urls else ''
+        # EAN/GTIN: cod numeric 12-14 cifre de la MobileSentrix (meta:gtin_ean)
+        ean_real = str(product.get('ean_real', '')).strip()
+        sku_furn = str(product.get('sku_furnizor', '')).strip()
+        ean_value = ''
+        for raw in (ean_real, sku_furn):
+            if not raw:
+                continue
+            s = raw
+            if not s.isdigit():
+                try:
+                    s = str(int(float(s)))
+                except (ValueError, TypeError):
+                    s = re.sub(r'\D', '', s)
+            if 12 <= len(s) <= 14:
+                ean_value = s
+                break
+            if 8 <= len(s) <= 14 and not ean_value:
+                ean_value = s
+        if not ean_value and (ean_real or sku_furn):
+            s = re.sub(r'\D', '', ean_real or sku_furn)
+            if s:
+                ean_value = s
+
+        # EAN / SKU furnizor – cifre fără apostrof (afișare corectă)
+        ean_text = ean_value if ean_value else ''
+
+        # SKU furnizor: cod furnizor (ex. 107082130502) – fără apostrof
+        sku_furnizor_raw = product.get('sku_furnizor', product.get('sku', ''))
+        sku_furnizor = str(sku_furnizor_raw).strip() if sku_furnizor_raw else ''
+
+        # Detectează garanția (număr luni)
+        warranty_text = self.detect_warranty(text['clean_name_ro'], categories)
+        # Convertește "12 luni" -> 12, "6 luni" -> 6, etc.
+        warranty_months = re.search(r'(\d+)', warranty_text)
+        warranty_months = warranty_months.group(1) if warranty_months else '12'
+        self.log(f"   ⏱️ Garantie: {warranty_months} luni", "INFO")
+
+        # Stoc MEREU 0 – nu avem stoc real (încă nu am comandat de la furnizor)
+        in_stock = '0'
+        stock_value = '0'
+        availability = product.get('availability', 'in_stock')
+        if availability == 'in_stock':
+            locatie_stoc = product.get('locatie_stoc', 'depozit_central')
+        elif availability == 'preorder':
+            locatie_stoc = 'precomanda'
+        else:
+            locatie_stoc = 'indisponibil'
+
+        # Filtru: scoatem URL-urile directe MobileSentrix din CSV; păstrăm doar imaginile de pe WordPress
+        wp_before_filter = len(image_urls)
+        image_urls = [u for u in image_urls if 'mobilesentrix.eu' not in u]
+        if wp_before_filter and not image_urls:
+            self.log(
+                "   ⚠️ Upload WordPress eșuat – rămân doar URL-uri MobileSentrix (eliminate din CSV). "
+                "Verifică WP_APP_PASSWORD / imagini locale în folderul images/.",
+                "WARNING",
+            )
 
-                    # Categorii deja calculate mai sus (cu description, url_slug, tags)
+        # Combină toate imaginile
+        all_images = ', '.join(image_urls) if image_urls else ''
 
-                    # SEO Rank Math: din Ollama dacă avem, altfel funcții interne
-                    if ollama_data:
-                        seo_title = self.curata_text(ollama_data.get('seo_title', ''))[:60]
-                        seo_description = self.curata_text(ollama_data.get('seo_desc', ''))[:160]
-                        seo_keyword = self.curata_text(ollama_data.get('focus_kw', ''))
-                        if not seo_title:
-                            seo_title = longtail_title[:60]
-                    else:
-                        original_name = product.get('name', '')
-                        seo_title = self.generate_seo_title(original_name, pa_model, pa_brand_piesa, pa_tehnologie)
-                        seo_description = self.generate_seo_description(original_name, pa_model, pa_brand_piesa, pa_tehnologie, pa_calitate)
-                        seo_keyword = self.generate_focus_keyword(original_name, pa_model)
-                    self.log(f"   🔍 SEO: {seo_title[:60]}...", "INFO")
-
-                    # IC Movable & TrueTone: mereu OFF (0) la upload – utilizatorul setează manual "Da" dacă e cazul
-                    # ACF: 0 = Nu / off, 1 = Da / on
-                    ic_movable_val = '0'
-                    truetone_val = '0'
-
-                    # Tags: din Ollama (TAGS_RO); dacă lipsesc sau sunt „nav/footer”, generăm din nume/categorie
-                    if ollama_data and ollama_data.get('tags_ro'):
-                        tags_value = self.curata_text(ollama_data['tags_ro'].strip())[:500]
-                    else:
-                        tags_value = product.get('tags', '')
-                        if tags_value:
-                            tags_value = self.translate_text(tags_value, source='en', target='ro')
-                        # Detectare tag-uri greșite (navigare/footer: Eroare, Europa, Despre, Servicii...)
-                        if self._tags_look_like_nav(tags_value):
-                            tags_value = ''
-                        if not tags_value or not tags_value.strip():
-                            tags_value = self._generate_fallback_tags(
-                                longtail_title, categories, pa_model, pa_calitate, pa_tehnologie, tip_ro
-                            )
-
-                    # Brand REAL din furnizor (nu calitate: Premium OEM, Aftermarket etc.)
-                    brand_real = self._extract_real_brand(clean_name) or (
-                        pa_brand_piesa if pa_brand_piesa not in ('Premium OEM', 'Service Pack', 'Aftermarket', 'Aftermarket Plus') else ''
-                    )
-                    tip_produs = self._guess_product_type(categories)
-
-                    row = {
-                        'ID': '',
-                        'Type': 'simple',
-                        'SKU': sku_value,
-                        'GTIN, UPC, EAN, or ISBN': ean_text,
-                        'Name': longtail_title,
-                        'Published': '0',
-                        'Is featured?': '0',
-                        'Visibility in catalog': 'visible',
-                        'Short description': short_description,
-                        'Description': clean_desc_ro,
-                        'Tax status': 'taxable',
-                        'Tax class': '',
-                        'In stock?': in_stock,
-                        'Stock': stock_value,
-                        'Low stock amount': '3',
-                        'Backorders allowed?': 'notify' if locatie_stoc == 'precomanda' else '0',
-                        'Regular price': f"{price_ron:.2f}",
-                        'Categories': categories,
-                        'Tags': tags_value,
-                        'Images': all_images,
-                        'Parent': '',
-                        'Allow customer reviews?': '1',
-                        # ATRIBUT 1: Model Compatibil
-                        'Attribute 1 name': 'Model Compatibil',
-                        'Attribute 1 value(s)': pa_model,
-                        'Attribute 1 visible': '1',
-                        'Attribute 1 global': '0',
-                        # ATRIBUT 2: Calitate
-                        'Attribute 2 name': 'Calitate',
-                        'Attribute 2 value(s)': pa_calitate,
-                        'Attribute 2 visible': '1',
-                        'Attribute 2 global': '0',
-                        # ATRIBUT 3: Brand Piesa (brand real, nu calitate)
-                        'Attribute 3 name': 'Brand Piesa',
-                        'Attribute 3 value(s)': brand_real,
-                        'Attribute 3 visible': '1',
-                        'Attribute 3 global': '0',
-                        # ATRIBUT 4: Tip Produs
-                        'Attribute 4 name': 'Tip Produs',
-                        'Attribute 4 value(s)': tip_produs,
-                        'Attribute 4 visible': '1',
-                        'Attribute 4 global': '0',
-                        # ATRIBUT 5: Tehnologie
-                        'Attribute 5 name': 'Tehnologie',
-                        'Attribute 5 value(s)': pa_tehnologie,
-                        'Attribute 5 visible': '1',
-                        'Attribute 5 global': '0',
-                        # ACF META (EAN / SKU furnizor – cifre)
-                        'meta:gtin_ean': ean_text,
-                        'meta:sku_furnizor': sku_furnizor,
-                        'meta:furnizor_activ': product.get('furnizor_activ', 'mobilesentrix'),
-                        'meta:pret_achizitie': f"{price_eur:.2f}",  # preț achiziție în EUR (de pe site furnizor)
-                        'meta:locatie_stoc': locatie_stoc,
-                        'meta:garantie_luni': warranty_months,
-                        'meta:coduri_compatibilitate': product.get('coduri_compatibilitate', ''),
-                        'meta:ic_movable': ic_movable_val,
-                        'meta:truetone_support': truetone_val,
-                        'meta:source_url': product.get('source_url', ''),  # MEREU din scrape (link MobileSentrix) – nu se modifică
-                        # SEO RANK MATH
-                        'meta:rank_math_title': seo_title[:60],
-                        'meta:rank_math_description': seo_description[:160],
-                        'meta:rank_math_focus_keyword': seo_keyword,
-                    }
-                    writer.writerow(row)
+        # IC Movable & TrueTone: mereu OFF (0) la upload – utilizatorul setează manual "Da" dacă e cazul
+        # ACF: 0 = Nu / off, 1 = Da / on
+        ic_movable_val = '0'
+        truetone_val = '0'
 
-            self.log(f"✓ CSV WebGSM creat cu succes: {csv_path}", "SUCCESS")
-            self.log(f"   📊 Total produse exportate: {len(products_data)}", "INFO")
-            self.log(f"   📋 Coloane CSV: {len(fieldnames)} (atribute + ACF + SEO)", "INFO")
-            if len(products_data) > 30:
-                self.log(f"   💡 Import mai rapid pe site: importă în batch-uri (ex. 30–50 produse/CSV) sau mărește max_execution_time pe server.", "INFO")
-            return str(csv_path)
+        # Brand REAL din furnizor (nu calitate: Premium OEM, Aftermarket etc.)
+        brand_real = self._extract_real_brand(clean_name) or (
+            pa_brand_piesa if pa_brand_piesa not in ('Premium OEM', 'Service Pack', 'Aftermarket', 'Aftermarket Plus') else ''
+        )
+        tip_produs = self._guess_product_type(categories)
+
+        return {
+            'ID': '',
+            'Type': 'simple',
+            'SKU': sku_value,
+            'GTIN, UPC, EAN, or ISBN': ean_text,
+            'Name': longtail_title,
+            'Published': '0',
+            'Is featured?': '0',
+            'Visibility in catalog': 'visible',
+            'Short description': text['short_description'],
+            'Description': text['description_html'],
+            'Tax status': 'taxable',
+            'Tax class': '',
+            'In stock?': in_stock,
+            'Stock': stock_value,
+            'Low stock amount': '3',
+            'Backorders allowed?': 'notify' if locatie_stoc == 'precomanda' else '0',
+            'Regular price': f"{price_ron:.2f}",
+            'Categories': categories,
+            'Tags': text['tags'],
+            'Images': all_images,
+            'Parent': '',
+            'Allow customer reviews?': '1',
+            # ATRIBUT 1: Model Compatibil
+            'Attribute 1 name': 'Model Compatibil',
+            'Attribute 1 value(s)': pa_model,
+            'Attribute 1 visible': '1',
+            'Attribute 1 global': '0',
+            # ATRIBUT 2: Calitate
+            'Attribute 2 name': 'Calitate',
+            'Attribute 2 value(s)': pa_calitate,
+            'Attribute 2 visible': '1',
+            'Attribute 2 global': '0',
+            # ATRIBUT 3: Brand Piesa (brand real, nu calitate)
+            'Attribute 3 name': 'Brand Piesa',
+            'Attribute 3 value(s)': brand_real,
+            'Attribute 3 visible': '1',
+            'Attribute 3 global': '0',
+            # ATRIBUT 4: Tip Produs
+            'Attribute 4 name': 'Tip Produs',
+            'Attribute 4 value(s)': tip_produs,
+            'Attribute 4 visible': '1',
+            'Attribute 4 global': '0',
+            # ATRIBUT 5: Tehnologie
+            'Attribute 5 name': 'Tehnologie',
+            'Attribute 5 value(s)': pa_tehnologie,
+            'Attribute 5 visible': '1',
+            'Attribute 5 global': '0',
+            # ACF META (EAN / SKU furnizor – cifre)
+            'meta:gtin_ean': ean_text,
+            'meta:sku_furnizor': sku_furnizor,
+            'meta:furnizor_activ': product.get('furnizor_activ', 'mobilesentrix'),
+            'meta:pret_achizitie': f"{price_eur:.2f}",  # preț achiziție în EUR (de pe site furnizor)
+            'meta:locatie_stoc': locatie_stoc,
+            'meta:garantie_luni': warranty_months,
+            'meta:coduri_compatibilitate': product.get('coduri_compatibilitate', ''),
+            'meta:ic_movable': ic_movable_val,
+            'meta:truetone_support': truetone_val,
+            'meta:source_url': product.get('source_url', ''),  # MEREU din scrape (link MobileSentrix) – nu se modifică
+            # SEO RANK MATH
+            'meta:rank_math_title': text['seo_title'][:60],
+            'meta:rank_math_description': text['seo_description'][:160],
+            'meta:rank_math_focus_keyword': text['seo_keyword'],
+        }
+
+    def _open_webgsm_csv(self, filename):
+        """Writer CSV WebGSM incremental în data/<filename> (fișierul se creează la primul rând)."""
+        return StreamingCsvWriter(self._script_dir / "data" / filename, WEBGSM_CSV_FIELDNAMES)
+
+    def _log_csv_done(self, csv_path, rows_count):
+        """Sumar după închiderea CSV-ului WebGSM."""
+        self.log(f"✓ CSV WebGSM creat cu succes: {csv_path}", "SUCCESS")
+        self.log(f"   📊 Total produse exportate: {rows_count}", "INFO")
+        self.log(f"   📋 Coloane CSV: {len(WEBGSM_CSV_FIELDNAMES)} (atribute + ACF + SEO)", "INFO")
+        if rows_count > 30:
+            self.log(f"   💡 Import mai rapid pe site: importă în batch-uri (ex. 30–50 produse/CSV) sau mărește max_execution_time pe server.", "INFO")
+
+    def _iter_enriched(self, products_data, ollama_ok):
+        """(idx, produs, texte) în ordinea listei. Cu Ollama și OLLAMA_PARALLEL > 1, generările rulează într-un pool
+        cu maxim 2×OLLAMA_PARALLEL produse în zbor; altfel secvențial, ca înainte."""
+        workers = self._ollama_parallel() if ollama_ok else 1
+        if workers <= 1:
+            for idx, product in enumerate(products_data, 1):
+                yield idx, product, self._enrich_product_text(product, ollama_ok)
+            return
+
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.log(f"⚡ Ollama paralel: {workers} produse generate simultan (ordinea din CSV se păstrează)", "INFO")
+        pending = deque()
+        items_iter = iter(enumerate(products_data, 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ollama") as executor:
+            def fill():
+                while len(pending) < workers * 2:
+                    nxt = next(items_iter, None)
+                    if nxt is None:
+                        return
+                    idx, product = nxt
+                    pending.append((idx, product, executor.submit(self._enrich_product_text, product, ollama_ok)))
+
+            try:
+                fill()
+                while pending:
+                    idx, product, future = pending.popleft()
+                    yield idx, product, future.result()
+                    fill()
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+
+    def export_to_csv(self, products_data, filename="export_produse.csv"):
+        """Exportă produsele în CSV format WebGSM cu atribute, ACF meta și SEO Rank Math.
+        Variantă secvențială (enrich → upload → rând per produs; doar generările Ollama pot rula în paralel cu
+        OLLAMA_PARALLEL); run_import folosește pipeline-ul cu etape.
+        Rândurile se scriu pe disc pe măsură ce sunt gata – la eroare rămâne un CSV parțial valid."""
+        csv_writer = self._open_webgsm_csv(filename)
+        try:
+            self.log(f"📄 Creez fișier CSV WebGSM: {csv_writer.path}", "INFO")
+            self.log(f"⏳ Procesez {len(products_data)} produse cu upload imagini pe WordPress...", "INFO")
+            ollama_ok = self._log_text_engine()
+            if ollama_ok:
+                self.warm_up_ollama()
+                self.prefetch_ollama_fields(products_data)
+            else:
+                self.prefetch_translations(products_data)
+            csv_writer.open()
+            for idx, product, text in self._iter_enriched(products_data, ollama_ok):
+                self.log(f"🔄 Proceseaza produs {idx}/{len(products_data)}: {product.get('name', 'N/A')}", "INFO")
+                image_urls, _ = self._upload_product_images(product, text, idx)
+                csv_writer.write_row(self._build_csv_row(product, text, image_urls))
+
+            csv_path = csv_writer.close()
+            self._log_csv_done(csv_path, csv_writer.rows_written)
+            return csv_path
 
         except Exception as e:
             self.log(f"✗ Eroare creare CSV: {e}", "ERROR")
             import traceback
             self.log(f"   Traceback: {traceback.format_exc()}", "ERROR")
+            partial = csv_writer.close()
+            if partial and csv_writer.rows_written:
+                self.log(f"   💾 CSV parțial păstrat ({csv_writer.rows_written} rânduri): {partial}", "WARNING")
             return None
 
     def export_images_only_to_csv(self, products_images_data, filename="export_produse_images_only.csv"):
@@ -4572,25 +5048,7 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
             self.log(f"📄 Creez fișier CSV WebGSM (doar imagini): {csv_path}", "INFO")
 
             # Header identic cu export_to_csv
-            fieldnames = [
-                'ID', 'Type', 'SKU', 'GTIN, UPC, EAN, or ISBN', 'Name', 'Published', 'Is featured?',
-                'Visibility in catalog', 'Short description', 'Description',
-                'Tax status', 'Tax class', 'In stock?', 'Stock', 'Low stock amount', 'Backorders allowed?',
-                'Regular price', 'Categories', 'Tags', 'Images', 'Parent', 'Allow customer reviews?',
-                # ATRIBUTE WOOCOMMERCE (5 atribute x 4 coloane)
-                'Attribute 1 name', 'Attribute 1 value(s)', 'Attribute 1 visible', 'Attribute 1 global',
-                'Attribute 2 name', 'Attribute 2 value(s)', 'Attribute 2 visible', 'Attribute 2 global',
-                'Attribute 3 name', 'Attribute 3 value(s)', 'Attribute 3 visible', 'Attribute 3 global',
-                'Attribute 4 name', 'Attribute 4 value(s)', 'Attribute 4 visible', 'Attribute 4 global',
-                'Attribute 5 name', 'Attribute 5 value(s)', 'Attribute 5 visible', 'Attribute 5 global',
-                # ACF META
-                'meta:gtin_ean', 'meta:sku_furnizor', 'meta:furnizor_activ',
-                'meta:pret_achizitie', 'meta:locatie_stoc', 'meta:garantie_luni',
-                'meta:coduri_compatibilitate', 'meta:ic_movable', 'meta:truetone_support',
-                'meta:source_url',
-                # SEO RANK MATH
-                'meta:rank_math_title', 'meta:rank_math_description', 'meta:rank_math_focus_keyword'
-            ]
+            fieldnames = WEBGSM_CSV_FIELDNAMES
 
             with open(csv_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
@@ -4829,9 +5287,9 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 
                 # ⬇️ IMPORTANT: Descarcă pagina produsului!
                 self.log(f"   🔄 Se descarcă pagina produsului...", "INFO")
-                response = requests.get(product_link, headers=headers, timeout=30)
+                response = self._page_get(product_link, supplier_name, headers=headers, timeout=30)
                 response.raise_for_status()
-                product_soup = BeautifulSoup(response.content, 'html.parser')
+                product_soup = make_soup(response.content)
             # PASUL 1b: Detectează dacă e SKU (12-13 cifre consecutive)
             elif re.match(r'^\d{10,14}$', ean.strip()):
                 # E SKU/EAN - MobileSentrix acceptă SKU în URL direct!
@@ -4840,9 +5298,9 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 search_url = f"{base_url}/catalogsearch/result/?q={search_sku}"
                 self.log(f"   🔍 Căutare produs cu SKU: {search_sku}", "INFO")
                 
-                response = requests.get(search_url, headers=headers, timeout=30)
+                response = self._page_get(search_url, supplier_name, headers=headers, timeout=30)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 
                 # ===== DEBUG: Salvează HTML pentru inspecție =====
                 debug_file = self._script_dir / "logs" / f"debug_search_{search_sku}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
@@ -4871,15 +5329,15 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 
                 # ⬇️ IMPORTANT: Descarcă pagina produsului!
                 self.log(f"   🔄 Se descarcă pagina produsului...", "INFO")
-                response = requests.get(product_link, headers=headers, timeout=30)
+                response = self._page_get(product_link, supplier_name, headers=headers, timeout=30)
                 response.raise_for_status()
-                product_soup = BeautifulSoup(response.content, 'html.parser')
+                product_soup = make_soup(response.content)
             else:
                 # E text generic EAN/SKU - trebuie să căutam
                 search_url = f"{base_url}/catalogsearch/result/?q={ean.strip()}"
-                response = requests.get(search_url, headers=headers, timeout=30)
+                response = self._page_get(search_url, supplier_name, headers=headers, timeout=30)
                 response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content)
                 
                 # ===== DEBUG: Salvează HTML pentru inspecție =====
                 debug_file = self._script_dir / "logs" / f"debug_search_{ean}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
@@ -4907,9 +5365,9 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 
                 # ⬇️ IMPORTANT: Descarcă pagina produsului!
                 self.log(f"   🔄 Se descarcă pagina produsului...", "INFO")
-                response = requests.get(product_link, headers=headers, timeout=30)
+                response = self._page_get(product_link, supplier_name, headers=headers, timeout=30)
                 response.raise_for_status()
-                product_soup = BeautifulSoup(response.content, 'html.parser')
+                product_soup = make_soup(response.content)
             
             # Extrage ID produs intern (230473) - unic pe MobileSentrix
             product_id_internal = None
@@ -4938,6 +5396,10 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
             
             # Salvează HTML pentru SKU extraction din JavaScript
             product_page_html = str(product_soup)
+            # JSON-LD / microdata / var ecommerce – înaintea selectorilor DOM
+            structured = dict(structured_product(product_soup))
+            if structured.get("currency") not in (None, "", "EUR"):
+                structured.pop("price", None)
             
             # ===== DEBUG: Salvează HTML produsului =====
             debug_product_file = self._script_dir / "logs" / f"debug_product_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
@@ -4946,7 +5408,9 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
             self.log(f"   📝 HTML produs salvat: {debug_product_file}", "INFO")
             
             # Extrage nume produs - MULTIPLI SELECTORII
-            product_name = None
+            product_name = structured.get("name")
+            if product_name:
+                self.log("   ✓ Nume găsit în date structurate", "INFO")
             name_selectors = [
                 '.page-title span',
                 'h1.page-title',
@@ -4956,12 +5420,13 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 '.product-info-main h1'
             ]
             
-            for selector in name_selectors:
-                name_elem = product_soup.select_one(selector)
-                if name_elem:
-                    product_name = name_elem.text.strip()
-                    self.log(f"   ✓ Nume găsit cu: {selector}", "INFO")
-                    break
+            if not product_name:
+                for selector in name_selectors:
+                    name_elem = product_soup.select_one(selector)
+                    if name_elem:
+                        product_name = name_elem.text.strip()
+                        self.log(f"   ✓ Nume găsit cu: {selector}", "INFO")
+                        break
             
             if not product_name:
                 product_name = f"Produs {ean}"
@@ -4977,7 +5442,9 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
             product_name = product_name.strip()
             
             # Extrage preț (EUR) - MULTIPLI SELECTORII
-            price = 0.0
+            price = structured.get("price", 0.0)
+            if price:
+                self.log("   ✓ Preț găsit în date structurate", "INFO")
             price_selectors = [
                 '.price-wrapper .price',
                 '.product-info-price .price',
@@ -4988,17 +5455,18 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 '[itemprop="price"]'
             ]
             
-            for selector in price_selectors:
-                price_elem = product_soup.select_one(selector)
-                if price_elem:
-                    price_text = price_elem.text.strip()
-                    # Extrage doar numerele și convertește la float
-                    import re
-                    price_match = re.search(r'[\d,\.]+', price_text.replace(',', '.'))
-                    if price_match:
-                        price = float(price_match.group(0))
-                        self.log(f"   ✓ Preț găsit cu: {selector}", "INFO")
-                        break
+            if not price:
+                for selector in price_selectors:
+                    price_elem = product_soup.select_one(selector)
+                    if price_elem:
+                        price_text = price_elem.text.strip()
+                        # Extrage doar numerele și convertește la float
+                        import re
+                        price_match = re.search(r'[\d,\.]+', price_text.replace(',', '.'))
+                        if price_match:
+                            price = float(price_match.group(0))
+                            self.log(f"   ✓ Preț găsit cu: {selector}", "INFO")
+                            break
             
             if price == 0.0:
                 self.log(f"   ⚠️ NU am găsit preț - folosesc 0.00", "WARNING")
@@ -5176,8 +5644,10 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                     """Descarcă și optimizează o imagine (rulează în thread separat)."""
                     idx, url = args
                     try:
-                        img_response = requests.get(url, headers=headers, timeout=15)
-                        img_response.raise_for_status()
+                        with self._metric_timer('image_download'):
+                            img_response = self._http_session().get(url, headers=headers, timeout=15)
+                            img_response.raise_for_status()
+                        resize_started = time.perf_counter()
 
                         img = Image.open(BytesIO(img_response.content))
 
@@ -5207,6 +5677,8 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                             img_path = self._script_dir / "images" / img_filename
                             img.save(img_path, 'JPEG', quality=85, optimize=True)
                         file_size = img_path.stat().st_size / (1024 * 1024)
+                        if self.metrics:
+                            self.metrics.record('image_resize', time.perf_counter() - resize_started)
 
                         return {
                             'success': True,
@@ -5268,12 +5740,14 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 self.log(f"   ⚠️ Nu am putut extrage SKU din JavaScript: {sku_extract_error}", "WARNING")
 
             # 🔢 EXTRAGE EAN REAL (COD DE BARE 8-14 CIFRE) DE PE PAGINA MOBILESENTRIX
-            extracted_ean = ''
+            extracted_ean = structured.get("gtin", '')
+            if extracted_ean:
+                self.log(f"   ✓ EAN extras din date structurate: {extracted_ean}", "SUCCESS")
             try:
                 import re, json
 
-                # 1. JSON-LD structured data: "gtin13", "gtin", "gtin14", "ean"
-                json_ld_scripts = product_soup.find_all('script', type='application/ld+json')
+                # 1. JSON-LD structured data: "gtin13", "gtin", "gtin14", "ean" (+ mpn / sku numerice)
+                json_ld_scripts = [] if extracted_ean else product_soup.find_all('script', type='application/ld+json')
                 for script in json_ld_scripts:
                     try:
                         data = json.loads(script.string)
@@ -5317,7 +5791,7 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
 
                 # 3. HTML: text vizibil pe pagină "EAN:", "Barcode:", "UPC:"
                 if not extracted_ean:
-                    page_text = product_soup.get_text()
+                    page_text = soup_text(product_soup)
                     ean_text_match = re.search(
                         r'(?:EAN|Barcode|UPC|GTIN|ISBN)[\s:]*(\d{8,14})',
                         page_text, re.IGNORECASE
@@ -5539,7 +6013,7 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
             category_path = self.detect_category(product_name, tags)
 
             # ===== Disponibilitate: in_stock / preorder / out_of_stock =====
-            page_text = product_soup.get_text()
+            page_text = soup_text(product_soup)
             availability = self.detect_availability(product_soup, page_text)
             if availability == 'in_stock':
                 locatie_stoc = 'depozit_central'
@@ -5635,6 +6109,85 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
             return url
         return url.replace('webgsm.ro/test/', 'webgsm.ro/').replace('www.webgsm.ro/test/', 'www.webgsm.ro/')
 
+    def _metric_timer(self, stage):
+        """Context manager de măsurare în self.metrics (no-op în afara unei rulări)."""
+        from contextlib import nullcontext
+        return self.metrics.timer(stage) if self.metrics else nullcontext()
+
+    def _metric_bytes(self, stage, count):
+        if self.metrics:
+            self.metrics.add_bytes(stage, count)
+
+    def _http_session(self):
+        """Session keep-alive partajat (pagini MobileSentrix, imagini, upload WordPress) – conexiunile
+        TCP+TLS se refolosesc între produse; pool dimensionat pentru scrape_workers × 4 imagini paralele."""
+        with self._http_lock:
+            if self._http is None:
+                self._http = build_http_session(
+                    pool_size=16, on_bytes=lambda host, count: self._metric_bytes(f"http.{host}", count)
+                )
+            return self._http
+
+    def _ollama_parallel(self):
+        """Câte generări Ollama pot rula simultan (OLLAMA_PARALLEL în .env, 1-8; implicit 1 = secvențial)."""
+        try:
+            return max(1, min(int(self.config.get('OLLAMA_PARALLEL', 1) or 1), 8))
+        except (TypeError, ValueError):
+            return 1
+
+    def _ollama_post(self, url, **kwargs):
+        """POST la Ollama prin sesiunea partajată: o reîncercare la timeout / 5xx, iar după 3 eșecuri consecutive
+        circuit breaker-ul oprește apelurile 2 minute (produsele trec imediat pe traducerea Google).
+        Limiter-ul host-ului ține cel mult OLLAMA_PARALLEL cereri în zbor (restul așteaptă un loc liber)."""
+        host = host_label(url)
+        parallel = self._ollama_parallel()
+        with self._http_lock:
+            if self._ollama_host != (host, parallel):
+                self._ollama_host = (host, parallel)
+                configure_host(
+                    host, requests_per_second=50, max_in_flight=parallel,
+                    on_backoff=lambda h, reason: self.log(f"   🐢 Ollama ({h}): {reason}", "WARNING"),
+                )
+                configure_retry(
+                    host,
+                    # Generarea nu modifică nimic pe server → POST poate fi repetat fără efecte duble
+                    RetryPolicy(max_attempts=2, retry_statuses=(500, 502, 503, 504), retry_read_timeouts=True,
+                                retry_methods=IDEMPOTENT_METHODS | {"POST"}),
+                    failure_threshold=3,
+                    reset_after=120,
+                    on_change=lambda h, message: self.log(f"🔌 Ollama ({h}): circuit {message}", "WARNING"),
+                )
+        return self._http_session().post(url, **kwargs)
+
+    def _page_cache(self, supplier_name):
+        """HttpCache pentru paginile furnizorului (http_cache_ttl_hours din config.json; None = dezactivat)."""
+        with self._http_lock:
+            if self._page_caches is None:
+                self._page_caches = {}
+            if supplier_name not in self._page_caches:
+                supplier_config = (ScraperFactory.load_supplier_config(supplier_name) if ScraperFactory else None) or {}
+                ttl_hours = supplier_config.get("http_cache_ttl_hours")
+                self._page_caches[supplier_name] = None if ttl_hours is None or ttl_hours is False else HttpCache(
+                    self._script_dir / "cache" / "http" / supplier_name,
+                    ttl_seconds=float(ttl_hours) * 3600,
+                    on_event=lambda kind: self.metrics and self.metrics.incr(f"http_cache.{kind}"),
+                )
+            return self._page_caches[supplier_name]
+
+    def _page_cache_summary(self, supplier_name):
+        page_cache = (self._page_caches or {}).get(supplier_name)
+        if page_cache is None or not any(page_cache.stats.values()):
+            return None
+        return page_cache.summary()
+
+    def _page_get(self, url, supplier_name, **kwargs):
+        """GET pagină furnizor prin cache-ul pe disc (revalidare ETag / Last-Modified după TTL)."""
+        page_cache = self._page_cache(supplier_name)
+        if page_cache is None:
+            return self._http_session().get(url, **kwargs)
+        return page_cache.fetch(self._http_session(), url, **kwargs)
+
+    @timed("wp_upload")
     def upload_image_to_wordpress(self, local_image_path):
         """Uploadează imagine din folder local pe server WordPress/WooCommerce"""
         try:
@@ -5675,10 +6228,12 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                 self.log(f"         ⚠️ Adaugă în .env: WP_USERNAME și WP_APP_PASSWORD (parolă din Users → Profil → Application Passwords)", "WARNING")
                 return None
             
-            # Încearcă upload cu Application Password
+            # Upload cu Application Password – sesiunea reîncearcă POST-ul doar la 429 și 503 cu Retry-After
+            # (cererea refuzată, respectând Retry-After); nu și la alte 5xx / conexiune căzută – WordPress poate
+            # să fi salvat deja fișierul și s-ar crea atașamente duplicate
             self.log(f"      📤 Upload: {local_path.name} ({len(file_data)/1024:.1f}KB)...", "INFO")
             
-            response = requests.post(
+            response = self._http_session().post(
                 media_url,
                 data=file_data,
                 headers=headers,
@@ -5688,6 +6243,7 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
             )
             
             if response.status_code in [200, 201]:
+                self._metric_bytes('wp_upload', len(file_data))
                 media_data = response.json()
                 media_id = media_data.get('id')
                 media_url_result = self._normalize_image_url(media_data.get('source_url'))
@@ -5708,24 +6264,6 @@ TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g
                     self.log(f"         → 401: Folosește în .env utilizatorul WordPress real (ex: admin) la WP_USERNAME și parola de aplicație la WP_APP_PASSWORD (NU Consumer Key/Secret).", "WARNING")
                 if response.status_code in (301, 302, 307, 308):
                     self.log("         → Redirect la upload: verifică să fie WOOCOMMERCE_URL cu https și fără /test.", "WARNING")
-                # Retry o singură dată la erori de server sau timeout
-                if response.status_code >= 500 or response.status_code == 429:
-                    self.log(f"         🔄 Reîncerc upload: {local_path.name}...", "INFO")
-                    try:
-                        r2 = requests.post(
-                            media_url,
-                            data=file_data,
-                            headers=headers,
-                            auth=(wp_username, wp_app_password.replace(' ', '')),
-                            timeout=45,
-                            allow_redirects=False
-                        )
-                        if r2.status_code in [200, 201]:
-                            md = r2.json()
-                            self.log(f"         ✓ ID={md.get('id')} (după retry)", "SUCCESS")
-                            return {'id': md.get('id'), 'src': self._normalize_image_url(md.get('source_url')), 'name': local_path.name}
-                    except Exception as e2:
-                        self.log(f"         ✗ Retry eșuat: {e2}", "WARNING")
                 return None
                 
         except requests.exceptions.Timeout:
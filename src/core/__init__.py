@@ -0,0 +1,22 @@
+# Componente comune pipeline import (fără dependență de GUI)
+from .categories import CategoryEngine, category_engine
+from .csv_stream import StreamingCsvWriter
+from .http import build_http_session
+from .http_cache import HttpCache
+from .journal import RunJournal
+from .keywords import KeywordMatcher, RankedKeywords
+from .logger import LogSink
+from .metrics import RunMetrics, timed
+from .parsing import make_soup, region_strainer, soup_text
+from .pipeline import StagedPipeline
+from .ratelimit import HostLimiter, configure_host
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy, configure_retry
+from .structured_data import structured_product
+from .translation_cache import KeyValueCache, TranslationCache
+
+__all__ = [
+    "CategoryEngine", "CircuitBreaker", "CircuitOpenError", "HostLimiter", "HttpCache", "KeyValueCache", "KeywordMatcher", "LogSink",
+    "RankedKeywords", "RetryPolicy", "RunJournal", "RunMetrics", "StagedPipeline", "StreamingCsvWriter",
+    "TranslationCache", "build_http_session", "category_engine", "configure_host", "configure_retry", "make_soup",
+    "region_strainer", "soup_text", "structured_product", "timed",
+]
@@ -0,0 +1,353 @@
+"""
+Motorul de categorii WooCommerce: slug WebGSM (get_webgsm_category) și calea Woo
+(get_woo_category: Piese > Piese {Brand} > Tip, Unelte > Sub, Accesorii > Sub).
+Toate tabelele de cuvinte cheie sunt compilate într-un singur KeywordMatcher; fiecare text se
+parcurge o singură dată, iar regulile „primul grup din listă care are un cuvânt prezent câștigă”
+se rezolvă din mulțimea de cuvinte găsite (RankedKeywords) – aceeași ordine ca lanțurile
+if any(x in text ...) de dinainte. Verificare: python check_categories.py (category_links.csv).
+
+Regulile din fișier (category_rules.txt: keyword|Cale categorie, prima potrivire câștigă) pentru
+detect_category sunt compilate la fel în KeywordRules; forma compilată se păstrează pe disc
+(cache/category_rules/) și se reconstruiește doar când se schimbă fișierele (mtime / dimensiune).
+"""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .keywords import KeywordMatcher, RankedKeywords, matcher_backend
+
+# Coduri categorie manuale (sku_list: link | COD) – prioritate față de Ollama
+# Ierarhie: PIESE 3 niveluri (Piese > Piese {Brand} > Tip), UNELTE/ACCESORII 2 niveluri
+# Slug-uri categorii NU EXISTĂ în site – nu folosi: accesorii-service, accesorii-service-xiaomi,
+# baterii-iphone-piese, camere-iphone-piese, ecrane-telefoane, baterii-telefoane
+CATEGORY_CODE_MAP = {
+    # PIESE (3 nivele)
+    'SCR': {'cat': 'Ecrane', 'top': 'Piese', 'prefix': 'SCR'},
+    'BAT': {'cat': 'Baterii', 'top': 'Piese', 'prefix': 'BAT'},
+    'CAM': {'cat': 'Camere', 'top': 'Piese', 'prefix': 'CAM'},
+    'CHG': {'cat': 'Mufe Încărcare', 'top': 'Piese', 'prefix': 'CHG'},
+    'FLX': {'cat': 'Flexuri', 'top': 'Piese', 'prefix': 'FLX'},
+    'SPK': {'cat': 'Difuzoare', 'top': 'Piese', 'prefix': 'SPK'},
+    'CAS': {'cat': 'Carcase', 'top': 'Piese', 'prefix': 'CAS'},
+    'STC': {'cat': 'Sticlă', 'top': 'Piese', 'prefix': 'STC'},
+    # UNELTE (2 nivele)
+    'TOOL': {'cat': 'Unelte', 'sub': 'Șurubelnițe', 'prefix': 'TOOL'},
+    'PENS': {'cat': 'Unelte', 'sub': 'Pensete', 'prefix': 'PENS'},
+    'SOLD': {'cat': 'Unelte', 'sub': 'Stații Lipit', 'prefix': 'SOLD'},
+    'SEP': {'cat': 'Unelte', 'sub': 'Separatoare Ecrane', 'prefix': 'SEP'},
+    'MICRO': {'cat': 'Unelte', 'sub': 'Microscoape', 'prefix': 'MICRO'},
+    'PROG': {'cat': 'Unelte', 'sub': 'Programatoare', 'prefix': 'PROG'},
+    'KIT': {'cat': 'Unelte', 'sub': 'Kituri Complete', 'prefix': 'KIT'},
+    'EQP': {'cat': 'Unelte', 'prefix': 'EQP'},
+    # ACCESORII (2 nivele)
+    'HUSA': {'cat': 'Accesorii', 'sub': 'Huse & Carcase', 'prefix': 'HUSA'},
+    'FOIL': {'cat': 'Accesorii', 'sub': 'Folii Protecție', 'prefix': 'FOIL'},
+    'CBL': {'cat': 'Accesorii', 'sub': 'Cabluri & Încărcătoare', 'prefix': 'CBL'},
+    'CNS': {'cat': 'Accesorii', 'sub': 'Adezivi & Consumabile', 'prefix': 'CNS'},
+}
+
+# PIESE: tip piesă (nivel 3) – ordinea contează (cele mai specifice primele)
+# SCR, BAT, CAM, CHG, FLX, SPK, CAS conform mapării finale
+PIESE_TIP_KEYWORDS = (
+    (['screen', 'display', 'lcd', 'oled', 'amoled', 'ecran', 'digitizer', 'touch'], 'Ecrane'),
+    (['battery', 'baterie', 'acumulator', 'mah'], 'Baterii'),
+    (['camera', 'cameră', 'megapixel', ' mp ', 'lens'], 'Camere'),
+    (['charging port', 'mufa', 'dock', 'connector', 'lightning', 'usb-c port', 'usb-c', 'conector încărcare'], 'Mufe Încărcare'),
+    (['flex', 'ribbon', 'cable flex', 'flex cable'], 'Flexuri'),
+    (['speaker', 'difuzor', 'earpiece', 'buzzer', 'ringer', 'casca'], 'Difuzoare'),
+    (['housing', 'frame', 'carcasa', 'back cover', 'back glass', 'chassis', 'carcase'], 'Carcase'),
+    (['sticla', 'glass', 'geam'], 'Sticlă'),
+    (['buton', 'button', 'power', 'volume', 'home'], 'Butoane'),
+)
+
+# UNELTE: subcategorii nivel 2 (Unelte > Subcategorie)
+UNELTE_SUBCAT_KEYWORDS = (
+    (['screwdriver', 'surubelnita', 'șurubelniță', 'screw driver'], 'Șurubelnițe'),
+    (['tweezer', 'penseta', 'pensetă', 'pry', 'spudger'], 'Pensete'),
+    (['soldering', 'station', 'lipit', 'hot air', 'rework', 'preheater', 'rework station'], 'Stații Lipit'),
+    (['separator', 'separatoare', 'lcd separator', 'screen separator'], 'Separatoare Ecrane'),
+    (['microscop', 'microscope', 'magnifier', 'lupa'], 'Microscoape'),
+    (['programmer', 'programator', 'box', 'dongle', 'jc', 'jcid'], 'Programatoare'),
+    (['kit', 'set', 'tool set', 'repair kit'], 'Kituri Complete'),
+)
+# Alte cuvinte care indică Unelte (subcategoria vine tot din UNELTE_SUBCAT_KEYWORDS)
+UNELTE_EXTRA_KEYWORDS = ('tool', 'unealtă', 'unealta', 'statie', 'station', 'preheater', 'separator', 'microscop', 'tester',
+                         'diagnostic', 'programmer', 'programator', 'kit', 'repair kit')
+
+# Accesorii: subcategorii nivel 2 (Accesorii > Subcategorie)
+ACCESORII_SUBCAT_KEYWORDS = (
+    (['case', 'husa', 'husă', 'cover', 'bumper', 'carcasă', 'carcasa', 'housing', 'back cover'], 'Huse & Carcase'),
+    (['protector', 'folie', 'tempered', 'glass protector', 'screen protector', 'protector ecran', 'uv film', 'film protector', 'matt privacy', 'privacy film'], 'Folii Protecție'),
+    (['cable', 'cablu', 'charger', 'încărcător', 'incarcator', 'usb', 'lightning cable', 'adapter', 'adaptor'], 'Cabluri & Încărcătoare'),
+    (['adhesive', 'adeziv', 'glue', 'b7000', 't7000', 'oca', 'tape', 'sticker', 'banda', 'consumabil', 'loca'], 'Adezivi & Consumabile'),
+)
+# Prioritate Folii înainte de Unelte (UV film / film protector → Folii Protecție)
+ACCESORII_FOLII_KEYWORDS = ('protector', 'folie', 'tempered', 'glass protector', 'screen protector', 'uv film', 'film protector', 'matt privacy', 'privacy film')
+# Accesorii fără subcategorie clară → Adezivi & Consumabile
+ACCESORII_EXTRA_KEYWORDS = ('case', 'husa', 'cable', 'charger', 'adeziv', 'tape', 'b7000', 'folie', 'protector', 'cover', 'bumper')
+
+# Brand pentru ramura Piese (Piese > Piese {Brand} > ...) – ordinea = prioritatea
+CATEGORY_BRAND_KEYWORDS = (
+    (['iphone', 'apple'], 'iPhone'),
+    (['samsung', 'galaxy'], 'Samsung'),
+    (['huawei', 'honor'], 'Huawei'),
+    (['xiaomi', 'redmi', 'poco'], 'Xiaomi'),
+    (['oneplus'], 'OnePlus'),
+    (['google', 'pixel'], 'Google'),
+    (['motorola', 'moto '], 'Motorola'),
+    (['ipad'], 'iPad'),
+)
+
+# Slug WebGSM: brand (pentru sufixul -iphone / -samsung ...)
+WEBGSM_BRAND_KEYWORDS = (
+    (['iphone', 'apple', 'ios'], 'iphone'),
+    (['samsung', 'galaxy'], 'samsung'),
+    (['huawei', 'honor', 'mate ', 'p30', 'p40', 'p50', 'p60'], 'huawei'),
+    (['xiaomi', 'redmi', 'poco', 'mi '], 'xiaomi'),
+    (['pixel', 'google'], 'google'),
+    (['oneplus', 'one plus'], 'oneplus'),
+)
+# Slug WebGSM: primul grup găsit decide; dict = slug per brand (restul → 'piese')
+WEBGSM_SLUG_RULES = (
+    # PIESE
+    (['ecran', 'display', 'lcd', 'oled', 'screen', 'touchscreen'],
+     {'iphone': 'ecrane-iphone', 'samsung': 'ecrane-samsung', 'huawei': 'ecrane-huawei', 'xiaomi': 'ecrane-xiaomi'}),
+    (['baterie', 'battery', 'acumulator', 'accumulator'],
+     {'iphone': 'baterii-iphone', 'samsung': 'baterii-samsung', 'huawei': 'baterii-huawei', 'xiaomi': 'baterii-xiaomi'}),
+    (['camera', 'cameră', 'foto', 'lens', 'lentila'],
+     {'iphone': 'camere-iphone', 'samsung': 'camere-samsung', 'huawei': 'camere-huawei', 'xiaomi': 'camere-xiaomi'}),
+    (['mufă', 'mufa', 'charging port', 'port încărcare', 'usb-c', 'lightning connector', 'dock connector'],
+     {'iphone': 'mufe-incarcare-iphone', 'samsung': 'mufe-incarcare-samsung'}),
+    (['flex', 'cablu flex', 'ribbon', 'flat cable'], {'iphone': 'flexuri-iphone', 'samsung': 'flexuri-samsung'}),
+    (['carcasă', 'carcasa', 'back cover', 'housing', 'back glass', 'capac spate'], {'iphone': 'carcase-iphone'}),
+    (['difuzor', 'speaker', 'buzzer', 'earpiece', 'loud speaker'], {'iphone': 'difuzoare-iphone'}),
+    # UNELTE
+    (['șurubelniță', 'surubelnita', 'screwdriver', 'torx', 'pentalobe', 'phillips'], 'surubelnite'),
+    (['pensetă', 'penseta', 'tweezer', 'pincetă'], 'pensete'),
+    (['stație lipit', 'statie lipit', 'soldering station', 'hot air', 'pistol aer cald'], 'statii-lipit'),
+    (['separator', 'lcd separator', 'screen separator'], 'separatoare-ecrane'),
+    (['microscop', 'microscope', 'lupa', 'magnifier'], 'microscoape'),
+    (['programator', 'programmer', 'box', 'jc', 'qianli', 'i2c'], 'programatoare'),
+    (['kit', 'set complet', 'tool kit'], 'kituri-complete'),
+    # ACCESORII
+    (['husă', 'husa', 'case', 'cover', 'protector'], 'huse-carcase'),
+    (['folie', 'screen protector', 'tempered glass', 'sticlă securizată'], 'folii-protectie'),
+    (['cablu', 'cable', 'încărcător', 'charger', 'adaptor', 'adapter'], 'cabluri-incarcatoare'),
+    (['adeziv', 'adhesive', 'b7000', 't7000', 'b8000', 'banda dublu adezivă', 'sticker'], 'adezivi-consumabile'),
+    # DISPOZITIVE
+    (['telefon second', 'second hand', 'folosit', 'used phone'], 'telefoane-folosite'),
+    (['refurbished', 'recondiționat', 'renewed'], 'telefoane-refurbished'),
+    (['tabletă', 'tablet', 'ipad'], 'tablete'),
+    (['smartwatch', 'ceas smart', 'apple watch', 'galaxy watch'], 'smartwatch'),
+)
+# Nimic specific: brand cunoscut → piese-{brand}, altfel piese
+WEBGSM_DEFAULT_SLUGS = {'iphone': 'piese-iphone', 'samsung': 'piese-samsung', 'huawei': 'piese-huawei', 'xiaomi': 'piese-xiaomi'}
+
+UNCATEGORIZED = "Uncategorized"
+
+
+class CategoryDecision(NamedTuple):
+    slug: str
+    woo_path: str
+
+
+def _ranked(groups: Iterable[Tuple[Sequence[str], Any]]) -> RankedKeywords:
+    return RankedKeywords((kw, value) for keywords, value in groups for kw in keywords)
+
+
+class CategoryEngine:
+    """Tabelele de mai sus compilate o singură dată (vezi category_engine())."""
+
+    def __init__(self):
+        self._webgsm_brand = _ranked(WEBGSM_BRAND_KEYWORDS)
+        self._webgsm_rules = _ranked(WEBGSM_SLUG_RULES)
+        self._brand = _ranked(CATEGORY_BRAND_KEYWORDS)
+        self._piese_tip = _ranked(PIESE_TIP_KEYWORDS)
+        self._unelte = _ranked(UNELTE_SUBCAT_KEYWORDS)
+        self._accesorii = _ranked(ACCESORII_SUBCAT_KEYWORDS)
+        self._folii = frozenset(ACCESORII_FOLII_KEYWORDS)
+        self._unelte_extra = frozenset(UNELTE_EXTRA_KEYWORDS)
+        self._accesorii_extra = frozenset(ACCESORII_EXTRA_KEYWORDS)
+        keywords: List[str] = []
+        for table in (self._webgsm_brand, self._webgsm_rules, self._brand, self._piese_tip, self._unelte,
+                      self._accesorii):
+            keywords.extend(table.keywords)
+        keywords.extend(self._folii | self._unelte_extra | self._accesorii_extra)
+        self._matcher = KeywordMatcher(keywords)
+
+    def found(self, text: str) -> Set[str]:
+        """Cuvintele cheie (din toate tabelele) prezente în text – o singură parcurgere."""
+        return self._matcher.found(text)
+
+    # —— Slug WebGSM ——
+    def webgsm_slug(self, product_name: str, product_type: str = '', description: str = '') -> str:
+        text = ((product_name or '') + ' ' + (description or '') + ' ' + (product_type or '')).lower()
+        return self.webgsm_slug_from(self.found(text))
+
+    def webgsm_slug_from(self, found: Set[str]) -> str:
+        brand = self._webgsm_brand.best(found)
+        rule = self._webgsm_rules.best(found)
+        if isinstance(rule, dict):
+            return rule.get(brand, 'piese')
+        if rule:
+            return rule
+        return WEBGSM_DEFAULT_SLUGS.get(brand, 'piese')
+
+    # —— Cale Woo ——
+    def brand(self, found: Set[str]) -> Optional[str]:
+        return self._brand.best(found)
+
+    def piese_tip(self, found: Set[str]) -> str:
+        return self._piese_tip.best(found, 'Alte Piese')
+
+    def unelte_sub(self, found: Set[str]) -> str:
+        return self._unelte.best(found, 'Șurubelnițe')
+
+    def accesorii_sub(self, found: Set[str]) -> str:
+        return self._accesorii.best(found, 'Adezivi & Consumabile')
+
+    def woo_path(self, product_name: str, product_type: str = '', manual_code: Optional[str] = None,
+                 description: str = '', url_slug: str = '', tags: str = '') -> str:
+        """Calea Woo; UNCATEGORIZED când nimic nu se potrivește (apelantul loghează pentru review)."""
+        name_lower = (product_name or '').lower()
+        type_lower = (product_type or '').lower()
+        slug_lower = (url_slug or '').replace('-', ' ').lower()
+        desc_snippet = (description or '')[:500].lower()
+        tags_lower = (tags or '').lower()
+        # Prioritate: titlu > slug > descriere > taguri (toate în combined pentru matching)
+        combined = ' '.join(filter(None, [name_lower, type_lower, slug_lower, desc_snippet, tags_lower]))
+        return self.woo_path_from(self.found(name_lower), self.found(combined), manual_code)
+
+    def woo_path_from(self, name_found: Set[str], found: Set[str], manual_code: Optional[str] = None) -> str:
+        brand = self.brand(name_found) or self.brand(found)
+
+        # —— Prioritate: cod manual din sku_list (link | COD) ——
+        if manual_code and isinstance(manual_code, str):
+            m = CATEGORY_CODE_MAP.get(manual_code.strip().upper())
+            if m:
+                top = m.get('top') or m.get('cat')
+                if top == 'Piese':
+                    return f"Piese > Piese {brand or 'iPhone'} > {m.get('cat', '')}"
+                if m.get('cat') == 'Unelte':
+                    return f"Unelte > {m.get('sub') or self.unelte_sub(found)}"
+                if m.get('cat') == 'Accesorii':
+                    return f"Accesorii > {m.get('sub', 'Adezivi & Consumabile')}"
+                if m.get('sub'):
+                    return f"Accesorii > {m.get('sub')}"
+                return f"Unelte > {self.unelte_sub(found)}"
+
+        # —— Auto: PIESE (3 nivele) – detectare BRAND + TIP ——
+        if brand:
+            return f"Piese > Piese {brand} > {self.piese_tip(found)}"
+        # —— Auto: ACCESORII Folii ÎNAINTE de Unelte ——
+        if found & self._folii:
+            return "Accesorii > Folii Protecție"
+        # —— Auto: UNELTE (2 nivele) ——
+        if self._unelte.best(found) or found & self._unelte_extra:
+            return f"Unelte > {self.unelte_sub(found)}"
+        # —— Auto: ACCESORII (2 nivele) – doar dacă avem keyword accesorii ——
+        sub = self.accesorii_sub(found)
+        if sub != 'Adezivi & Consumabile' or found & self._accesorii_extra:
+            return f"Accesorii > {sub}"
+        return UNCATEGORIZED
+
+    def classify(self, product_name: str, product_type: str = '', description: str = '', url_slug: str = '',
+                 tags: str = '', manual_code: Optional[str] = None) -> CategoryDecision:
+        """Slug WebGSM + cale Woo pentru același produs."""
+        return CategoryDecision(
+            self.webgsm_slug(product_name, product_type, description),
+            self.woo_path(product_name, product_type, manual_code, description, url_slug, tags),
+        )
+
+
+_engine: Optional[CategoryEngine] = None
+
+
+def category_engine() -> CategoryEngine:
+    """Instanța comună (tabelele se compilează la primul apel)."""
+    global _engine
+    if _engine is None:
+        _engine = CategoryEngine()
+    return _engine
+
+
+class KeywordRules:
+    """Reguli (keyword, cale) în ordinea din fișier, compilate; iterabil ca lista de tupluri de dinainte."""
+
+    def __init__(self, rules: Iterable[Tuple[str, str]]):
+        self.rules: List[Tuple[str, str]] = list(rules)
+        self._table = RankedKeywords(self.rules)
+        self._table.first_in("")  # construiește automatul acum (și îl include în cache-ul pe disc)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return iter(self.rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def match(self, haystack: str, default: str = UNCATEGORIZED) -> str:
+        """Calea primei reguli (în ordinea din fișier) al cărei keyword apare în haystack (lowercase)."""
+        return self._table.first_in(haystack, default)
+
+
+def parse_keyword_rules(path: Path) -> List[Tuple[str, str]]:
+    """Linii `keyword|Cale > Categorie`; # = comentariu; keyword-ul se normalizează la lowercase."""
+    rules = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split('|')
+            if len(parts) >= 2:
+                keyword = parts[0].strip().lower()
+                category_path = parts[1].strip()
+                if keyword and category_path:
+                    rules.append((keyword, category_path))
+    return rules
+
+
+_RULES_CACHE_VERSION = 1
+
+
+def load_keyword_rules(paths: Sequence[Path], cache_dir: Optional[Path] = None) -> KeywordRules:
+    """
+    Concatenează regulile din paths (ordinea fișierelor = prioritatea) și le compilează.
+    Cu cache_dir, automatul compilat e salvat cu semnătura fișierelor (cale, mtime, dimensiune) și
+    refolosit la pornirile următoare cât timp fișierele nu s-au schimbat.
+    """
+    paths = [Path(p) for p in paths if Path(p).is_file()]
+    signature = [_RULES_CACHE_VERSION, matcher_backend()]
+    for path in paths:
+        stat = path.stat()
+        signature.append((str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+    cache_file = None
+    if cache_dir is not None and paths:
+        key = hashlib.sha1("\n".join(str(p.resolve()) for p in paths).encode("utf-8")).hexdigest()[:12]
+        cache_file = Path(cache_dir) / f"rules_{key}.pkl"
+        try:
+            with open(cache_file, "rb") as f:
+                cached_signature, cached_rules = pickle.load(f)
+            if cached_signature == signature and isinstance(cached_rules, KeywordRules):
+                return cached_rules
+        except Exception:
+            pass  # lipsă / versiune veche / corupt → recompilare
+
+    rules = []
+    for path in paths:
+        rules.extend(parse_keyword_rules(path))
+    compiled = KeywordRules(rules)
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump((signature, compiled), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except Exception:
+            pass  # cache-ul e doar o optimizare
+    return compiled
@@ -0,0 +1,65 @@
+"""
+Scriere CSV incrementală: fiecare rând e scris și golit pe disc imediat ce produsul e gata.
+Memoria rămâne constantă indiferent de mărimea batch-ului, iar la Stop / crash
+fișierul conține header + toate rândurile complete scrise până atunci (CSV valid).
+"""
+import csv
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class StreamingCsvWriter:
+    """Writer CSV (utf-8-sig, QUOTE_ALL – ca exportul WebGSM) cu flush după fiecare rând."""
+
+    def __init__(self, path, fieldnames: List[str], fsync: bool = False):
+        self.path = Path(path)
+        self.fieldnames = list(fieldnames)
+        self.fsync = fsync
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+
+    def open(self) -> "StreamingCsvWriter":
+        """Creează fișierul și scrie header-ul. Apelată automat la primul write_row."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", newline="", encoding="utf-8-sig")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, quoting=csv.QUOTE_ALL)
+            self._writer.writeheader()
+            self._flush()
+        return self
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def write_row(self, row: Dict[str, str]) -> None:
+        """Scrie un rând complet și îl golește pe disc."""
+        if self._file is None:
+            self.open()
+        self._writer.writerow(row)
+        self._flush()
+        self.rows_written += 1
+
+    def close(self) -> Optional[str]:
+        """Închide fișierul. Returnează calea ca string sau None dacă nu s-a scris nimic."""
+        if self._file is None:
+            return None
+        try:
+            self._file.close()
+        finally:
+            self._file = None
+            self._writer = None
+        return str(self.path)
+
+    def _flush(self) -> None:
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def __enter__(self) -> "StreamingCsvWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
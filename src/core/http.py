@@ -0,0 +1,149 @@
+"""
+Sesiuni HTTP partajate (keep-alive) pentru scraping și descărcare imagini.
+Un requests.Session refolosit păstrează conexiunile TCP+TLS deschise între pagini și imagini
+de pe același host; pool-ul e dimensionat după numărul de workeri (scrape_workers × imagini paralele).
+Fiecare request trece prin limiter-ul host-ului (src/core/ratelimit.py), dacă furnizorul l-a configurat,
+și prin politica de retry + circuit breaker a host-ului (src/core/retry.py).
+"""
+import sys
+import threading
+import time
+import weakref
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .ratelimit import limiter_for, parse_retry_after
+from .retry import retry_for
+
+try:  # urllib3 decodează "br" doar dacă e instalat brotli / brotlicffi
+    import brotli  # noqa: F401
+    _BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _BROTLI = True
+    except ImportError:
+        _BROTLI = False
+
+ACCEPT_ENCODING = "gzip, deflate, br" if _BROTLI else "gzip, deflate"
+
+
+def host_label(url: str) -> str:
+    """Host fără "www." – folosit ca nume de etapă pentru bytes (ex. http.foneday.shop)."""
+    host = (urlparse(url or "").hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter care ia un loc din limiter-ul host-ului înainte de fiecare încercare, reîncearcă după
+    politica host-ului (429 / 5xx / erori de conexiune; POST doar dacă politica îl permite explicit)
+    și alimentează circuit breaker-ul.
+    """
+
+    def _send_once(self, limiter, request, *args, **kwargs):
+        if limiter is None:
+            return super().send(request, *args, **kwargs)
+        if kwargs.get("stream"):
+            return self._send_streamed(limiter, request, *args, **kwargs)
+        with limiter.slot() as outcome:
+            response = super().send(request, *args, **kwargs)
+            outcome["status"] = response.status_code
+            outcome["retry_after"] = parse_retry_after(response.headers.get("Retry-After"))
+            return response
+
+    def _send_streamed(self, limiter, request, *args, **kwargs):
+        """
+        stream=True: corpul se citește după ce send() a returnat, deci locul din limiter rămâne ocupat până la
+        response.close() (ex. generarea Ollama pe bucăți) – altfel max_in_flight n-ar mai limita nimic.
+        Dacă răspunsul nu e închis explicit, locul se eliberează când obiectul e colectat.
+        """
+        slot = limiter.slot()
+        outcome = slot.__enter__()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except BaseException:
+            slot.__exit__(*sys.exc_info())
+            raise
+        outcome["status"] = response.status_code
+        outcome["retry_after"] = parse_retry_after(response.headers.get("Retry-After"))
+        lock = threading.Lock()
+        released = []
+
+        def release():
+            with lock:
+                if released:
+                    return
+                released.append(True)
+            slot.__exit__(None, None, None)
+
+        close = response.close
+
+        def close_and_release():
+            try:
+                close()
+            finally:
+                release()
+
+        response.close = close_and_release
+        weakref.finalize(response, release)
+        return response
+
+    def send(self, request, *args, **kwargs):
+        host = host_label(request.url)
+        policy, breaker = retry_for(host)
+        # Corp de tip stream (fișier deschis) nu se poate retrimite
+        attempts = 1 if hasattr(request.body, "read") else policy.max_attempts
+        attempt = 0
+        while True:
+            breaker.before_request()
+            try:
+                response = self._send_once(limiter_for(host), request, *args, **kwargs)
+            except requests.exceptions.RequestException as e:
+                breaker.record_failure()
+                if attempt + 1 >= attempts or not policy.retries_error(e, request.method):
+                    raise
+                wait = policy.delay(attempt)
+            except Exception:
+                breaker.record_failure()
+                raise
+            else:
+                status = response.status_code
+                if status >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if not policy.retries_status(status, request.method, retry_after) or attempt + 1 >= attempts:
+                    return response
+                wait = policy.delay(attempt, retry_after)
+                response.close()
+            time.sleep(wait)
+            attempt += 1
+
+
+def build_http_session(pool_size: int = 10, on_bytes: Optional[Callable[[str, int], None]] = None) -> requests.Session:
+    """
+    Session cu pool de conexiuni keep-alive (pool_size conexiuni per host) și compresie gzip/br.
+    on_bytes(host, count): apelat după fiecare răspuns (ne-streamed) – ex. RunMetrics.add_bytes.
+    """
+    pool_size = max(1, int(pool_size))
+    session = requests.Session()
+    adapter = RateLimitedAdapter(pool_connections=max(4, pool_size), pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"})
+    if on_bytes is not None:
+        def _count_bytes(response, *args, **kwargs):
+            if kwargs.get("stream"):
+                return response
+            try:
+                on_bytes(host_label(response.url), len(response.content or b""))
+            except Exception:
+                pass
+            return response
+        session.hooks["response"].append(_count_bytes)
+    return session
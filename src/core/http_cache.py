@@ -0,0 +1,138 @@
+"""
+Cache HTTP pe disc pentru paginile furnizorilor (căutare + produs).
+Cheie = URL + context de autentificare (anonim / utilizator logat), corp comprimat gzip.
+Cât timp intrarea e mai nouă decât TTL-ul furnizorului se servește direct de pe disc;
+după TTL se face GET condiționat (If-None-Match / If-Modified-Since) – 304 înseamnă
+că pagina nu s-a schimbat și se refolosește corpul salvat.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Header-e păstrate împreună cu corpul (restul nu contează pentru parsare)
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Content-Language")
+# Imaginile se salvează oricum în images/ – nu le dublăm în cache
+_SKIPPED_CONTENT_TYPES = ("image/", "video/", "application/octet-stream")
+
+
+class HttpCache:
+    """
+    Cache thread-safe pentru GET-uri. ttl_seconds=0 → fiecare cerere e revalidată (GET condiționat).
+    on_event(kind): apelat la fiecare cerere cu "hit", "revalidated" sau "miss" (ex. RunMetrics.incr).
+    """
+
+    def __init__(self, cache_dir, ttl_seconds: float = 0, on_event: Optional[Callable[[str], None]] = None):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = max(0.0, float(ttl_seconds or 0))
+        self.on_event = on_event
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hit": 0, "revalidated": 0, "miss": 0}
+
+    @staticmethod
+    def key_for(url: str, auth: str = "") -> str:
+        return hashlib.sha1(f"GET {url}\n{auth}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.gz"
+
+    def _count(self, kind: str) -> None:
+        with self._lock:
+            self.stats[kind] = self.stats.get(kind, 0) + 1
+        if self.on_event:
+            try:
+                self.on_event(kind)
+            except Exception:
+                pass
+
+    def _load(self, key: str):
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rb") as f:
+                meta = json.loads(f.readline().decode("utf-8"))
+                body = f.read()
+            return meta, body
+        except (OSError, ValueError, EOFError):
+            return None, None
+
+    def _store(self, key: str, url: str, response: requests.Response) -> None:
+        meta = {
+            "url": url,
+            "final_url": response.url,
+            "stored_at": time.time(),
+            "encoding": response.encoding,
+            "headers": {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers},
+        }
+        self._write(key, meta, response.content)
+
+    def _write(self, key: str, meta: Dict, body: bytes) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            with gzip.open(tmp, "wb", compresslevel=6) as f:
+                f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8") + b"\n")
+                f.write(body)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _cached_response(meta: Dict, body: bytes, kind: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers = CaseInsensitiveDict(meta.get("headers") or {})
+        response.url = meta.get("final_url") or meta.get("url")
+        response.encoding = meta.get("encoding")
+        response.reason = "OK"
+        response.from_cache = kind
+        return response
+
+    def fetch(self, session: requests.Session, url: str, auth: str = "", **kwargs) -> requests.Response:
+        """GET prin cache. Răspunsurile non-200 și imaginile nu se salvează."""
+        key = self.key_for(url, auth)
+        meta, body = self._load(key)
+        if meta is not None:
+            if time.time() - float(meta.get("stored_at", 0)) < self.ttl_seconds:
+                self._count("hit")
+                return self._cached_response(meta, body, "hit")
+            headers = dict(kwargs.pop("headers", None) or {})
+            validators = meta.get("headers") or {}
+            if validators.get("ETag"):
+                headers["If-None-Match"] = validators["ETag"]
+            if validators.get("Last-Modified"):
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+            kwargs["headers"] = headers
+        response = session.get(url, **kwargs)
+        if response.status_code == 304 and meta is not None:
+            meta["stored_at"] = time.time()
+            self._write(key, meta, body)
+            self._count("revalidated")
+            return self._cached_response(meta, body, "revalidated")
+        self._count("miss")
+        content_type = response.headers.get("Content-Type", "").lower()
+        if response.status_code == 200 and not content_type.startswith(_SKIPPED_CONTENT_TYPES):
+            self._store(key, url, response)
+        response.from_cache = None
+        return response
+
+    def hit_rate(self) -> float:
+        with self._lock:
+            total = sum(self.stats.values())
+            served = self.stats.get("hit", 0) + self.stats.get("revalidated", 0)
+        return served / total if total else 0.0
+
+    def summary(self) -> str:
+        with self._lock:
+            stats = dict(self.stats)
+        total = sum(stats.values())
+        return (f"{stats['hit']} hit, {stats['revalidated']} revalidate (304), {stats['miss']} descărcate "
+                f"din {total} cereri – {self.hit_rate() * 100:.0f}% servite din cache")
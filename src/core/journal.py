@@ -0,0 +1,136 @@
+"""
+Jurnal de rulare (checkpoint / resume) pentru importuri lungi.
+Fiecare produs e identificat prin furnizor + linia din sku_list (URL/SKU + cod manual);
+pentru fiecare etapă terminată (scrape, enrich, upload, row) se adaugă o linie JSON
+în logs/journal_<furnizor>_<hash listă>.jsonl. La repornire etapele deja terminate
+se citesc din jurnal (fără re-scrape / re-traducere / re-upload imagini).
+Prima linie e un antet cu ora de start a rulării și hash-ul intrărilor (conținut listă +
+config furnizor); un jurnal prea vechi sau cu alte intrări nu se reia.
+"""
+import hashlib
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Etapele pipeline-ului, în ordine
+JOURNAL_STAGES = ("scrape", "enrich", "upload", "row")
+
+
+class RunJournal:
+    """Jurnal append-only (JSONL); ultima înregistrare pentru (item, etapă) câștigă."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._header: Dict[str, Any] = {}
+        self._load()
+
+    @classmethod
+    def for_run(cls, logs_dir, supplier_name: str, sku_file) -> "RunJournal":
+        """Jurnalul pentru combinația furnizor + fișier listă SKU."""
+        list_id = hashlib.sha1(str(Path(sku_file).resolve()).encode("utf-8")).hexdigest()[:8]
+        return cls(Path(logs_dir) / f"journal_{supplier_name}_{list_id}.jsonl")
+
+    @staticmethod
+    def item_key(supplier_name: str, url_or_sku: str, code: Optional[str] = None) -> str:
+        """Cheie stabilă pentru o linie din sku_list (independentă de poziția în fișier)."""
+        raw = f"{supplier_name}|{(url_or_sku or '').strip()}|{(code or '').strip().upper()}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def inputs_hash(sku_file, config: Optional[Dict[str, Any]] = None) -> str:
+        """Hash pe conținutul listei SKU + config furnizor (altă listă / alt config → jurnal nevalid)."""
+        h = hashlib.sha1()
+        try:
+            h.update(Path(sku_file).read_bytes())
+        except OSError:
+            pass
+        h.update(json.dumps(config or {}, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+        return h.hexdigest()[:16]
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Linie trunchiată (crash în timpul scrierii) – ignorăm
+                if isinstance(rec.get("header"), dict):
+                    self._header = rec["header"]
+                    continue
+                key, stage = rec.get("key"), rec.get("stage")
+                if key and stage in JOURNAL_STAGES:
+                    self._entries.setdefault(key, {})[stage] = rec.get("data")
+
+    def stale_reason(self, inputs_hash: str, max_age_hours: float) -> Optional[str]:
+        """Motivul pentru care jurnalul existent nu se poate relua (None = valid sau gol)."""
+        with self._lock:
+            if not self._entries and not self._header:
+                return None
+            header = dict(self._header)
+        if not header:
+            return "jurnal fără antet (format vechi)"
+        if header.get("inputs") != inputs_hash:
+            return "lista SKU sau config-ul furnizorului s-au modificat"
+        try:
+            started = datetime.fromisoformat(str(header.get("started")))
+        except ValueError:
+            return "ora de start din antet e invalidă"
+        if max_age_hours > 0 and datetime.now() - started > timedelta(hours=max_age_hours):
+            return f"rulare pornită la {started:%Y-%m-%d %H:%M}, mai veche de {max_age_hours:g}h"
+        return None
+
+    def start(self, inputs_hash: str) -> None:
+        """Scrie antetul (ora de start + hash intrări) dacă jurnalul e nou; la reluare îl păstrează."""
+        with self._lock:
+            if self._header:
+                return
+            self._header = {"started": datetime.now().isoformat(timespec="seconds"), "inputs": inputs_hash}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"header": self._header}, ensure_ascii=False) + "\n")
+
+    def get(self, key: str, stage: str) -> Optional[Any]:
+        """Datele salvate pentru etapă sau None dacă etapa nu e terminată."""
+        with self._lock:
+            return self._entries.get(key, {}).get(stage)
+
+    def has(self, key: str, stage: str) -> bool:
+        with self._lock:
+            return stage in self._entries.get(key, {})
+
+    def record(self, key: str, stage: str, data: Any) -> None:
+        """Marchează etapa ca terminată și o scrie imediat pe disc."""
+        line = json.dumps(
+            {"key": key, "stage": stage, "ts": datetime.now().isoformat(timespec="seconds"), "data": data},
+            ensure_ascii=False,
+            default=str,
+        )
+        with self._lock:
+            self._entries.setdefault(key, {})[stage] = data
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def completed_count(self, stage: str = "row") -> int:
+        """Câte produse au etapa dată terminată (implicit: rând CSV gata)."""
+        with self._lock:
+            return sum(1 for stages in self._entries.values() if stage in stages)
+
+    def discard(self) -> None:
+        """Șterge jurnalul (rulare terminată fără erori sau pornire de la zero)."""
+        with self._lock:
+            self._entries.clear()
+            self._header = {}
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,68 @@
+"""
+Potrivire multi-cuvânt pentru tabelele de cuvinte cheie din clasificare (model, calitate,
+brand piesă, tehnologie, categorii).
+Cu pyahocorasick instalat, cuvintele se compilează o singură dată într-un automat Aho-Corasick și
+textul se parcurge o singură dată indiferent câte cuvinte are tabelul. Fără el, se face câte un
+`kw in text` (căutare C) per cuvânt – aceeași semantică; un automat în Python pur e mai lent decât
+atât la dimensiunea tabelelor noastre.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+
+def matcher_backend() -> str:
+    """'ahocorasick' sau 'substring' – face parte din cheia cache-urilor cu automate compilate."""
+    return "ahocorasick" if _ahocorasick is not None else "substring"
+
+
+class KeywordMatcher:
+    """Cuvinte cheie literale, case-sensitive (textul se dă deja lowercase)."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(k for k in keywords if k))
+        self._automaton = None
+        if _ahocorasick is not None and self.keywords:
+            self._automaton = _ahocorasick.Automaton()
+            for kw in self.keywords:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+
+    def found(self, text: str) -> Set[str]:
+        """Mulțimea cuvintelor cheie prezente în text (echivalent cu {kw for kw in keywords if kw in text})."""
+        if not text:
+            return set()
+        if self._automaton is not None:
+            return {kw for _, kw in self._automaton.iter(text)}
+        return {kw for kw in self.keywords if kw in text}
+
+
+class RankedKeywords:
+    """
+    Tabel ordonat (cuvânt, valoare) cu semantica „prima intrare din listă prezentă în text câștigă” –
+    aceeași ca bucla `for kw, value in table: if kw in text: return value`, dar rezolvată din
+    mulțimea găsită de KeywordMatcher (cele mai specifice intrări sunt primele în tabel).
+    """
+
+    def __init__(self, pairs: Iterable[Tuple[str, Any]]):
+        self.pairs: List[Tuple[str, Any]] = list(pairs)
+        self._rank: Dict[str, int] = {}
+        for i, (kw, _) in enumerate(self.pairs):
+            self._rank.setdefault(kw, i)
+        self._matcher: Optional[KeywordMatcher] = None
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self._rank)
+
+    def best(self, found: Iterable[str], default: Any = None) -> Any:
+        ranks = [self._rank[kw] for kw in found if kw in self._rank]
+        return self.pairs[min(ranks)][1] if ranks else default
+
+    def first_in(self, text: str, default: Any = None) -> Any:
+        if self._matcher is None:
+            self._matcher = KeywordMatcher(self._rank)
+        return self.best(self._matcher.found(text), default)
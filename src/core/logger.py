@@ -0,0 +1,143 @@
+"""
+Sistem de log thread-safe pentru import.
+Workerii (scraping, pipeline, upload) doar pun mesajele într-o coadă – nu ating Tk;
+GUI-ul golește coada în batch pe un timer (root.after). Opțional, aceleași mesaje
+merg și într-un fișier rotativ text și/sau JSONL în logs/ (LOG_FILE din .env).
+"""
+import json
+import logging
+import queue
+import threading
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+# Nivelurile folosite în aplicație (SUCCESS e între INFO și WARNING)
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40}
+
+
+class LogRecord(NamedTuple):
+    time: datetime
+    level: str
+    message: str
+    thread: str
+
+    def format_line(self) -> str:
+        """Format afișat în tab-ul Log / consolă."""
+        return f"[{self.time.strftime('%H:%M:%S')}] [{self.level}] {self.message}"
+
+
+class _TextFormatter(logging.Formatter):
+    def format(self, record):
+        rec = record.webgsm_record
+        return f"{rec.time.strftime('%Y-%m-%d %H:%M:%S')} [{rec.level}] [{rec.thread}] {rec.message}"
+
+
+class _JsonlFormatter(logging.Formatter):
+    def format(self, record):
+        rec = record.webgsm_record
+        return json.dumps(
+            {
+                "ts": rec.time.isoformat(timespec="milliseconds"),
+                "level": rec.level,
+                "thread": rec.thread,
+                "message": rec.message,
+            },
+            ensure_ascii=False,
+        )
+
+
+class _ConsoleFormatter(logging.Formatter):
+    def format(self, record):
+        return record.webgsm_record.format_line()
+
+
+class LogSink:
+    """
+    Punct unic de intrare pentru log-uri.
+    ui_queue=True: mesajele se păstrează în coadă până le golește GUI-ul (drain); în coadă intră doar
+    nivelurile ≥ ui_min_level (implicit INFO – mesajele DEBUG per câmp / per request nu inundă tab-ul Log).
+    Fișierele / consola sunt handler-e logging (thread-safe), scrise direct la emit.
+    """
+
+    _instances = 0
+    _instances_lock = threading.Lock()
+
+    def __init__(self, ui_queue: bool = True, ui_min_level: str = "INFO"):
+        self._queue: Optional[queue.SimpleQueue] = queue.SimpleQueue() if ui_queue else None
+        self.set_ui_level(ui_min_level)
+        with LogSink._instances_lock:
+            LogSink._instances += 1
+            name = f"webgsm.import.{LogSink._instances}"
+        self._logger = logging.getLogger(name)
+        self._logger.propagate = False
+        self._logger.setLevel(logging.DEBUG)
+
+    def set_ui_level(self, min_level: str = "INFO") -> None:
+        """Nivelul minim afișat în GUI (ex. LOG_LEVEL din .env, citit după crearea sink-ului)."""
+        self._ui_level = LOG_LEVELS.get((min_level or "INFO").upper(), 20)
+
+    def emit(self, message, level: str = "INFO") -> None:
+        """Înregistrează un mesaj; sigur de apelat din orice thread."""
+        level = (level or "INFO").upper()
+        rec = LogRecord(datetime.now(), level, str(message), threading.current_thread().name)
+        if self._queue is not None and LOG_LEVELS.get(level, 20) >= self._ui_level:
+            self._queue.put(rec)
+        if self._logger.handlers:
+            self._logger.log(LOG_LEVELS.get(level, 20), rec.message, extra={"webgsm_record": rec})
+
+    def drain(self, max_items: int = 1000) -> List[LogRecord]:
+        """Scoate până la max_items mesaje din coadă (apelat de GUI pe thread-ul principal)."""
+        records = []
+        if self._queue is None:
+            return records
+        while len(records) < max_items:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return records
+
+    def add_file_sinks(self, logs_dir, mode: str = "text", max_mb: float = 5, backups: int = 3,
+                       min_level: str = "INFO", prefix: str = "import") -> List[Path]:
+        """
+        mode: "text", "jsonl" sau "both" – fișiere rotative logs/<prefix>.log / logs/<prefix>.jsonl.
+        Returnează căile fișierelor activate.
+        """
+        mode = (mode or "").strip().lower()
+        targets = []
+        if mode in ("text", "both", "1", "true", "yes"):
+            targets.append((f"{prefix}.log", _TextFormatter()))
+        if mode in ("jsonl", "json", "both"):
+            targets.append((f"{prefix}.jsonl", _JsonlFormatter()))
+        paths = []
+        logs_dir = Path(logs_dir)
+        logs_dir.mkdir(parents=True, exist_ok=True)
+        for filename, formatter in targets:
+            path = logs_dir / filename
+            handler = RotatingFileHandler(
+                path, maxBytes=int(max(0.1, float(max_mb)) * 1024 * 1024), backupCount=max(0, int(backups)),
+                encoding="utf-8",
+            )
+            handler.setFormatter(formatter)
+            handler.setLevel(LOG_LEVELS.get((min_level or "INFO").upper(), 20))
+            self._logger.addHandler(handler)
+            paths.append(path)
+        return paths
+
+    def add_stream_sink(self, stream, min_level: str = "DEBUG") -> None:
+        """Log în consolă (rularea headless – stdout preluat de cron / systemd)."""
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(_ConsoleFormatter())
+        handler.setLevel(LOG_LEVELS.get((min_level or "DEBUG").upper(), 10))
+        self._logger.addHandler(handler)
+
+    def close(self) -> None:
+        """Închide fișierele deschise."""
+        for handler in list(self._logger.handlers):
+            try:
+                handler.flush()
+                handler.close()
+            finally:
+                self._logger.removeHandler(handler)
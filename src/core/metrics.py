@@ -0,0 +1,145 @@
+"""
+Instrumentare per etapă pentru o rulare de import: durate (p50/p95/max), bytes, produse/minut.
+Metricile sunt colectate thread-safe din workeri și scrise la final într-un raport
+JSON lângă CSV-ul exportat (ex. data/export_webgsm_X.report.json).
+"""
+import functools
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentilă nearest-rank pe o listă deja sortată."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class RunMetrics:
+    """Colector de timpi și bytes per etapă (ex. "scrape.foneday", "ollama", "wp_upload")."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._bytes: Dict[str, int] = {}
+        self._counters: Dict[str, int] = {}
+        self.started_at = datetime.now()
+        self._t0 = time.perf_counter()
+        self._t_end: Optional[float] = None
+        self.items_done = 0
+
+    @contextmanager
+    def timer(self, stage: str):
+        """Măsoară blocul; excepțiile sunt numărate ca erori ale etapei și propagate."""
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.record(stage, time.perf_counter() - start, failed)
+
+    def record(self, stage: str, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self._durations.setdefault(stage, []).append(seconds)
+            if failed:
+                self._errors[stage] = self._errors.get(stage, 0) + 1
+
+    def add_bytes(self, stage: str, count: int) -> None:
+        if not count:
+            return
+        with self._lock:
+            self._bytes[stage] = self._bytes.get(stage, 0) + int(count)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Contor generic (ex. cache hit/miss)."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def item_done(self) -> None:
+        with self._lock:
+            self.items_done += 1
+
+    def finish(self) -> None:
+        if self._t_end is None:
+            self._t_end = time.perf_counter()
+
+    def report(self) -> Dict[str, Any]:
+        """Sumar: per etapă count/total/p50/p95/max (secunde), erori, bytes; global produse/minut."""
+        with self._lock:
+            durations = {k: sorted(v) for k, v in self._durations.items()}
+            errors = dict(self._errors)
+            bytes_ = dict(self._bytes)
+            counters = dict(self._counters)
+            items = self.items_done
+        elapsed = (self._t_end or time.perf_counter()) - self._t0
+        stages = {}
+        for stage in sorted(set(durations) | set(bytes_)):
+            values = durations.get(stage, [])
+            stages[stage] = {
+                "count": len(values),
+                "total_s": round(sum(values), 3),
+                "p50_s": round(_percentile(values, 50), 3),
+                "p95_s": round(_percentile(values, 95), 3),
+                "max_s": round(values[-1], 3) if values else 0.0,
+                "errors": errors.get(stage, 0),
+                "bytes": bytes_.get(stage, 0),
+            }
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "elapsed_s": round(elapsed, 1),
+            "items": items,
+            "items_per_min": round(items / (elapsed / 60.0), 2) if elapsed > 0 else 0.0,
+            "bytes_total": sum(bytes_.values()),
+            "stages": stages,
+            "counters": counters,
+        }
+
+    def write_report(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def summary_lines(self) -> List[str]:
+        """Tabel scurt pentru log (etapele ordonate după timp total)."""
+        rep = self.report()
+        lines = [
+            f"⏱️ {rep['items']} produse în {rep['elapsed_s']:.0f}s ({rep['items_per_min']} produse/min), "
+            f"{rep['bytes_total'] / (1024 * 1024):.1f} MB transferați"
+        ]
+        for stage, st in sorted(rep["stages"].items(), key=lambda kv: -kv[1]["total_s"]):
+            mb = f", {st['bytes'] / (1024 * 1024):.1f} MB" if st["bytes"] else ""
+            err = f", {st['errors']} erori" if st["errors"] else ""
+            lines.append(
+                f"   {stage:<24} n={st['count']:<5} p50={st['p50_s']:.2f}s p95={st['p95_s']:.2f}s "
+                f"max={st['max_s']:.2f}s total={st['total_s']:.0f}s{mb}{err}"
+            )
+        if rep["counters"]:
+            lines.append("   " + ", ".join(f"{k}={v}" for k, v in sorted(rep["counters"].items())))
+        return lines
+
+
+def timed(stage: str):
+    """Decorator pentru metode ale aplicației: măsoară în self.metrics dacă există (altfel no-op)."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            metrics = getattr(self, "metrics", None)
+            if metrics is None:
+                return func(self, *args, **kwargs)
+            with metrics.timer(stage):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,283 @@
+"""
+Promptul Ollama pentru câmpurile text ale produsului (nume, descrieri, SEO, tip, tag-uri) și parsarea răspunsului.
+Două formate de ieșire:
+  json  – Ollama `format` = schema JSON de mai jos (ieșire constrânsă, validată o singură dată), cu limită de
+          tokeni (num_predict) calculată din bugetul fiecărui câmp; instrucțiunile merg în `system`;
+  lines – formatul vechi NAME_RO: … TAGS_RO:, parsat linie cu linie (pentru servere Ollama fără `format`).
+Mod lot (json): mai multe produse scurte într-un singur prompt (BATCH_SYSTEM + BATCH_ITEM), separate după "id";
+câte produse intră într-un lot e limitat și de contextul modelului (batch_tokens ≤ num_ctx).
+PROMPT_VERSIONS = hash-ul șablonului (+ schemei): orice modificare a promptului schimbă versiunea, deci și cheile
+din cache-ul de generări (rezultatele vechi nu mai sunt refolosite fără să trebuiască invalidate manual).
+"""
+import hashlib
+import json
+import re
+from typing import Any, Dict, Optional
+
+TIP_PRODUS_VALUES = (
+    "Baterie", "Ecran", "Conector Încărcare", "Cameră Spate", "Șurub", "Șurubelniță", "Componentă", "Flex",
+    "Carcasă", "Difuzor", "Buton", "Garnitură", "Tester", "Folie protecție",
+)
+
+_ROLE = "You are a product data specialist for a Romanian e-commerce site (WebGSM). Write ONLY in correct, fluent Romanian (gramatică corectă)."
+
+_PRODUCT_BLOCK = """SOURCE PRODUCT URL (read-only): {source_url}
+
+Product name (EN): {name_en}
+Description/specs from source (EN): {description}
+{tags_line}
+Attributes: Model={pa_model}, Calitate={pa_calitate}, Brand={pa_brand_piesa}, Tehnologie={pa_tehnologie}"""
+
+_RULES = 'Translate and adapt for our CSV. Keep the structure of the description (e.g. Net Weight, Compatibility, Product size, Speed) when present. Important: for diagnostic/testing devices use "tester" in Romanian (dispozitiv de testare), never "testator" (persoana care face testament). '
+
+FIELDS_PROMPT = _ROLE + "\n\n" + _PRODUCT_BLOCK + "\n\n" + _RULES + """Output ONLY these lines, one per line:
+NAME_RO: <one line, product name in Romanian, SEO-friendly, grammatically correct>
+SHORT_DESC_RO: <one line, short description in Romanian, max 160 chars, fluent>
+DESC_RO: <full description in Romanian; KEEP structure (Greutate netă, Compatibilitate, Dimensiuni, Viteză etc.); use | for line breaks; grammatically correct>
+SEO_TITLE: <one line, max 60 chars>
+SEO_DESC: <one line, max 155 chars>
+FOCUS_KW: <one short phrase for SEO>
+TIP_PRODUS: <exactly one: Baterie, Ecran, Conector Încărcare, Cameră Spate, Șurub, Șurubelniță, Componentă, Flex, Carcasă, Difuzor, Buton, Garnitură, Tester, Folie protecție>
+TAGS_RO: <if tags from source were given, translate them to fluent Romanian (e.g. wholesale screwdrivers -> șurubelnițe en-gros); otherwise suggest max 6 short tags; comma-separated, max 8 tags, grammatically correct Romanian>"""
+
+_JSON_FIELD_SPECS = """"name_ro": product name in Romanian, SEO-friendly, grammatically correct;
+"short_desc_ro": short description in Romanian, max 160 chars, fluent;
+"desc_ro": full description in Romanian; KEEP structure (Greutate netă, Compatibilitate, Dimensiuni, Viteză etc.); use | for line breaks;
+"seo_title": max 60 chars;
+"seo_desc": max 155 chars;
+"focus_kw": one short phrase for SEO;
+"tip_produs": exactly one of: Baterie, Ecran, Conector Încărcare, Cameră Spate, Șurub, Șurubelniță, Componentă, Flex, Carcasă, Difuzor, Buton, Garnitură, Tester, Folie protecție;
+"tags_ro": if tags from source were given, translate them to fluent Romanian (e.g. wholesale screwdrivers -> șurubelnițe en-gros); otherwise suggest max 6 short tags; comma-separated, max 8 tags."""
+
+# Mod json: instrucțiunile sunt promptul de sistem (identic la fiecare produs → Ollama refolosește prefixul deja
+# procesat cât modelul rămâne încărcat), iar promptul conține doar datele produsului
+FIELDS_JSON_SYSTEM = _ROLE + "\n\n" + _RULES + "Answer with ONE JSON object with exactly these keys:\n" + _JSON_FIELD_SPECS
+FIELDS_JSON_PROMPT = _PRODUCT_BLOCK
+
+# Mod lot: mai multe produse scurte într-o singură cerere, rezultatele legate prin "id"
+BATCH_SYSTEM = (
+    _ROLE + "\n\n" + _RULES
+    + 'You receive several products, each introduced by "Product <id>:". Answer with ONE JSON object '
+    + '{"products": [...]} containing exactly one entry per product, in the same order; each entry has '
+    + '"id" (the product number) and these keys:\n' + _JSON_FIELD_SPECS
+)
+BATCH_ITEM = "Product {id}:\n" + _PRODUCT_BLOCK
+
+# Buget per câmp: (caractere maxime, tokeni). Tokenii (≈ caractere / 3 pentru română + marjă) dau num_predict.
+FIELD_BUDGETS = {
+    "name_ro": (150, 60),
+    "short_desc_ro": (160, 70),
+    "desc_ro": (3000, 1100),
+    "seo_title": (60, 30),
+    "seo_desc": (160, 70),
+    "focus_kw": (80, 30),
+    "tip_produs": (30, 12),
+    "tags_ro": (500, 170),
+}
+# Acoladele, ghilimelele și numele cheilor JSON
+_JSON_OVERHEAD_TOKENS = 60
+FIELDS_NUM_PREDICT = sum(tokens for _, tokens in FIELD_BUDGETS.values()) + _JSON_OVERHEAD_TOKENS
+
+FIELDS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        key: ({"type": "string", "enum": list(TIP_PRODUS_VALUES)} if key == "tip_produs"
+              else {"type": "string", "maxLength": chars})
+        for key, (chars, _) in FIELD_BUDGETS.items()
+    },
+    "required": list(FIELD_BUDGETS),
+}
+
+BATCH_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "products": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}, **FIELDS_SCHEMA["properties"]},
+                "required": ["id"] + FIELDS_SCHEMA["required"],
+            },
+        },
+    },
+    "required": ["products"],
+}
+
+
+def _version(*parts: Any) -> str:
+    text = "\n".join(p if isinstance(p, str) else json.dumps(p, sort_keys=True) for p in parts)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:10]
+
+
+PROMPT_VERSIONS = {
+    "lines": _version(FIELDS_PROMPT),
+    "json": _version(FIELDS_JSON_SYSTEM, FIELDS_JSON_PROMPT, FIELDS_SCHEMA),
+    # Rezultatele generate în lot au cheie proprie: schimbarea BATCH_SYSTEM / BATCH_ITEM le invalidează
+    "batch": _version(BATCH_SYSTEM, BATCH_ITEM, BATCH_SCHEMA),
+}
+OUTPUT_FORMATS = ("json", "lines")
+
+# Prefix linie → (cheie rezultat, lungime maximă)
+LINE_FIELDS = {
+    "NAME_RO:": ("name_ro", None),
+    "SHORT_DESC_RO:": ("short_desc_ro", 160),
+    "DESC_RO:": ("desc_ro", 3000),
+    "SEO_TITLE:": ("seo_title", 60),
+    "SEO_DESC:": ("seo_desc", 160),
+    "FOCUS_KW:": ("focus_kw", None),
+    "TIP_PRODUS:": ("tip_produs", None),
+    "TAGS_RO:": ("tags_ro", 500),
+}
+
+
+def _prompt_inputs(name_en, description_en, tags_en, pa_model, pa_calitate, pa_brand_piesa, pa_tehnologie) -> Dict[str, str]:
+    tags_en = (tags_en or "").strip()
+    return {
+        "name_en": name_en,
+        "description": (description_en or "")[:2800].replace("\n", " "),
+        "tags_line": f"Product tags from source (EN): {tags_en[:300]}" if tags_en else "No tags from source.",
+        "pa_model": pa_model or "-",
+        "pa_calitate": pa_calitate or "-",
+        "pa_brand_piesa": pa_brand_piesa or "-",
+        "pa_tehnologie": pa_tehnologie or "-",
+    }
+
+
+def build_fields_prompt(source_url, name_en, description_en, pa_model, pa_calitate, pa_brand_piesa, pa_tehnologie,
+                        tags_en="", output="lines") -> str:
+    """Promptul unui produs; în modul json se trimite împreună cu system=fields_system(output)."""
+    inputs = _prompt_inputs(name_en, description_en, tags_en, pa_model, pa_calitate, pa_brand_piesa, pa_tehnologie)
+    template = FIELDS_JSON_PROMPT if output == "json" else FIELDS_PROMPT
+    return template.format(source_url=source_url, **inputs)
+
+
+def fields_system(output: str) -> Optional[str]:
+    return FIELDS_JSON_SYSTEM if output == "json" else None
+
+
+def build_batch_prompt(products) -> str:
+    """products: listă de (id, kwargs pentru build_fields_prompt fără output) → promptul lotului."""
+    blocks = []
+    for item_id, fields in products:
+        fields = dict(fields)
+        source_url = fields.pop("source_url", "")
+        inputs = _prompt_inputs(
+            fields.get("name_en"), fields.get("description_en"), fields.get("tags_en"), fields.get("pa_model"),
+            fields.get("pa_calitate"), fields.get("pa_brand_piesa"), fields.get("pa_tehnologie"),
+        )
+        blocks.append(BATCH_ITEM.format(id=item_id, source_url=source_url, **inputs))
+    return "\n\n".join(blocks)
+
+
+# Context trimis tuturor cererilor când loturile sunt active și OLLAMA_NUM_CTX nu e setat explicit
+BATCH_NUM_CTX = 8192
+
+
+def estimate_tokens(text: str) -> int:
+    """Aproximare tokeni (≈ caractere / 3 pentru română, ca în FIELD_BUDGETS)."""
+    return len(text or "") // 3 + 1
+
+
+def batch_tokens(products) -> int:
+    """Context necesar unui lot: promptul de sistem + produsele + num_predict pentru fiecare produs."""
+    products = list(products)
+    prompt = build_batch_prompt(list(enumerate(products, 1)))
+    return estimate_tokens(BATCH_SYSTEM) + estimate_tokens(prompt) + FIELDS_NUM_PREDICT * len(products)
+
+
+def fields_cache_key(model, name_en, description_en, pa_model, pa_calitate, pa_brand_piesa, pa_tehnologie,
+                     tags_en="", output="lines") -> str:
+    """
+    Text canonic pentru cache-ul de generări: model + versiunea promptului + intrările care ajung în prompt
+    (descrierea ca hash). URL-ul sursă e doar context, nu intră în cheie. output="batch" = cheia rezultatelor
+    generate în lot.
+    """
+    inputs = _prompt_inputs(name_en, description_en, tags_en, pa_model, pa_calitate, pa_brand_piesa, pa_tehnologie)
+    inputs["description"] = hashlib.sha1(inputs["description"].encode("utf-8")).hexdigest()
+    version = PROMPT_VERSIONS.get(output, PROMPT_VERSIONS["lines"])
+    return json.dumps({"model": model, "prompt": version, **inputs}, sort_keys=True, ensure_ascii=False)
+
+
+def parse_fields_response(out: str) -> Optional[Dict[str, str]]:
+    """Liniile NAME_RO: … TAGS_RO: → dict; DESC_RO poate continua pe mai multe rânduri. None fără NAME_RO."""
+    result: Dict[str, str] = {}
+    desc_ro_lines = []
+    in_desc_ro = False
+    for line in (out or "").splitlines():
+        line_stripped = line.strip()
+        prefix = next((p for p in LINE_FIELDS if line_stripped.startswith(p)), None)
+        if prefix is None:
+            if in_desc_ro:
+                desc_ro_lines.append(line_stripped)
+            continue
+        key, limit = LINE_FIELDS[prefix]
+        value = line_stripped[len(prefix):].strip()
+        if key == "desc_ro":
+            in_desc_ro = True
+            desc_ro_lines = [value]
+            continue
+        if key in ("name_ro", "short_desc_ro", "seo_title"):
+            in_desc_ro = False  # celelalte chei se citesc, dar rândurile libere de după ele continuă DESC_RO
+        result[key] = value[:limit] if limit else value
+    if desc_ro_lines:
+        result["desc_ro"] = " ".join(desc_ro_lines).replace("|", "\n").strip()[:3000]
+    return result if result.get("name_ro") else None
+
+
+def parse_fields_json(out: str) -> Optional[Dict[str, str]]:
+    """
+    Răspunsul JSON (format=schema) → același dict ca parse_fields_response, tăiat la limitele câmpurilor.
+    None dacă nu e un obiect JSON sau lipsește name_ro; tip_produs în afara listei e ignorat.
+    """
+    return _fields_from_object(_load_json_object(out))
+
+
+def parse_batch_json(out: str) -> Dict[int, Dict[str, str]]:
+    """Răspunsul unui lot → {id: câmpuri}; produsele lipsă / invalide nu apar (se generează apoi individual)."""
+    data = _load_json_object(out)
+    items = data.get("products") if isinstance(data, dict) else None
+    results: Dict[int, Dict[str, str]] = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            item_id = int(item.get("id"))
+        except (TypeError, ValueError):
+            continue
+        fields = _fields_from_object(item)
+        if fields and item_id not in results:
+            results[item_id] = fields
+    return results
+
+
+def _load_json_object(out: str) -> Optional[Dict]:
+    text = (out or "").strip()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        m = re.search(r"\{.*\}", text, re.S)  # server fără `format`: obiectul poate fi înconjurat de text
+        try:
+            data = json.loads(m.group(0)) if m else None
+        except ValueError:
+            data = None
+    return data if isinstance(data, dict) else None
+
+
+def _fields_from_object(data: Optional[Dict]) -> Optional[Dict[str, str]]:
+    if not isinstance(data, dict):
+        return None
+    result: Dict[str, str] = {}
+    for key, (chars, _) in FIELD_BUDGETS.items():
+        value = data.get(key)
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+            continue
+        value = str(value).strip()
+        if key == "desc_ro":
+            value = value.replace("|", "\n").strip()
+        if key == "tip_produs" and value not in TIP_PRODUS_VALUES:
+            continue
+        if value:
+            result[key] = value[:chars]
+    return result if result.get("name_ro") else None
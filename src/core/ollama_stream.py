@@ -0,0 +1,133 @@
+"""
+Client streaming pentru /api/generate: textul sosește pe bucăți (NDJSON), câmpurile produsului sunt
+detectate pe măsură ce se completează, iar conexiunea se închide imediat ce toate câmpurile sunt gata –
+Ollama oprește generarea când clientul se deconectează, deci modelul nu mai „vorbește” după TAGS_RO
+(sau după acolada de final a obiectului JSON).
+"""
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from .ollama_fields import FIELD_BUDGETS, LINE_FIELDS
+
+
+class StreamFieldParser:
+    """
+    Urmărește un răspuns parțial. output="lines": un câmp e complet când linia lui s-a terminat cu '\\n'
+    (DESC_RO: când începe următoarea cheie); răspunsul e complet când toate cheile au apărut și ultima linie
+    s-a terminat. output="json": complet când obiectul de pe primul nivel s-a închis.
+    """
+
+    def __init__(self, output: str = "lines"):
+        self.output = output
+        self.text = ""
+        self._reported: List[str] = []
+        # Stare JSON: adâncime acolade, în string, escape
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._json_started = False
+        self._json_closed = False
+        self._json_pos = 0
+
+    def feed(self, chunk: str) -> List[str]:
+        """Adaugă o bucată; returnează câmpurile completate de la ultimul apel (ex. ["name_ro"])."""
+        if not chunk:
+            return []
+        self.text += chunk
+        if self.output == "json":
+            self._scan_json()
+        done = self._completed_fields()
+        new = [key for key in done if key not in self._reported]
+        self._reported.extend(new)
+        return new
+
+    def _scan_json(self) -> None:
+        text = self.text
+        for i in range(self._json_pos, len(text)):
+            ch = text[i]
+            if self._json_closed:
+                break
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"' and self._json_started:
+                self._in_string = True
+            elif ch == "{":
+                self._json_started = True
+                self._depth += 1
+            elif ch == "}" and self._json_started:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._json_closed = True
+        self._json_pos = len(text)
+
+    def _completed_fields(self) -> List[str]:
+        if self.output == "json":
+            # Un câmp JSON e complet când după valoarea lui a apărut cheia următoare (sau obiectul s-a închis)
+            positions = {key: self.text.find(f'"{key}"') for key in FIELD_BUDGETS}
+            keys = sorted((key for key, pos in positions.items() if pos >= 0), key=positions.get)
+            if self._json_closed:
+                return keys
+            return keys[:-1] if keys else []
+        lines = self.text.split("\n")
+        finished, tail = lines[:-1], lines[-1]
+        seen = []
+        for line in finished:
+            stripped = line.strip()
+            for prefix, (key, _) in LINE_FIELDS.items():
+                if stripped.startswith(prefix) and key not in seen:
+                    seen.append(key)
+        if "desc_ro" in seen and seen[-1] == "desc_ro" and not any(tail.strip().startswith(p) for p in LINE_FIELDS):
+            seen.remove("desc_ro")  # DESC_RO poate continua pe rândurile următoare
+        return seen
+
+    @property
+    def complete(self) -> bool:
+        if self.output == "json":
+            return self._json_closed
+        return len(self._completed_fields()) == len(LINE_FIELDS)
+
+
+def stream_generate(post: Callable[..., requests.Response], url: str, payload: Dict[str, Any], timeout: float,
+                    output: str = "lines",
+                    on_field: Optional[Callable[[str, float], None]] = None) -> Tuple[str, Dict[str, Any], bool]:
+    """
+    POST /api/generate cu stream=True. Returnează (text, mesajul final Ollama cu timpii sau {}, oprit_devreme).
+    timeout = timeout de citire între bucăți (nu pentru tot răspunsul). on_field(cheie, secunde) la fiecare câmp gata.
+    """
+    payload = dict(payload, stream=True)
+    parser = StreamFieldParser(output)
+    started = time.perf_counter()
+    final: Dict[str, Any] = {}
+    cut_off = False
+    r = post(url, json=payload, timeout=timeout, stream=True)
+    try:
+        r.raise_for_status()
+        for raw in r.iter_lines():
+            if not raw:
+                continue
+            try:
+                message = json.loads(raw)
+            except ValueError:
+                continue
+            if message.get("error"):
+                raise RuntimeError(message["error"])
+            for key in parser.feed(message.get("response", "")):
+                if on_field:
+                    on_field(key, time.perf_counter() - started)
+            if message.get("done"):
+                final = message
+                break
+            if parser.complete:
+                cut_off = True
+                break
+    finally:
+        r.close()  # la oprire devreme, închiderea conexiunii anulează generarea pe server
+    return parser.text, final, cut_off
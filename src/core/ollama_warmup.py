@@ -0,0 +1,75 @@
+"""
+Pre-încărcarea modelului Ollama și timpii raportați de server.
+Un /api/generate fără prompt doar încarcă modelul în memorie (și îl ține keep_alive); răspunsurile Ollama
+conțin load_duration / prompt_eval_duration / eval_duration în nanosecunde, deci timpul de încărcare se
+poate separa de timpul de generare propriu-zis.
+"""
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+# Peste atât, load_duration dintr-o generare înseamnă că modelul a fost (re)încărcat, nu doar găsit în memorie
+RELOAD_THRESHOLD_S = 1.0
+
+
+def ns_to_s(value: Any) -> float:
+    try:
+        return max(0.0, float(value or 0) / 1e9)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def response_timings(data: Dict) -> Dict[str, float]:
+    """Timpii unui răspuns /api/generate (secunde): load, prompt (procesare prompt), generate (tokeni noi), total."""
+    return {
+        "load": ns_to_s(data.get("load_duration")),
+        "prompt": ns_to_s(data.get("prompt_eval_duration")),
+        "generate": ns_to_s(data.get("eval_duration")),
+        "total": ns_to_s(data.get("total_duration")),
+    }
+
+
+def loaded_models(base_url: str, get: Optional[Callable[..., requests.Response]] = None, timeout: float = 10) -> List[str]:
+    """Modelele încărcate acum în memoria serverului (/api/ps); [] dacă endpoint-ul lipsește."""
+    get = get or requests.get
+    try:
+        r = get(f"{base_url.rstrip('/')}/api/ps", timeout=timeout)
+        if r.status_code != 200:
+            return []
+        return [m.get("name") or m.get("model") or "" for m in r.json().get("models", [])]
+    except (requests.RequestException, ValueError):
+        return []
+
+
+def _same_model(name: str, model: str) -> bool:
+    # "llama3.1" e același model cu "llama3.1:latest"
+    return name == model or name == f"{model}:latest" or f"{name}:latest" == model
+
+
+def preload_model(base_url: str, model: str, keep_alive: str = "30m", timeout: float = 300,
+                  options: Optional[Dict[str, Any]] = None,
+                  post: Optional[Callable[..., requests.Response]] = None,
+                  get: Optional[Callable[..., requests.Response]] = None) -> Dict[str, Any]:
+    """
+    Încarcă modelul (dacă nu e deja) și setează keep_alive. options (ex. num_ctx) trebuie să fie aceleași ca la
+    generări – altfel serverul reîncarcă modelul la prima generare. Returnează
+    {"already_loaded": bool, "load_s": float, "wall_s": float}; excepțiile HTTP se propagă.
+    """
+    post = post or requests.post
+    already = any(_same_model(name, model) for name in loaded_models(base_url, get=get))
+    started = time.perf_counter()
+    payload: Dict[str, Any] = {"model": model, "keep_alive": keep_alive}
+    if options:
+        payload["options"] = options
+    r = post(f"{base_url.rstrip('/')}/api/generate", json=payload, timeout=timeout)
+    r.raise_for_status()
+    try:
+        data = r.json()
+    except ValueError:
+        data = {}
+    return {
+        "already_loaded": already,
+        "load_s": ns_to_s(data.get("load_duration")) or (0.0 if already else time.perf_counter() - started),
+        "wall_s": time.perf_counter() - started,
+    }
@@ -0,0 +1,239 @@
+"""
+Alegerea centrală a parserului HTML pentru scraper-e.
+BeautifulSoup rămâne API-ul folosit peste tot (select, find, get_text); se schimbă doar tree builder-ul:
+lxml (C, de ~5-10× mai rapid) când e instalat, altfel html.parser (pur Python).
+HTML_PARSER în .env / mediu: auto (implicit) | lxml | html.parser | selectolax.
+selectolax nu are API compatibil BeautifulSoup – când e ales, arborele se construiește cu lxml și
+doar textul paginii (soup_text) se extrage cu selectolax.
+
+Parsare parțială: region_strainer(selectori CSS) construiește un SoupStrainer care materializează doar
+subarborii de care are nevoie scraper-ul (titlu, preț, descriere, galerie, tabele, JSON-LD); textul
+complet al paginii (soup_text) se calculează în continuare din HTML-ul brut, fără arbore.
+"""
+import html as html_lib
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Elemente al căror conținut nu e text vizibil (BeautifulSoup le exclude și el din get_text)
+_NON_TEXT_TAGS = ["script", "style", "noscript", "template"]
+
+
+def _installed(module: str) -> bool:
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
+
+def available_backends() -> List[str]:
+    """Backend-uri utilizabile pe mașina curentă, în ordinea preferinței."""
+    backends = []
+    if _installed("lxml"):
+        backends.append("lxml")
+        if _installed("selectolax"):
+            backends.append("selectolax")
+    backends.append("html.parser")
+    return backends
+
+
+def select_backend(name: Optional[str] = None) -> str:
+    """Backend cerut (sau HTML_PARSER) dacă e instalat, altfel cel mai rapid disponibil."""
+    name = (name or os.getenv("HTML_PARSER") or "auto").strip().lower()
+    available = available_backends()
+    if name in available:
+        return name
+    return available[0]
+
+
+_backend = None
+
+
+def current_backend() -> str:
+    global _backend
+    if _backend is None:
+        _backend = select_backend()
+    return _backend
+
+
+def set_backend(name: Optional[str]) -> str:
+    """Schimbă backend-ul pentru tot procesul (benchmark / teste); returnează backend-ul efectiv."""
+    global _backend
+    _backend = select_backend(name)
+    return _backend
+
+
+def make_soup(markup, parse_only=None, backend: Optional[str] = None) -> BeautifulSoup:
+    """BeautifulSoup cu backend-ul central; parse_only = SoupStrainer opțional (ex. region_strainer)."""
+    backend = backend or current_backend()
+    builder = "html.parser" if backend == "html.parser" else "lxml"
+    soup = BeautifulSoup(markup, builder, parse_only=parse_only)
+    # soup_text alege calea după backend-ul cu care s-a construit soup-ul (nu după cel curent)
+    soup.__dict__["_webgsm_backend"] = backend
+    if backend == "selectolax" or parse_only is not None:
+        # Arbore parțial (sau text prin selectolax): textul / debug HTML-ul se iau din markup-ul brut
+        soup.__dict__["_webgsm_markup"] = markup
+    return soup
+
+
+def soup_markup(soup):
+    """HTML-ul brut din care s-a construit soup-ul parțial (None pentru arbori compleți)."""
+    return soup.__dict__.get("_webgsm_markup") if soup is not None else None
+
+
+# Primul compus al unui selector (strămoșul cel mai exterior): tag, #id, .clasă, [atribut op valoare]
+_COMPOUND_RE = re.compile(r"^(?P<tag>\*|[a-zA-Z][\w-]*)?(?P<rest>(?:[#.][\w-]+|\[[^\]]*\]|:[\w-]+(?:\([^)]*\))?)*)$")
+_ATTR_RE = re.compile(r"\[\s*([\w:-]+)\s*(?:([*^$~|]?=)\s*(?:\"([^\"]*)\"|'([^']*)'|([^\]\s]*))\s*(?:[iIsS]\s*)?)?\]")
+
+
+def _outer_compound(selector: str):
+    """(tag, ids, classes, [(attr, op, value)]) pentru strămoșul exterior al selectorului; None = neacceptat."""
+    selector = selector.strip()
+    unbracketed = re.sub(r"\[[^\]]*\]|\([^)]*\)", "", selector)
+    if not selector or "+" in unbracketed or "~" in unbracketed:
+        return None  # combinatori între frați: regiunea nu se poate limita la un subarbore
+    depth, quote, first = 0, None, selector
+    for i, ch in enumerate(selector):
+        if quote:
+            quote = None if ch == quote else quote
+        elif ch in "\"'":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif depth == 0 and (ch.isspace() or ch == ">"):
+            first = selector[:i]
+            break
+    m = _COMPOUND_RE.match(first)
+    if not m:
+        return None
+    rest = re.sub(r":[\w-]+(?:\([^)]*\))?", "", m.group("rest"))  # pseudo-clase → superset
+    attrs = [(a.group(1).lower(), a.group(2), next((v for v in a.group(3, 4, 5) if v is not None), None))
+             for a in _ATTR_RE.finditer(rest)]
+    rest = _ATTR_RE.sub("", rest)
+    tag = m.group("tag")
+    return (
+        None if tag in (None, "*") else tag.lower(),
+        re.findall(r"#([\w-]+)", rest),
+        re.findall(r"\.([\w-]+)", rest),
+        attrs,
+    )
+
+
+def _attr_matches(value, op, expected) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, (list, tuple)):
+        value = " ".join(value)
+    if op is None:
+        return True
+    if op == "=":
+        return value == expected
+    if op == "*=":
+        return expected in value
+    if op == "^=":
+        return value.startswith(expected)
+    if op == "$=":
+        return value.endswith(expected)
+    if op == "~=":
+        return expected in value.split()
+    if op == "|=":
+        return value == expected or value.startswith(expected + "-")
+    return True
+
+
+def _compound_matches(compound, name, attrs) -> bool:
+    tag, ids, classes, attr_rules = compound
+    if tag and tag != (name or "").lower():
+        return False
+    if ids and attrs.get("id") not in ids:
+        return False
+    if classes:
+        present = attrs.get("class") or ""
+        present = set(present.split() if isinstance(present, str) else present)
+        if not set(classes) <= present:
+            return False
+    return all(_attr_matches(attrs.get(attr), op, value) for attr, op, value in attr_rules)
+
+
+class RegionStrainer(SoupStrainer):
+    """Păstrează doar elementele care pot fi strămoșul exterior al unuia dintre selectori (cu tot subarborele)."""
+
+    def __init__(self, compounds):
+        self._compounds = compounds
+        # bs4 < 4.13: funcția de nume primește (name, attrs) la parsare
+        super().__init__(lambda name, attrs=None: self._matches(name, attrs))
+
+    def _matches(self, name, attrs=None) -> bool:
+        if not isinstance(name, str):  # potrivire pe Tag deja construit (find/select), nu la parsare
+            name, attrs = name.name, name.attrs
+        attrs = dict(attrs or {})
+        return any(_compound_matches(c, name, attrs) for c in self._compounds)
+
+    # bs4 >= 4.13
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self._matches(name, attrs)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+
+def region_strainer(selectors: Iterable[str]) -> Optional[SoupStrainer]:
+    """SoupStrainer pentru regiunile date sau None dacă vreun selector nu permite limitarea (parsare completă)."""
+    compounds = []
+    for selector in selectors:
+        for part in str(selector).split(","):
+            if not part.strip():
+                continue
+            compound = _outer_compound(part)
+            if compound is None:
+                return None
+            compounds.append(compound)
+    return RegionStrainer(compounds) if compounds else None
+
+
+def soup_text(soup, separator: str = "") -> str:
+    """
+    Textul întregii pagini, calculat o singură dată per (soup, separator) – _build_product_data,
+    detect_availability și scraper-ele îl cer de mai multe ori pe același arbore.
+    """
+    if soup is None or not hasattr(soup, "get_text"):
+        return ""
+    cache: Dict[str, str] = soup.__dict__.setdefault("_webgsm_text_cache", {})
+    if separator not in cache:
+        markup = soup.__dict__.get("_webgsm_markup")
+        if markup is None:
+            cache[separator] = soup.get_text(separator=separator)
+        elif soup.__dict__.get("_webgsm_backend") == "selectolax":
+            cache[separator] = _selectolax_text(markup, separator)
+        else:
+            cache[separator] = _markup_text(markup, separator)
+    return cache[separator]
+
+
+_NON_TEXT_RE = re.compile(r"<!--.*?-->|<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>", re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _markup_text(markup, separator: str) -> str:
+    """Text din HTML brut (pentru arbori parțiali) – echivalent cu get_text(separator) pe pagina completă."""
+    if isinstance(markup, bytes):
+        markup = markup.decode("utf-8", errors="replace")
+    markup = _NON_TEXT_RE.sub("", markup)
+    parts = [html_lib.unescape(p) for p in _TAG_RE.split(markup)]
+    return separator.join(p for p in parts if p)
+
+
+def _selectolax_text(markup, separator: str) -> str:
+    from selectolax.parser import HTMLParser
+
+    if isinstance(markup, bytes):
+        markup = markup.decode("utf-8", errors="replace")
+    tree = HTMLParser(markup)
+    tree.strip_tags(_NON_TEXT_TAGS)
+    root = tree.root
+    return root.text(separator=separator) if root is not None else ""
@@ -0,0 +1,164 @@
+"""
+Pipeline cu etape concurente: scrape → enrich → upload → rând CSV.
+Fiecare etapă are propriii workeri (thread-uri) și o coadă limitată la intrare,
+astfel încât etapele se suprapun (timpul total ≈ etapa cea mai lentă, nu suma lor)
+iar memoria rămâne limitată. Ieșirea (sink) primește rezultatele în ordinea de intrare.
+"""
+import queue
+import threading
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+_END = object()  # Marker sfârșit de flux între etape
+
+
+class _Job:
+    """Un element care trece prin etape: număr de ordine + valoare curentă sau eroare."""
+
+    __slots__ = ("seq", "value", "error", "stage")
+
+    def __init__(self, seq: int, value: Any):
+        self.seq = seq
+        self.value = value
+        self.error: Optional[BaseException] = None
+        self.stage: str = ""  # Etapa în care a apărut eroarea
+
+
+class StagedPipeline:
+    """
+    stages: listă de (nume, funcție(valoare) -> valoare_nouă, nr_workeri) sau
+    (nume, funcție(listă valori) -> listă valori, 1, mărime_lot) – etapă de lot: un singur worker adună
+    mărime_lot elemente (sau restul, la sfârșitul fluxului) și le procesează împreună; etapa anterioară
+    (ex. sursa) continuă să trimită elemente cât timp lotul e procesat.
+    queue_size: câte elemente pot aștepta între două etape (backpressure).
+    Un element care aruncă excepție sare peste etapele rămase și ajunge la sink cu eroarea.
+    """
+
+    def __init__(self, stages: List[Tuple], queue_size: int = 4):
+        if not stages:
+            raise ValueError("Pipeline fără etape")
+        self.stages = []
+        for stage in stages:
+            name, func, workers = stage[:3]
+            batch = max(1, int(stage[3] or 1)) if len(stage) > 3 else 1
+            self.stages.append((name, func, 1 if batch > 1 else max(1, int(workers or 1)), batch))
+        self.queue_size = max(1, int(queue_size or 1))
+
+    def run(self, source: Iterable[Any], sink: Callable[[int, Any, Optional[BaseException], str], None]) -> int:
+        """
+        Consumă source pe thread-ul curent (poate conține popup-uri / interacțiune),
+        rulează etapele în paralel și apelează sink(seq, valoare, eroare, etapa) în ordinea seq.
+        Returnează numărul de elemente introduse în pipeline.
+        """
+        # Coada din fața unei etape de lot încape un lot întreg în plus, ca sursa să nu aștepte lotul în curs
+        queues = [queue.Queue(maxsize=max(self.queue_size, stage[3] * 2 if stage[3] > 1 else 0))
+                  for stage in self.stages]
+        queues.append(queue.Queue(maxsize=self.queue_size))
+        threads = []
+        for i, (name, func, workers, batch) in enumerate(self.stages):
+            remaining = [workers]
+            lock = threading.Lock()
+            for w in range(workers):
+                if batch > 1:
+                    target, args = self._batch_worker, (name, func, batch, queues[i], queues[i + 1])
+                else:
+                    target, args = self._stage_worker, (name, func, queues[i], queues[i + 1], remaining, lock)
+                t = threading.Thread(
+                    target=target,
+                    args=args,
+                    name=f"pipeline-{name}-{w + 1}",
+                    daemon=True,
+                )
+                t.start()
+                threads.append(t)
+
+        sink_errors: List[BaseException] = []
+        collector = threading.Thread(
+            target=self._collector, args=(queues[-1], sink, sink_errors), name="pipeline-sink", daemon=True
+        )
+        collector.start()
+
+        count = 0
+        try:
+            for value in source:
+                queues[0].put(_Job(count, value))
+                count += 1
+        finally:
+            # Chiar dacă source aruncă, golim pipeline-ul ca elementele deja trimise să ajungă la sink
+            queues[0].put(_END)
+            for t in threads:
+                t.join()
+            collector.join()
+        if sink_errors:
+            raise sink_errors[0]
+        return count
+
+    @staticmethod
+    def _stage_worker(name, func, in_q, out_q, remaining, lock):
+        while True:
+            job = in_q.get()
+            if job is _END:
+                # Ceilalți workeri ai etapei trebuie să vadă și ei sfârșitul fluxului
+                in_q.put(_END)
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    out_q.put(_END)
+                return
+            if job.error is None:
+                try:
+                    job.value = func(job.value)
+                except Exception as e:
+                    job.error = e
+                    job.stage = name
+            out_q.put(job)
+
+    @staticmethod
+    def _batch_worker(name, func, batch, in_q, out_q):
+        buffer: List[_Job] = []
+
+        def flush():
+            ok = [job for job in buffer if job.error is None]
+            if ok:
+                try:
+                    values = list(func([job.value for job in ok]))
+                    if len(values) != len(ok):
+                        raise ValueError(f"Etapa {name}: {len(values)} rezultate pentru {len(ok)} elemente")
+                    for job, value in zip(ok, values):
+                        job.value = value
+                except Exception as e:
+                    for job in ok:
+                        job.error = e
+                        job.stage = name
+            for job in buffer:
+                out_q.put(job)
+            buffer.clear()
+
+        while True:
+            job = in_q.get()
+            if job is _END:
+                flush()
+                out_q.put(_END)
+                return
+            buffer.append(job)
+            if len(buffer) >= batch:
+                flush()
+
+    @staticmethod
+    def _collector(in_q, sink, sink_errors):
+        pending = {}
+        next_seq = 0
+        while True:
+            job = in_q.get()
+            if job is _END:
+                break
+            pending[job.seq] = job
+            while next_seq in pending:
+                ready = pending.pop(next_seq)
+                next_seq += 1
+                if sink_errors:
+                    continue
+                try:
+                    sink(ready.seq, ready.value, ready.error, ready.stage)
+                except Exception as e:
+                    sink_errors.append(e)
@@ -0,0 +1,156 @@
+"""
+Limitare rată per host (token bucket) + concurență adaptivă, partajate de toate sesiunile din proces.
+Fiecare furnizor își configurează host-ul (rate_limit în config.json); la 429 / 403 / 5xx sau erori
+de conexiune limitele scad la jumătate și host-ul e pus pe pauză, apoi cresc treptat cât răspunsurile
+sunt OK (AIMD) – în loc de time.sleep fix între request-uri.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+# Statusuri la care serverul ne spune (explicit sau nu) să încetinim
+THROTTLE_STATUSES = frozenset({403, 429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Retry-After în secunde (acceptă doar forma numerică și data HTTP)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class HostLimiter:
+    """
+    Token bucket (requests_per_second, rafală = burst) + număr maxim de request-uri în zbor.
+    Ambele limite se ajustează: jumătate la throttle, +1 / +25% după ramp_after răspunsuri OK consecutive.
+    """
+
+    def __init__(self, host: str, requests_per_second: float = 4.0, max_in_flight: int = 4, burst: Optional[float] = None,
+                 ramp_after: int = 10, max_backoff: float = 60.0,
+                 on_backoff: Optional[Callable[[str, str], None]] = None):
+        self.host = host
+        self._cond = threading.Condition()
+        self.on_backoff = on_backoff
+        self.ramp_after = max(1, int(ramp_after))
+        self.max_backoff = float(max_backoff)
+        self.configure(requests_per_second, max_in_flight, burst)
+        self.rate = self.max_rate
+        self.limit = self.max_in_flight
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._ok_streak = 0
+        self._fail_streak = 0
+        self._paused_until = 0.0
+        self.stats: Dict[str, int] = {"requests": 0, "throttled": 0, "waits": 0}
+
+    def configure(self, requests_per_second: float, max_in_flight: int, burst: Optional[float] = None) -> None:
+        """(Re)setează limitele maxime; starea adaptivă curentă se păstrează în noile limite."""
+        with self._cond:
+            self.max_rate = max(0.05, float(requests_per_second))
+            self.min_rate = min(self.max_rate, 0.1)
+            self.max_in_flight = max(1, int(max_in_flight))
+            self.burst = max(1.0, float(burst if burst is not None else self.max_in_flight))
+            if hasattr(self, "rate"):
+                self.rate = min(self.rate, self.max_rate)
+                self.limit = min(self.limit, self.max_in_flight)
+            self._cond.notify_all()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self) -> None:
+        """Blochează până există un token și un loc liber sub limita de concurență."""
+        waited = False
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._in_flight < self.limit and self._tokens >= 1:
+                    self._tokens -= 1
+                    self._in_flight += 1
+                    self.stats["requests"] += 1
+                    if waited:
+                        self.stats["waits"] += 1
+                    return
+                waited = True
+                if now < self._paused_until:
+                    timeout = self._paused_until - now
+                elif self._in_flight >= self.limit:
+                    timeout = None  # așteaptă release()
+                else:
+                    timeout = (1 - self._tokens) / self.rate
+                self._cond.wait(timeout)
+
+    def release(self, status: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        """status=None → eroare de conexiune / timeout (tratată ca throttle)."""
+        reason = None
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            if status is None or status in THROTTLE_STATUSES:
+                self._ok_streak = 0
+                self._fail_streak += 1
+                self.stats["throttled"] += 1
+                self.limit = max(1, self.limit // 2)
+                self.rate = max(self.min_rate, self.rate / 2)
+                pause = retry_after if retry_after is not None else min(self.max_backoff, 2 ** (self._fail_streak - 1))
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                reason = (f"{'eroare conexiune' if status is None else f'HTTP {status}'} → pauză {pause:.1f}s, "
+                          f"{self.rate:.2f} req/s, max {self.limit} simultan")
+            else:
+                self._fail_streak = 0
+                self._ok_streak += 1
+                if self._ok_streak >= self.ramp_after and (self.limit < self.max_in_flight or self.rate < self.max_rate):
+                    self._ok_streak = 0
+                    self.limit = min(self.max_in_flight, self.limit + 1)
+                    self.rate = min(self.max_rate, self.rate * 1.25)
+            self._cond.notify_all()
+        if reason and self.on_backoff:
+            try:
+                self.on_backoff(self.host, reason)
+            except Exception:
+                pass
+
+    @contextmanager
+    def slot(self):
+        """with limiter.slot() as s: r = ...; s["status"] = r.status_code – fără status = eșec."""
+        self.acquire()
+        outcome = {"status": None, "retry_after": None}
+        try:
+            yield outcome
+        finally:
+            self.release(outcome["status"], outcome["retry_after"])
+
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def configure_host(host: str, requests_per_second: float, max_in_flight: int, burst: Optional[float] = None,
+                   on_backoff: Optional[Callable[[str, str], None]] = None) -> HostLimiter:
+    """Înregistrează (sau actualizează) limitele unui host; același limiter e folosit de toate sesiunile."""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = HostLimiter(host, requests_per_second, max_in_flight, burst,
+                                                    on_backoff=on_backoff)
+        else:
+            limiter.configure(requests_per_second, max_in_flight, burst)
+            if on_backoff is not None:
+                limiter.on_backoff = on_backoff
+        return limiter
+
+
+def limiter_for(host: str) -> Optional[HostLimiter]:
+    """Limiter-ul host-ului sau None (host neconfigurat → fără limitare)."""
+    return _limiters.get(host)
@@ -0,0 +1,160 @@
+"""
+Politică comună de retry (backoff exponențial cu jitter, Retry-After) + circuit breaker per host.
+Aplicată automat tuturor sesiunilor din build_http_session (RateLimitedAdapter); după N eșecuri
+consecutive host-ul e „deschis” și request-urile eșuează imediat (CircuitOpenError) până la
+următoarea probă – un furnizor căzut nu mai blochează lotul paralel cu timeout-uri de 30s per produs.
+"""
+import random
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import requests
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Host-ul a avut prea multe eșecuri consecutive – request-ul nu se mai trimite."""
+
+
+class RetryPolicy:
+    """
+    max_attempts: încercări totale (1 = fără retry). Întârzierea = random(0, base_delay × 2^încercare),
+    plafonată la max_delay; Retry-After de la server are prioritate.
+    retry_methods: metodele reîncercate la erori de conexiune și la retry_statuses – implicit doar cele
+    idempotente (un POST cu 502 / conexiune căzută poate fi deja procesat, ex. upload media WordPress).
+    Un apelant pentru care repetarea e inofensivă (ex. generare Ollama) adaugă explicit "POST".
+    retry_statuses_any_method: reîncercate pentru orice metodă – serverul a refuzat cererea fără s-o proceseze
+    (429; 503 doar dacă trimite Retry-After, ex. mentenanță / rate limit WordPress).
+    retry_read_timeouts: None → doar pentru retry_methods.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 retry_statuses=(429, 500, 502, 503, 504), retry_read_timeouts: Optional[bool] = None,
+                 retry_methods: Iterable[str] = IDEMPOTENT_METHODS, retry_statuses_any_method=(429,)):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(0.0, float(max_delay))
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_read_timeouts = retry_read_timeouts
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.retry_statuses_any_method = frozenset(retry_statuses_any_method)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_delay * 2)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def retries_method(self, method: str = "GET") -> bool:
+        return (method or "GET").upper() in self.retry_methods
+
+    def retries_error(self, error: Exception, method: str = "GET") -> bool:
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True  # conexiunea nu s-a stabilit – serverul n-a primit nimic
+        if isinstance(error, requests.exceptions.Timeout):
+            if self.retry_read_timeouts is None:
+                return self.retries_method(method)
+            return self.retry_read_timeouts
+        return isinstance(error, requests.exceptions.ConnectionError) and self.retries_method(method)
+
+    def retries_status(self, status: int, method: str = "GET", retry_after: Optional[float] = None) -> bool:
+        if status not in self.retry_statuses:
+            return False
+        if self.retries_method(method) or status in self.retry_statuses_any_method:
+            return True
+        return status == 503 and retry_after is not None
+
+
+class CircuitBreaker:
+    """
+    closed → (failure_threshold eșecuri consecutive) → open → (după reset_after s) half-open:
+    o singură probă; succes → closed, eșec → open din nou.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_after: float = 60.0,
+                 on_change: Optional[Callable[[str, str], None]] = None):
+        self.host = host
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_after = max(1.0, float(reset_after))
+        self.on_change = on_change
+        self._lock = threading.Lock()
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_request(self) -> None:
+        """Ridică CircuitOpenError dacă host-ul e deschis (sau proba half-open e deja în curs)."""
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_after:
+                self.state = "half-open"
+                self._probe_in_flight = False
+            if self.state == "half-open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            remaining = max(0.0, self.reset_after - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(f"{self.host}: circuit deschis după {self.failure_threshold} eșecuri consecutive "
+                               f"(reîncercare în {remaining:.0f}s)")
+
+    def record_success(self) -> None:
+        with self._lock:
+            changed = self.state != "closed"
+            self.state = "closed"
+            self._failures = 0
+            self._probe_in_flight = False
+        if changed:
+            self._notify("închis – host-ul răspunde din nou")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            opened = self.state == "half-open" or (self.state == "closed" and self._failures >= self.failure_threshold)
+            if opened:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+        if opened:
+            self._notify(f"deschis după {self._failures} eșecuri consecutive – request-urile eșuează imediat "
+                         f"{self.reset_after:.0f}s")
+
+    def _notify(self, message: str) -> None:
+        if self.on_change:
+            try:
+                self.on_change(self.host, message)
+            except Exception:
+                pass
+
+
+_policies: Dict[str, Tuple[RetryPolicy, CircuitBreaker]] = {}
+_policies_lock = threading.Lock()
+
+
+def configure_retry(host: str, policy: Optional[RetryPolicy] = None, failure_threshold: int = 5,
+                    reset_after: float = 60.0, on_change: Optional[Callable[[str, str], None]] = None
+                    ) -> Tuple[RetryPolicy, CircuitBreaker]:
+    """Setează politica host-ului; breaker-ul existent (și starea lui) se păstrează."""
+    with _policies_lock:
+        current = _policies.get(host)
+        breaker = current[1] if current else CircuitBreaker(host, failure_threshold, reset_after, on_change)
+        breaker.failure_threshold = max(1, int(failure_threshold))
+        breaker.reset_after = max(1.0, float(reset_after))
+        if on_change is not None:
+            breaker.on_change = on_change
+        _policies[host] = (policy or RetryPolicy(), breaker)
+        return _policies[host]
+
+
+def retry_for(host: str) -> Tuple[RetryPolicy, CircuitBreaker]:
+    """Politica host-ului; host-urile neconfigurate primesc valorile implicite (3 încercări, breaker la 5)."""
+    current = _policies.get(host)
+    if current is not None:
+        return current
+    with _policies_lock:
+        if host not in _policies:
+            _policies[host] = (RetryPolicy(), CircuitBreaker(host))
+        return _policies[host]
@@ -0,0 +1,238 @@
+"""
+Date structurate din pagina de produs: JSON-LD (schema.org Product), microdata (itemprop) și
+starea JS de e-commerce (var ecommerce = {...} / dataLayer GA4).
+Scraper-ele iau de aici nume, preț, SKU, GTIN, disponibilitate și imagini înainte de selectorii DOM –
+majoritatea paginilor de magazin le publică pentru Google, iar un find_all pe scripturi e mult mai
+ieftin decât zecile de select_one pe tot arborele. Câmpurile lipsă rămân pe fallback-ul DOM.
+"""
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+from .parsing import soup_markup
+
+GTIN_KEYS = ("gtin13", "gtin", "gtin14", "gtin12", "gtin8", "ean")
+_GTIN_RE = re.compile(r"^\d{8,14}$")
+
+# schema.org/ItemAvailability → valorile folosite de detect_availability
+_AVAILABILITY = {
+    "instock": "in_stock", "limitedavailability": "in_stock", "instoreonly": "in_stock",
+    "onlineonly": "in_stock", "madetoorder": "in_stock",
+    "preorder": "preorder", "presale": "preorder", "backorder": "preorder",
+    "outofstock": "out_of_stock", "soldout": "out_of_stock", "discontinued": "out_of_stock",
+}
+
+_ECOMMERCE_RE = re.compile(r"\b(?:var\s+ecommerce\s*=|[\"']?ecommerce[\"']?\s*:)\s*\{")
+_JS_FIELDS = {
+    "sku": re.compile(r"[\"']item_id[\"']\s*:\s*[\"']?([^\"',}\s]+)"),
+    "name": re.compile(r"[\"']item_name[\"']\s*:\s*\"((?:[^\"\\]|\\.)*)\""),
+    "price": re.compile(r"[\"']price[\"']\s*:\s*[\"']?(\d+(?:\.\d+)?)"),
+    "currency": re.compile(r"[\"']currency[\"']\s*:\s*[\"']([A-Za-z]{3})[\"']"),
+}
+_JSON_LD_RE = re.compile(r"<script[^>]+application/ld\+json[^>]*>(.*?)</script\s*>", re.S | re.I)
+
+
+def iter_json_ld(data: Any) -> Iterator[Dict]:
+    """Obiectele dintr-un bloc JSON-LD (liste și @graph aplatizate)."""
+    if isinstance(data, list):
+        for item in data:
+            yield from iter_json_ld(item)
+    elif isinstance(data, dict):
+        if isinstance(data.get("@graph"), list):
+            yield from iter_json_ld(data["@graph"])
+        else:
+            yield data
+
+
+def _types(item: Dict) -> List[str]:
+    value = item.get("@type") or []
+    return [str(t).split("/")[-1] for t in (value if isinstance(value, list) else [value])]
+
+
+def normalize_availability(value: Any) -> str:
+    """'https://schema.org/InStock' / 'InStock' / 'in stock' → in_stock | preorder | out_of_stock | ''."""
+    key = re.sub(r"[^a-z]", "", str(value or "").rsplit("/", 1)[-1].lower())
+    return _AVAILABILITY.get(key, "")
+
+
+def _to_price(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().replace("\xa0", "").replace(" ", "")
+    if "," in text and "." in text:
+        text = text.replace(".", "").replace(",", ".") if text.rfind(",") > text.rfind(".") else text.replace(",", "")
+    else:
+        text = text.replace(",", ".")
+    m = re.search(r"\d+(?:\.\d+)?", text)
+    return float(m.group(0)) if m else None
+
+
+def _image_urls(value: Any) -> List[str]:
+    urls = []
+    for img in value if isinstance(value, list) else [value]:
+        if isinstance(img, dict):
+            img = img.get("contentUrl") or img.get("url")
+        if isinstance(img, str) and img.strip():
+            urls.append(img.strip())
+    return urls
+
+
+def _set(data: Dict, key: str, value: Any) -> None:
+    """Prima sursă găsită câștigă (JSON-LD > microdata > JS)."""
+    if value not in (None, "", []) and key not in data:
+        data[key] = value
+
+
+def _set_price(data: Dict, price: Optional[float], currency: Any) -> None:
+    """Prețul și moneda vin mereu din aceeași sursă (altfel filtrul EUR ar compara mere cu pere)."""
+    if price and "price" not in data:
+        data["price"] = price
+        _set(data, "currency", str(currency or "").upper())
+
+
+def _from_json_ld_product(item: Dict, data: Dict) -> None:
+    if isinstance(item.get("name"), str):
+        _set(data, "name", item["name"].strip())
+    _set(data, "sku", str(item.get("sku") or item.get("mpn") or "").strip())
+    for key in GTIN_KEYS:
+        value = str(item.get(key) or "").strip()
+        if _GTIN_RE.match(value):
+            _set(data, "gtin", value)
+            break
+    if isinstance(item.get("description"), str):
+        _set(data, "description", item["description"].strip())
+    brand = item.get("brand")
+    if isinstance(brand, dict):
+        brand = brand.get("name")
+    _set(data, "brand", brand.strip() if isinstance(brand, str) else "")
+    _set(data, "images", _image_urls(item.get("image")))
+
+    offers = item.get("offers") or []
+    for offer in offers if isinstance(offers, list) else [offers]:
+        if not isinstance(offer, dict):
+            continue
+        price = offer.get("price", offer.get("lowPrice"))
+        if price is None and isinstance(offer.get("priceSpecification"), dict):
+            price = offer["priceSpecification"].get("price")
+        _set_price(data, _to_price(price), offer.get("priceCurrency"))
+        _set(data, "availability", normalize_availability(offer.get("availability")))
+        if "gtin" not in data:
+            for key in GTIN_KEYS:
+                value = str(offer.get(key) or "").strip()
+                if _GTIN_RE.match(value):
+                    _set(data, "gtin", value)
+                    break
+
+
+def _json_ld_blocks(soup) -> List[str]:
+    markup = soup_markup(soup)
+    if markup is not None:
+        if isinstance(markup, bytes):
+            markup = markup.decode("utf-8", errors="replace")
+        return _JSON_LD_RE.findall(markup)
+    return [s.string or s.get_text() for s in soup.find_all("script", type="application/ld+json")]
+
+
+def _from_json_ld(soup, data: Dict) -> None:
+    for block in _json_ld_blocks(soup):
+        try:
+            parsed = json.loads(block.strip() or "{}")
+        except ValueError:
+            continue
+        for item in iter_json_ld(parsed):
+            types = _types(item)
+            if "ProductGroup" in types and isinstance(item.get("hasVariant"), list):
+                _from_json_ld_product(item, data)
+                for variant in item["hasVariant"][:1]:
+                    if isinstance(variant, dict):
+                        _from_json_ld_product(variant, data)
+            elif "Product" in types:
+                _from_json_ld_product(item, data)
+
+
+def _itemprop_value(el) -> str:
+    for attr in ("content", "href", "src", "value"):
+        if el.get(attr):
+            return str(el.get(attr)).strip()
+    return el.get_text(" ", strip=True)
+
+
+def _from_microdata(soup, data: Dict) -> None:
+    scope = soup.select_one("[itemtype*='schema.org/Product']")
+    if scope is None:
+        return  # itemprop-uri din afara unui Product (Organization, BreadcrumbList) nu sunt ale produsului
+    props: Dict[str, List] = {}
+    for el in scope.select("[itemprop]"):
+        for prop in (el.get("itemprop") or "").split():
+            props.setdefault(prop, []).append(el)
+    if not props:
+        return
+
+    def first(prop):
+        for el in props.get(prop, []):
+            value = _itemprop_value(el)
+            if value:
+                return value
+        return ""
+
+    _set(data, "name", first("name"))
+    _set(data, "sku", first("sku") or first("mpn"))
+    for key in GTIN_KEYS:
+        value = first(key)
+        if _GTIN_RE.match(value):
+            _set(data, "gtin", value)
+            break
+    _set_price(data, _to_price(first("price") or first("lowPrice")), first("priceCurrency"))
+    _set(data, "availability", normalize_availability(first("availability")))
+    _set(data, "images", [_itemprop_value(el) for el in props.get("image", []) if _itemprop_value(el)])
+
+
+def _script_texts(soup) -> Iterator[str]:
+    markup = soup_markup(soup)
+    if markup is not None:
+        yield markup.decode("utf-8", errors="replace") if isinstance(markup, bytes) else markup
+        return
+    for script in soup.find_all("script"):
+        if not script.get("src") and script.get("type") != "application/ld+json":
+            yield script.string or ""
+
+
+def _from_js_state(soup, data: Dict) -> None:
+    for text in _script_texts(soup):
+        m = _ECOMMERCE_RE.search(text)
+        if not m:
+            continue
+        block = text[m.end() - 1:m.end() + 4000]
+        found = {key: rx.search(block) for key, rx in _JS_FIELDS.items()}
+        if found["sku"]:
+            _set(data, "sku", found["sku"].group(1))
+        if found["name"]:
+            try:
+                _set(data, "name", json.loads(f'"{found["name"].group(1)}"').strip())
+            except ValueError:
+                pass
+        if found["price"]:
+            _set_price(data, float(found["price"].group(1)), found["currency"] and found["currency"].group(1))
+        return
+
+
+def structured_product(soup) -> Dict[str, Any]:
+    """
+    Câmpurile de produs găsite în datele structurate: name, price, currency, sku, gtin, availability,
+    images, description, brand (doar cele prezente). Calculat o singură dată per soup.
+    """
+    if soup is None or not hasattr(soup, "find_all"):
+        return {}
+    cached = soup.__dict__.get("_webgsm_structured")
+    if cached is not None:
+        return cached
+    data: Dict[str, Any] = {}
+    for extract in (_from_json_ld, _from_microdata, _from_js_state):
+        try:
+            extract(soup, data)
+        except Exception:
+            continue  # date structurate invalide → rămâne fallback-ul DOM
+    soup.__dict__["_webgsm_structured"] = data
+    return data
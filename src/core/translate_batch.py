@@ -0,0 +1,161 @@
+"""
+Traducere în lot: multe texte scurte (titluri, descrieri, taguri ale mai multor produse) împachetate
+în cât mai puține cereri către serviciul de traducere, în limita de caractere per cerere.
+Fiecare rând ne-gol al unui text e un segment; segmentele se unesc cu '\\n' (Google Translate păstrează
+de obicei rândurile) și rezultatul se împarte înapoi pe rânduri. La primul pachet al cărui număr de rânduri
+nu corespunde (rânduri unite / despărțite de traducător), lotul renunță la împachetare: textele încă
+netraduse se trimit câte unul, ca înainte de traducerea în lot (fără înjumătățiri repetate, costul rămâne
+apropiat de o cerere per text). Și în fallback cererile rămân ≤ max_chars: un text lung se trimite pe bucăți
+de rânduri întregi, iar un singur rând prea lung se taie la final de propoziție.
+"""
+import re
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Google Translate acceptă max 5000 caractere per cerere; păstrăm o marjă
+DEFAULT_MAX_CHARS = 4500
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…;])\s+")
+
+
+class BatchTranslator:
+    """
+    translate(text) -> text tradus (ex. GoogleTranslator(...).translate).
+    on_error(excepție): apelat când o cerere eșuează; segmentele ei rămân netraduse.
+    requests = numărul de cereri făcute (pentru metrici / log).
+    """
+
+    def __init__(self, translate: Callable[[str], str], max_chars: int = DEFAULT_MAX_CHARS,
+                 on_error: Optional[Callable[[BaseException], None]] = None):
+        self._translate = translate
+        self.max_chars = max(1, int(max_chars))
+        self.on_error = on_error
+        self.requests = 0
+
+    def _call(self, text: str) -> Optional[str]:
+        self.requests += 1
+        try:
+            return self._translate(text)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(e)
+            return None
+
+    def _pack(self, segments: Sequence[str]) -> List[List[int]]:
+        """Indici de segmente grupați greedy, fiecare grup ≤ max_chars (un segment prea lung rămâne singur
+        și se trimite tăiat pe propoziții)."""
+        packs, current, size = [], [], 0
+        for i, seg in enumerate(segments):
+            extra = len(seg) + (1 if current else 0)
+            if current and size + extra > self.max_chars:
+                packs.append(current)
+                current, size = [], 0
+                extra = len(seg)
+            current.append(i)
+            size += extra
+        if current:
+            packs.append(current)
+        return packs
+
+    def _split_line(self, line: str) -> List[str]:
+        """Un rând > max_chars → bucăți ≤ max_chars, tăiate la final de propoziție (altfel la spațiu / fix)."""
+        pieces: List[str] = []
+        current = ""
+        for sentence in _SENTENCE_END.split(line):
+            while len(sentence) > self.max_chars:
+                cut = sentence.rfind(" ", 0, self.max_chars + 1)
+                cut = cut if cut > 0 else self.max_chars
+                if current:
+                    pieces.append(current)
+                    current = ""
+                pieces.append(sentence[:cut].strip())
+                sentence = sentence[cut:].strip()
+            if current and len(current) + 1 + len(sentence) > self.max_chars:
+                pieces.append(current)
+                current = ""
+            current = f"{current} {sentence}" if current else sentence
+        if current:
+            pieces.append(current)
+        return [p for p in pieces if p]
+
+    def _text_chunks(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Textul în bucăți ≤ max_chars pentru fallback: (separator față de bucata anterioară, bucată).
+        Rândurile întregi se adună greedy ca la _pack; rândurile goale rămân în separator.
+        """
+        units: List[Tuple[str, str]] = []
+        blank = ""  # rânduri goale dinaintea rândului curent
+        for line in (text or "").split("\n"):
+            line = line.strip()
+            if not line:
+                blank += "\n" if units else ""
+                continue
+            pieces = self._split_line(line) if len(line) > self.max_chars else [line]
+            units.append(("\n" + blank if units else "", pieces[0]))
+            units.extend((" ", piece) for piece in pieces[1:])
+            blank = ""
+        chunks: List[Tuple[str, str]] = []
+        for unit_sep, piece in units:
+            if chunks and len(chunks[-1][1]) + len(unit_sep) + len(piece) <= self.max_chars:
+                chunks[-1] = (chunks[-1][0], chunks[-1][1] + unit_sep + piece)
+            else:
+                chunks.append((unit_sep, piece))
+        return chunks
+
+    def _translate_text(self, text: str) -> Optional[str]:
+        """Fallback pentru un text: o cerere per bucată ≤ max_chars; None dacă vreo cerere eșuează."""
+        parts = []
+        for sep, chunk in self._text_chunks(text):
+            result = self._call(chunk)
+            if result is None:
+                return None
+            parts.append(sep + result.strip())
+        return "".join(parts)
+
+    def _translate_pack(self, segments: Sequence[str], pack: List[int], out: List[Optional[str]]) -> bool:
+        """Traduce un pachet; False dacă rândurile primite nu se pot mapa pe segmente (out rămâne neatins)."""
+        if len(pack) == 1 and len(segments[pack[0]]) > self.max_chars:
+            out[pack[0]] = self._translate_text(segments[pack[0]])  # rând prea lung → pe propoziții
+            return True
+        result = self._call("\n".join(segments[i] for i in pack))
+        if result is None:
+            return True  # eroare deja raportată – segmentele rămân netraduse
+        if len(pack) == 1:
+            out[pack[0]] = result.strip()
+            return True
+        lines = [line.strip() for line in result.split("\n") if line.strip()]
+        if len(lines) != len(pack):
+            return False
+        for i, line in zip(pack, lines):
+            out[i] = line
+        return True
+
+    def translate(self, texts: Sequence[str]) -> List[Optional[str]]:
+        """Traducerile în ordinea textelor; None pentru textele la care o cerere a eșuat."""
+        segments: List[str] = []
+        layout: List[List[Tuple[str, Optional[int]]]] = []  # per text: (rând original, index segment)
+        for text in texts:
+            lines = []
+            for line in (text or "").split("\n"):
+                if line.strip():
+                    lines.append((line, len(segments)))
+                    segments.append(line.strip())
+                else:
+                    lines.append((line, None))
+            layout.append(lines)
+
+        translated: List[Optional[str]] = [None] * len(segments)
+        unmapped = set()  # segmente din pachetul nepotrivit + cele netrimise după el
+        for pack in self._pack(segments):
+            if unmapped or not self._translate_pack(segments, pack, translated):
+                unmapped.update(pack)
+
+        results: List[Optional[str]] = []
+        for text, lines in zip(texts, layout):
+            if any(seg in unmapped for _, seg in lines):
+                # Fallback: textul pe cât mai puține cereri ≤ max_chars (rândurile lui rămân împreună)
+                results.append(self._translate_text(text))
+            elif any(seg is not None and translated[seg] is None for _, seg in lines):
+                results.append(None)
+            else:
+                results.append("\n".join(line if seg is None else translated[seg] for line, seg in lines))
+        return results
@@ -0,0 +1,240 @@
+"""
+Cache persistent pentru traduceri (Google Translate), comun tuturor rulărilor și furnizorilor.
+KeyValueCache refolosește explicit același stocaj pentru valori care nu sunt traduceri (generările Ollama,
+cache/ollama_fields.sqlite3): fișier separat, cheie simplă, fără pereche de limbi.
+Cheie = SHA-1 pe textul complet + perechea de limbi (+ motorul de traducere), deci două descrieri
+care încep la fel nu se mai confundă. Stocare SQLite într-un singur fișier (cache/translations.sqlite3):
+intrările mai vechi decât TTL-ul sunt ignorate, iar peste max_entries se elimină cele folosite
+cel mai demult (LRU după ultima citire). Ultima citire se ține în memorie și se scrie pe disc grupat
+(la put / curățenie / flush / close), nu câte un UPDATE + commit la fiecare hit.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS translations_used_at ON translations(used_at);
+"""
+# Curățenia LRU rulează o dată la atâtea scrieri (nu la fiecare put)
+_PRUNE_EVERY = 200
+# Câte hit-uri (used_at) se adună în memorie înainte de o scriere grupată
+_TOUCH_FLUSH_EVERY = 500
+
+
+class TranslationCache:
+    """
+    Cache thread-safe text → traducere. max_entries=0 → fără limită; ttl_days=0 → fără expirare.
+    on_event(kind): apelat la fiecare get cu "hit" sau "miss" (ex. RunMetrics.incr).
+    """
+
+    def __init__(self, path, max_entries: int = 50000, ttl_days: float = 90,
+                 on_event: Optional[Callable[[str], None]] = None):
+        self.path = Path(path)
+        self.max_entries = max(0, int(max_entries or 0))
+        self.ttl_seconds = max(0.0, float(ttl_days or 0)) * 86400
+        self.on_event = on_event
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        self._touched: Dict[str, float] = {}  # cheie → ultima citire, încă nescrisă pe disc
+        self.stats: Dict[str, int] = {"hit": 0, "miss": 0}
+
+    @staticmethod
+    def key_for(text: str, source: str, target: str, engine: str = "google") -> str:
+        return hashlib.sha1(f"{engine}\n{source}\n{target}\n{text}".encode("utf-8")).hexdigest()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+                try:
+                    # WAL: citirile nu blochează scrierile (mai multe procese import_cli pe același fișier);
+                    # NORMAL: fără fsync la fiecare commit – la crash se pierd cel mult ultimele intrări din cache
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                except sqlite3.Error:
+                    pass  # ex. fișier pe share de rețea fără WAL – rămâne jurnalul implicit
+                conn.executescript(_SCHEMA)
+                self._conn = conn
+            except sqlite3.Error:
+                return None
+        return self._conn
+
+    def _count(self, kind: str) -> None:
+        self.stats[kind] = self.stats.get(kind, 0) + 1
+        if self.on_event:
+            try:
+                self.on_event(kind)
+            except Exception:
+                pass
+
+    def get(self, text: str, source: str, target: str, engine: str = "google") -> Optional[str]:
+        """Traducerea salvată sau None (lipsă / expirată / cache indisponibil)."""
+        key = self.key_for(text, source, target, engine)
+        now = time.time()
+        translated = None
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                try:
+                    row = conn.execute("SELECT translated, created_at FROM translations WHERE key = ?", (key,)).fetchone()
+                    if row and (not self.ttl_seconds or now - row[1] < self.ttl_seconds):
+                        translated = row[0]
+                        self._touched[key] = now
+                        if len(self._touched) >= _TOUCH_FLUSH_EVERY:
+                            self._flush_touched(conn)
+                            conn.commit()
+                except sqlite3.Error:
+                    translated = None
+            self._count("hit" if translated is not None else "miss")
+        return translated
+
+    def has(self, text: str, source: str, target: str, engine: str = "google") -> bool:
+        """Există o intrare validă (fără a număra hit/miss și fără a actualiza LRU)."""
+        key = self.key_for(text, source, target, engine)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return False
+            try:
+                row = conn.execute("SELECT created_at FROM translations WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                return False
+        return bool(row) and (not self.ttl_seconds or time.time() - row[0] < self.ttl_seconds)
+
+    def put(self, text: str, source: str, target: str, translated: str, engine: str = "google") -> None:
+        if translated is None:
+            return
+        key = self.key_for(text, source, target, engine)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO translations (key, source, target, translated, created_at, used_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, source, target, translated, now, now),
+                )
+                self._touched.pop(key, None)
+                self._flush_touched(conn)
+                self._writes += 1
+                if self._writes % _PRUNE_EVERY == 1:
+                    self._prune(conn, now)
+                conn.commit()
+            except sqlite3.Error:
+                pass  # cache-ul e doar o optimizare
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        """Scrie ultimele citiri adunate în memorie (un singur executemany; commit-ul e la apelant)."""
+        if self._touched:
+            conn.executemany("UPDATE translations SET used_at = ? WHERE key = ?",
+                             [(used_at, key) for key, used_at in self._touched.items()])
+            self._touched.clear()
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """Șterge intrările expirate, apoi pe cele mai puțin recent folosite peste max_entries."""
+        self._flush_touched(conn)  # LRU după citirile reale, inclusiv cele încă în memorie
+        if self.ttl_seconds:
+            conn.execute("DELETE FROM translations WHERE created_at < ?", (now - self.ttl_seconds,))
+        if self.max_entries:
+            conn.execute(
+                "DELETE FROM translations WHERE key IN ("
+                "SELECT key FROM translations ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            try:
+                return conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] if conn else 0
+            except sqlite3.Error:
+                return 0
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {"hit": 0, "miss": 0}
+
+    def hit_rate(self) -> float:
+        with self._lock:
+            total = sum(self.stats.values())
+            hits = self.stats.get("hit", 0)
+        return hits / total if total else 0.0
+
+    def summary(self) -> str:
+        with self._lock:
+            stats = dict(self.stats)
+        total = sum(stats.values())
+        return (f"{stats['hit']} hit, {stats['miss']} traduse din {total} texte – "
+                f"{self.hit_rate() * 100:.0f}% servite din cache ({len(self)} intrări pe disc)")
+
+    def flush(self) -> None:
+        """Scrie pe disc citirile (used_at) încă ținute în memorie – ex. la sfârșitul unei rulări."""
+        with self._lock:
+            if self._conn is not None and self._touched:
+                try:
+                    self._flush_touched(self._conn)
+                    self._conn.commit()
+                except sqlite3.Error:
+                    pass
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+
+
+class KeyValueCache:
+    """
+    Cache cheie → valoare text peste TranslationCache (aceeași tabelă SQLite, LRU și TTL), într-un fișier propriu.
+    namespace ține locul motorului de traducere în cheie; perechea de limbi rămâne goală.
+    """
+
+    def __init__(self, path, namespace: str, max_entries: int = 20000, ttl_days: float = 180,
+                 on_event: Optional[Callable[[str], None]] = None):
+        self.namespace = namespace
+        self._store = TranslationCache(path, max_entries=max_entries, ttl_days=ttl_days, on_event=on_event)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return self._store.stats
+
+    def get(self, key: str) -> Optional[str]:
+        return self._store.get(key, "", "", engine=self.namespace)
+
+    def has(self, key: str) -> bool:
+        return self._store.has(key, "", "", engine=self.namespace)
+
+    def put(self, key: str, value: str) -> None:
+        self._store.put(key, "", "", value, engine=self.namespace)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def reset_stats(self) -> None:
+        self._store.reset_stats()
+
+    def flush(self) -> None:
+        self._store.flush()
+
+    def close(self) -> None:
+        self._store.close()
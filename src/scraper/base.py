@@ -5,6 +5,8 @@ un dict compatibil cu pipeline-ul WebGSM (product_data).
 """
 import json
 import re
+import threading
+import time
 from abc import ABC, abstractmethod
 from urllib.parse import urlparse
 from datetime import datetime
@@ -13,10 +15,29 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from src.core.http import build_http_session, host_label
+from src.core.http_cache import HttpCache
+from src.core.parsing import make_soup, region_strainer, soup_markup, soup_text
+from src.core.ratelimit import configure_host
+from src.core.retry import RetryPolicy, configure_retry
+from src.core.structured_data import structured_product
+
+
+# Regiuni păstrate mereu la parsarea parțială: titlu, meta (og:image), JSON-LD, h1, tabele SKU/EAN/preț
+COMMON_PARSE_REGIONS = [
+    "title", "meta", "link[rel=canonical]", "script[type='application/ld+json']", "h1", "table", "[class*='table']",
+]
+# Chei din config.json → selectors care conțin selectori CSS (restul sunt regex / antete de tabel)
+_REGION_SELECTOR_KEYS = ("name", "price", "description", "images", "sku", "ean", "brand", "availability")
+
 
 class BaseScraper(ABC):
     """Interfață comună pentru toți furnizorii."""
 
+    # Selectori folosiți în cod pe pagina de produs în afara config.json (default-urile scraper-ului).
+    # Împreună cu selectors din config definesc regiunile parsate când partial_parse=true.
+    PARSE_REGIONS: List[str] = []
+
     def __init__(self, config: Dict[str, Any], app: Any):
         """
         config: dict din suppliers/<furnizor>/config.json
@@ -27,6 +48,15 @@ class BaseScraper(ABC):
         self.name = config.get("name", "unknown")
         self.skip_images = config.get("skip_images", False)
         self.session = None  # Session pentru login (dacă e necesar)
+        # Login serializat: cu scrape_workers > 1 mai mulți workeri pot cere login simultan
+        self._login_lock = threading.RLock()
+        # Session keep-alive anonimă (pagini + imagini), creată la primul request
+        self._http = None
+        self._http_lock = threading.Lock()
+        # Cache pe disc pentru pagini (http_cache_ttl_hours în config.json; lipsă / null = dezactivat)
+        self._cache = None
+        self._strainer = None
+        self._configure_host_policies()
 
     def log(self, message: str, level: str = "INFO"):
         """Redirect la logger-ul aplicației."""
@@ -46,6 +76,133 @@ class BaseScraper(ABC):
             ),
         }
 
+    def _configure_host_policies(self) -> None:
+        """Limiter + retry / circuit breaker pentru host-ul furnizorului, din config.json:
+        rate_limit {requests_per_second, max_in_flight, burst}, retry {max_attempts, base_delay,
+        max_delay, breaker_failures, breaker_reset_s}. Partajate de toate sesiunile care accesează host-ul."""
+        host = host_label(self.config.get("base_url", ""))
+        if not host:
+            return
+        workers = max(1, int(self.config.get("scrape_workers", 1) or 1))
+        rate_limit = self.config.get("rate_limit") or {}
+        configure_host(
+            host,
+            requests_per_second=rate_limit.get("requests_per_second", 4),
+            max_in_flight=rate_limit.get("max_in_flight", workers * 2),
+            burst=rate_limit.get("burst"),
+            on_backoff=self._on_rate_backoff,
+        )
+        retry = self.config.get("retry") or {}
+        configure_retry(
+            host,
+            RetryPolicy(
+                max_attempts=retry.get("max_attempts", 3),
+                base_delay=retry.get("base_delay", 1.0),
+                max_delay=retry.get("max_delay", 30.0),
+            ),
+            failure_threshold=retry.get("breaker_failures", 5),
+            reset_after=retry.get("breaker_reset_s", 60),
+            on_change=self._on_circuit_change,
+        )
+
+    def _on_rate_backoff(self, host: str, reason: str) -> None:
+        self.log(f"   🐢 {host}: {reason}", "WARNING")
+        metrics = getattr(self.app, "metrics", None)
+        if metrics:
+            metrics.incr(f"ratelimit.backoff.{host}")
+
+    def _on_circuit_change(self, host: str, message: str) -> None:
+        self.log(f"   🔌 {host}: circuit {message}", "WARNING")
+        metrics = getattr(self.app, "metrics", None)
+        if metrics and message.startswith("deschis"):
+            metrics.incr(f"circuit_open.{host}")
+
+    def _new_session(self) -> requests.Session:
+        """Session cu pool keep-alive dimensionat după scrape_workers (fiecare worker + imaginile lui)."""
+        workers = max(1, int(self.config.get("scrape_workers", 1) or 1))
+        return build_http_session(pool_size=max(4, workers * 4), on_bytes=self._count_http_bytes)
+
+    def _count_http_bytes(self, host: str, count: int) -> None:
+        metrics = getattr(self.app, "metrics", None)
+        if metrics:
+            metrics.add_bytes(f"http.{host}", count)
+
+    def _http_session(self) -> requests.Session:
+        """Session-ul autentificat (după login) dacă există, altfel sesiunea keep-alive a furnizorului."""
+        if self.session is not None:
+            return self.session
+        with self._http_lock:
+            if self._http is None:
+                self._http = self._new_session()
+            return self._http
+
+    def _http_cache(self) -> Optional[HttpCache]:
+        ttl_hours = self.config.get("http_cache_ttl_hours")
+        if ttl_hours is None or ttl_hours is False or not self.script_dir:
+            return None
+        with self._http_lock:
+            if self._cache is None:
+                self._cache = HttpCache(
+                    Path(self.script_dir) / "cache" / "http" / self.name,
+                    ttl_seconds=float(ttl_hours) * 3600,
+                    on_event=self._count_cache_event,
+                )
+            return self._cache
+
+    def _count_cache_event(self, kind: str) -> None:
+        metrics = getattr(self.app, "metrics", None)
+        if metrics:
+            metrics.incr(f"http_cache.{kind}")
+
+    def cache_summary(self) -> Optional[str]:
+        """Statistici cache pentru sumarul rulării (None dacă cache-ul e dezactivat sau nefolosit)."""
+        if self._cache is None or not any(self._cache.stats.values()):
+            return None
+        return self._cache.summary()
+
+    def _get(self, url: str, cache: bool = True, **kwargs) -> requests.Response:
+        """GET prin sesiunea partajată – refolosește conexiunile TCP+TLS între pagini și imagini.
+        cache=True: paginile trec prin cache-ul pe disc (cheie separată pentru sesiunea autentificată)."""
+        kwargs.setdefault("timeout", 30)
+        session = self._http_session()
+        http_cache = self._http_cache() if cache and not kwargs.get("stream") else None
+        if http_cache is None:
+            return session.get(url, **kwargs)
+        auth = "login" if session is self.session else "anon"
+        return http_cache.fetch(session, url, auth=auth, **kwargs)
+
+    def _product_soup(self, markup):
+        """
+        Arborele paginii de produs. Cu partial_parse=true în config.json se materializează doar regiunile
+        din selectors + PARSE_REGIONS + COMMON_PARSE_REGIONS (fără meniu, footer, produse similare);
+        textul complet (soup_text) și HTML-ul de debug se iau din markup-ul brut.
+        """
+        if not self.config.get("partial_parse"):
+            return make_soup(markup)
+        if self._strainer is None:
+            selectors = self.config.get("selectors") or {}
+            regions = COMMON_PARSE_REGIONS + list(self.PARSE_REGIONS)
+            for key in _REGION_SELECTOR_KEYS:
+                value = selectors.get(key)
+                regions.extend([value] if isinstance(value, str) else (value or []))
+            # False = un selector nu se poate limita la subarbori → parsare completă
+            self._strainer = region_strainer(regions) or False
+        return make_soup(markup, parse_only=self._strainer or None)
+
+    def _structured_data(self, soup: Any) -> Dict[str, Any]:
+        """
+        Nume / preț / SKU / GTIN / disponibilitate / imagini din JSON-LD, microdata sau starea JS a paginii.
+        Scraper-ele le folosesc înaintea selectorilor DOM; prețul e păstrat doar dacă e în EUR (sau fără monedă).
+        """
+        data = dict(structured_product(soup))
+        if data.get("currency") not in (None, "", "EUR"):
+            data.pop("price", None)
+        if data:
+            found = ", ".join(k for k in ("name", "price", "sku", "gtin", "availability", "images") if k in data)
+            if found:
+                self.log(f"   📑 Date structurate: {found}", "INFO")
+        return data
+
     @property
     def script_dir(self):
         """Directorul rădăcină al proiectului."""
@@ -68,10 +225,12 @@ class BaseScraper(ABC):
         Construiește product_data WebGSM din datele brute, folosind metodele app.
         """
         tags = tags or []
-        if soup and not page_text and hasattr(soup, "get_text"):
-            page_text = soup.get_text()
-        availability = "in_stock"
-        if hasattr(self.app, "detect_availability") and (soup is not None or page_text):
+        # Disponibilitatea din schema.org (offers.availability) e explicită → fără scanarea textului paginii
+        structured_availability = structured_product(soup).get("availability")
+        availability = structured_availability or "in_stock"
+        if not structured_availability and hasattr(self.app, "detect_availability") and (soup is not None or page_text):
+            if soup and not page_text and hasattr(soup, "get_text"):
+                page_text = soup_text(soup)
             availability = self.app.detect_availability(soup, page_text)
         if availability == "in_stock":
             locatie_stoc = "depozit_central"
@@ -193,7 +352,11 @@ class BaseScraper(ABC):
         login_config = self.config.get("login", {})
         if not login_config.get("required", False):
             return True
-        
+        with self._login_lock:
+            return self._perform_login(login_config)
+
+    def _perform_login(self, login_config: Dict[str, Any]) -> bool:
+        """Validează sesiunea existentă sau face login (apelat doar sub _login_lock)."""
         import os
         from dotenv import load_dotenv
         
@@ -266,14 +429,13 @@ class BaseScraper(ABC):
         
         try:
             self.log(f"   🔐 Încearcă login la: {login_url}", "INFO")
-            self.session = requests.Session()
+            self.session = self._new_session()
             # Obține pagina de login (cookie de sesiune, eventual CSRF)
             login_page = self.session.get(login_url, headers=self._headers(), timeout=15)
             login_page.raise_for_status()
             self.log(f"   ✓ Pagină login accesată (status: {login_page.status_code})", "INFO")
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(login_page.content, "html.parser")
+            soup = make_soup(login_page.content)
 
             # Odoo: încearcă JSON-RPC (necesită db din formular sau .env dacă e multi-db)
             odoo_db = ""
@@ -408,7 +570,7 @@ class BaseScraper(ABC):
             body_lower_err = (response.text or "").lower()
             recaptcha_detected = "recaptcha" in body_lower_err
             try:
-                resp_soup = BeautifulSoup(response.text or "", "html.parser")
+                resp_soup = make_soup(response.text or "")
                 for sel in (".alert-danger", ".alert.alert-danger", ".error", "[role='alert']", ".invalid-feedback"):
                     for el in resp_soup.select(sel):
                         txt = (el.get_text() or "").strip()
@@ -513,7 +675,7 @@ class BaseScraper(ABC):
                     self.log("   ✓ Deja logat (cookie-uri salvate în browser) – fără captcha", "SUCCESS")
                     cookies = context.cookies()
                     if not self.session:
-                        self.session = requests.Session()
+                        self.session = self._new_session()
                     for c in cookies:
                         self.session.cookies.set(
                             c.get("name", ""),
@@ -559,7 +721,7 @@ class BaseScraper(ABC):
                 # Extrage cookie-uri și le transferă în requests.Session
                 cookies = context.cookies()
                 if not self.session:
-                    self.session = requests.Session()
+                    self.session = self._new_session()
                 for c in cookies:
                     self.session.cookies.set(
                         c.get("name", ""),
@@ -593,7 +755,7 @@ class BaseScraper(ABC):
             data = json.loads(path.read_text(encoding="utf-8"))
             if not isinstance(data, list) or not data:
                 return False
-            self.session = requests.Session()
+            self.session = self._new_session()
             for c in data:
                 name = c.get("name") or c.get("key")
                 if not name:
@@ -675,7 +837,7 @@ class BaseScraper(ABC):
 
     def _save_debug_html(self, soup: Any, product_url: str = ""):
         """Salvează HTML-ul paginii produsului în logs/ pentru debugging."""
-        if not soup or not hasattr(soup, "prettify"):
+        if soup is None or not hasattr(soup, "prettify"):
             return
         script_dir = self.script_dir
         if not script_dir:
@@ -686,8 +848,13 @@ class BaseScraper(ABC):
         supplier_name = self.name or "unknown"
         debug_file = logs_dir / f"debug_product_{supplier_name}_{timestamp}.html"
         try:
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(soup.prettify())
+            markup = soup_markup(soup)
+            if markup is not None:
+                # Arbore parțial: salvăm pagina completă (folosită și de benchmark_parsers.py)
+                debug_file.write_bytes(markup if isinstance(markup, bytes) else markup.encode("utf-8"))
+            else:
+                with open(debug_file, 'w', encoding='utf-8') as f:
+                    f.write(soup.prettify())
             self.log(f"   📝 HTML produs salvat: {debug_file}", "INFO")
         except Exception as e:
             self.log(f"   ⚠️ Eroare salvare HTML: {e}", "WARNING")
@@ -712,9 +879,13 @@ class BaseScraper(ABC):
             "Accept": "image/webp,image/*,*/*;q=0.8",
         }
         product_id_clean = re.sub(r'[<>:"/\\|?*]', "_", str(product_id)[:50])
+        metrics = getattr(self.app, "metrics", None)
         for idx, url in enumerate(list(img_urls)[:max_images], 1):
             try:
-                r = requests.get(url, headers=h, timeout=15)
+                started = time.perf_counter()
+                r = self._get(url, cache=False, headers=h, timeout=15)
+                if metrics:
+                    metrics.record("image_download", time.perf_counter() - started, failed=not r.ok)
                 r.raise_for_status()
                 ext = "jpg"
                 if ".webp" in url.lower() or "webp" in r.headers.get("content-type", ""):
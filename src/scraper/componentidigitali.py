@@ -6,7 +6,8 @@ import re
 from typing import Dict, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
+
+from src.core.parsing import make_soup, soup_text
 
 from .base import BaseScraper
 
@@ -64,9 +65,9 @@ class ComponentidigitaliScraper(BaseScraper):
         search_url = f"{base_url}/{lang}/shop?search={requests.utils.quote(sku_or_query)}"
         self.log(f"   🔍 Căutare: {search_url}", "INFO")
         try:
-            r = requests.get(search_url, headers=self._headers(), timeout=30)
+            r = self._get(search_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
+            soup = make_soup(r.content)
             for a in soup.select('a[href*="/shop/"], a[href*="/product"], a[href*=".gp."]'):
                 href = a.get("href") or ""
                 if href and "shop" in href and base_url in href and href != search_url:
@@ -100,12 +101,12 @@ class ComponentidigitaliScraper(BaseScraper):
                 return None
 
         try:
-            r = requests.get(product_url, headers=self._headers(), timeout=30)
+            r = self._get(product_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
+            soup = make_soup(r.content)
             # Salvează HTML pentru debugging
             self._save_debug_html(soup, product_url)
-            page_text = soup.get_text(separator="\n")
+            page_text = soup_text(soup, "\n")
         except Exception as e:
             self.log(f"   ✗ Eroare descărcare pagină: {e}", "ERROR")
             return None
@@ -122,15 +123,19 @@ class ComponentidigitaliScraper(BaseScraper):
                 return False
             return True
 
-        name = ""
+        # JSON-LD / microdata / JS întâi; selectorii DOM doar pentru câmpurile lipsă
+        structured = self._structured_data(soup)
+
+        name = structured.get("name", "") if is_valid_name(structured.get("name")) else ""
         # Încearcă mai întâi titluri din zona produs (main, product, page-content)
-        for sel in [".product-title", "h1.page-title", "main h1", "[class*='product'] h1", "[class*='product-detail'] h1", ".product-name", "h1"]:
-            el = soup.select_one(sel)
-            if el and el.get_text(strip=True):
-                cand = el.get_text(strip=True)
-                if is_valid_name(cand):
-                    name = cand
-                    break
+        if not name:
+            for sel in [".product-title", "h1.page-title", "main h1", "[class*='product'] h1", "[class*='product-detail'] h1", ".product-name", "h1"]:
+                el = soup.select_one(sel)
+                if el and el.get_text(strip=True):
+                    cand = el.get_text(strip=True)
+                    if is_valid_name(cand):
+                        name = cand
+                        break
         if not name:
             for sel in selectors.get("name", ["h2", "h3", ".product-title", "h1"]):
                 for el in soup.select(sel):
@@ -158,15 +163,16 @@ class ComponentidigitaliScraper(BaseScraper):
         if not name:
             name = "Produs Componenti Digitali"
 
-        price = 0.0
-        for sel in selectors.get("price", [".price", ".price-wrapper .price", "span.price"]):
-            el = soup.select_one(sel)
-            if el:
-                txt = el.get_text(strip=True)
-                parsed = _parse_price_str(txt)
-                if parsed is not None and parsed > 0:
-                    price = parsed
-                    break
+        price = structured.get("price", 0.0)
+        if price <= 0:
+            for sel in selectors.get("price", [".price", ".price-wrapper .price", "span.price"]):
+                el = soup.select_one(sel)
+                if el:
+                    txt = el.get_text(strip=True)
+                    parsed = _parse_price_str(txt)
+                    if parsed is not None and parsed > 0:
+                        price = parsed
+                        break
         if price == 0.0:
             m = re.search(r"€\s*([\d.,]+)", page_text)
             if m:
@@ -197,6 +203,9 @@ class ComponentidigitaliScraper(BaseScraper):
                 sku_furnizor = m.group(1)
                 ean_real = sku_furnizor
                 break
+        if not sku_furnizor and structured.get("sku"):
+            sku_furnizor = structured["sku"]
+            ean_real = structured.get("gtin") or sku_furnizor
 
         if not sku_furnizor:
             sku_furnizor = re.sub(r"[^a-zA-Z0-9]", "", product_url[-30:]) or "CD-unknown"
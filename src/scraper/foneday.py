@@ -5,13 +5,18 @@ Dacă conținutul e doar JS, returnează None.
 import re
 from typing import Dict, List, Optional
 
-import requests
-from bs4 import BeautifulSoup
+from src.core.parsing import make_soup, soup_text
 
 from .base import BaseScraper
 
 
 class FonedayScraper(BaseScraper):
+    PARSE_REGIONS = [
+        "h1", "h2", ".product-title", ".article-title", "[data-product-name]",
+        ".price", ".product-price", "[data-price]", "[class*='price']",
+        ".description", ".product-description", "[itemprop=description]", "img[src]",
+    ]
+
     def _headers(self) -> Dict[str, str]:
         base = self.config.get("base_url", "https://foneday.shop").rstrip("/")
         return {
@@ -28,9 +33,9 @@ class FonedayScraper(BaseScraper):
         search_url = f"{base_url}/catalog"
         self.log(f"   🔍 Catalog: {search_url}", "INFO")
         try:
-            r = requests.get(search_url, headers=self._headers(), timeout=30)
+            r = self._get(search_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
+            soup = make_soup(r.content)
             for a in soup.select('a[href*="/article/"], a[href*="/product/"], a[href*="/shop/"]'):
                 href = (a.get("href") or "").strip()
                 if href and sku_or_query.lower() in href.lower():
@@ -64,10 +69,10 @@ class FonedayScraper(BaseScraper):
                 return None
 
         try:
-            r = requests.get(product_url, headers=self._headers(), timeout=30)
+            r = self._get(product_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
-            page_text = soup.get_text(separator="\n")
+            soup = self._product_soup(r.content)
+            page_text = soup_text(soup, "\n")
             # Salvează HTML pentru debugging
             self._save_debug_html(soup, product_url)
         except Exception as e:
@@ -78,29 +83,33 @@ class FonedayScraper(BaseScraper):
             self.log("   ⚠️ Pagina pare SPA (conținut JS) – Foneday poate necesita link direct.", "WARNING")
 
         selectors = self.config.get("selectors", {})
+        # JSON-LD / microdata / JS întâi; selectorii DOM doar pentru câmpurile lipsă
+        structured = self._structured_data(soup)
 
-        name = ""
-        for sel in selectors.get("name", ["h1", "h2", ".product-title", ".article-title", "[data-product-name]"]):
-            el = soup.select_one(sel)
-            if el and el.get_text(strip=True):
-                name = el.get_text(strip=True)
-                break
+        name = structured.get("name", "")
+        if not name:
+            for sel in selectors.get("name", ["h1", "h2", ".product-title", ".article-title", "[data-product-name]"]):
+                el = soup.select_one(sel)
+                if el and el.get_text(strip=True):
+                    name = el.get_text(strip=True)
+                    break
         if not name:
             name = "Produs Foneday"
 
-        price = 0.0
-        for sel in selectors.get("price", [".price", ".product-price", "[data-price]", "[class*='price']"]):
-            el = soup.select_one(sel)
-            if el:
-                txt = el.get_text(strip=True)
-                m = re.search(r"[\d.,]+", txt.replace(",", "."))
-                if m:
-                    try:
-                        price = float(m.group(0).replace(",", "."))
-                    except ValueError:
-                        pass
-                    if price > 0:
-                        break
+        price = structured.get("price", 0.0)
+        if price <= 0:
+            for sel in selectors.get("price", [".price", ".product-price", "[data-price]", "[class*='price']"]):
+                el = soup.select_one(sel)
+                if el:
+                    txt = el.get_text(strip=True)
+                    m = re.search(r"[\d.,]+", txt.replace(",", "."))
+                    if m:
+                        try:
+                            price = float(m.group(0).replace(",", "."))
+                        except ValueError:
+                            pass
+                        if price > 0:
+                            break
         if price == 0.0:
             m = re.search(r"[\d.,]+\s*€|€\s*([\d.,]+)", page_text)
             if m:
@@ -122,6 +131,7 @@ class FonedayScraper(BaseScraper):
 
         sku_furnizor = re.sub(r"[^a-zA-Z0-9]", "", (sku_or_url if not sku_or_url.startswith("http") else product_url)[:50]) or "FD-unknown"
         ean_real = sku_furnizor if sku_or_url.isdigit() or (sku_or_url.replace("-", "").isalnum() and len(sku_or_url) >= 6) else ""
+        ean_real = structured.get("gtin") or ean_real
 
         img_urls = []
         if not self.skip_images:
@@ -6,12 +6,18 @@ import re
 from typing import Dict, List, Optional
 
 import requests
-from bs4 import BeautifulSoup
+
+from src.core.parsing import make_soup, soup_markup, soup_text
 
 from .base import BaseScraper
 
 
 class MmsmobileScraper(BaseScraper):
+    PARSE_REGIONS = [
+        "h1", ".product-title", "h4", ".price", "[class*='price']",
+        "section[aria-labelledby*='description']", ".tab-content", ".product-description", "#description",
+        "img[src*='/web/image/']",
+    ]
     def _headers(self) -> Dict[str, str]:
         return {
             "User-Agent": self.config.get("headers", {}).get(
@@ -50,13 +56,10 @@ class MmsmobileScraper(BaseScraper):
         search_url = f"{base_url}/{lang}/shop?search={requests.utils.quote(sku_or_query)}"
         self.log(f"   🔍 Căutare: {search_url}", "INFO")
         try:
-            # Folosește session dacă există (după login), altfel requests normal
-            if self.session:
-                r = self.session.get(search_url, headers=self._headers(), timeout=30)
-            else:
-                r = requests.get(search_url, headers=self._headers(), timeout=30)
+            # Sesiunea autentificată dacă există (după login), altfel sesiunea keep-alive a furnizorului
+            r = self._get(search_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
+            soup = make_soup(r.content)
             for a in soup.select('a[href*="/shop/"]'):
                 href = (a.get("href") or "").strip()
                 if href and "/shop/" in href and href.count("-") >= 1:
@@ -92,13 +95,12 @@ class MmsmobileScraper(BaseScraper):
             # Folosește session dacă există (după login), altfel requests normal – doar cu sesiune autentificată se vede prețul
             if self.session:
                 self.log("   📄 Descarc pagina produsului cu sesiune autentificată (zona client)...", "INFO")
-                r = self.session.get(product_url, headers=self._headers(), timeout=30)
             else:
                 self.log("   📄 Descarc pagina produsului (fără login – prețul poate fi 0)...", "INFO")
-                r = requests.get(product_url, headers=self._headers(), timeout=30)
+            r = self._get(product_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
-            page_text = soup.get_text(separator="\n")
+            soup = self._product_soup(r.content)
+            page_text = soup_text(soup, "\n")
             # Salvează HTML pentru debugging
             self._save_debug_html(soup, product_url)
         except Exception as e:
@@ -106,16 +108,21 @@ class MmsmobileScraper(BaseScraper):
             return None
 
         selectors = self.config.get("selectors", {})
+        # JSON-LD / microdata / JS întâi; selectorii DOM doar pentru câmpurile lipsă
+        structured = self._structured_data(soup)
 
-        name = ""
-        for sel in selectors.get("name", ["h1", ".product-title"]):
-            el = soup.select_one(sel)
-            if el and el.get_text(strip=True):
-                name = el.get_text(strip=True)
-                break
+        name = structured.get("name", "")
+        if not name:
+            for sel in selectors.get("name", ["h1", ".product-title"]):
+                el = soup.select_one(sel)
+                if el and el.get_text(strip=True):
+                    name = el.get_text(strip=True)
+                    break
         if not name:
             name = "Produs MMS Mobile"
 
+        # Prețul din DOM e cel afișat clientului (după login / cu discountul B2B);
+        # JSON-LD / ecommerce publică adesea prețul de listă – doar fallback
         price = 0.0
         for sel in selectors.get("price", ["h4", ".price", "[class*='price']"]):
             el = soup.select_one(sel)
@@ -145,6 +152,8 @@ class MmsmobileScraper(BaseScraper):
                                 break
                         except ValueError:
                             pass
+        if price <= 0:
+            price = structured.get("price", 0.0)
         if price > 0:
             self.log(f"   💶 Preț: {price:.2f} EUR", "INFO")
         else:
@@ -165,8 +174,8 @@ class MmsmobileScraper(BaseScraper):
         if not description:
             description = name
 
-        sku_furnizor = self._table_value_by_header(soup, selectors.get("sku_table_header", "SKU"))
-        ean_real = self._table_value_by_header(soup, selectors.get("ean_table_header", "EAN"))
+        sku_furnizor = self._table_value_by_header(soup, selectors.get("sku_table_header", "SKU")) or structured.get("sku", "")
+        ean_real = structured.get("gtin") or self._table_value_by_header(soup, selectors.get("ean_table_header", "EAN"))
         if not sku_furnizor:
             m = re.search(r"[\d]+", product_url.split("-")[-1])
             if m:
@@ -193,7 +202,9 @@ class MmsmobileScraper(BaseScraper):
                             img_urls.append(self._enlarge_odoo_image_url(src))
             # Fallback: regex în HTML brut
             if not img_urls:
-                raw = str(soup)
+                raw = soup_markup(soup) or str(soup)
+                if isinstance(raw, bytes):
+                    raw = raw.decode("utf-8", errors="replace")
                 for pattern in [
                     r'["\'](https?://[^"\']*mmsmobile\.de[^"\']*/web/image[^"\']+\.(?:webp|jpg|jpeg|png|gif)[^"\']*)["\']',
                     r'["\'](/web/image[^"\']+\.(?:webp|jpg|jpeg|png|gif)[^"\']*)["\']',
@@ -4,17 +4,21 @@ Selectori din config. Căutare / link direct.
 """
 import os
 import re
-import time
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+
+from src.core.parsing import make_soup, soup_text
 
 from .base import BaseScraper
 
 
 class MobilepartsScraper(BaseScraper):
+    def __init__(self, config, app):
+        super().__init__(config, app)
+        self._warmed_roots = set()  # domenii pe care s-a încărcat deja homepage-ul (cookie-uri anti-bot)
+
     def _headers(self, referer: Optional[str] = None, minimal: bool = False) -> Dict[str, str]:
         base = self.config.get("base_url", "https://mobileparts.shop").rstrip("/")
         if not base.startswith("http"):
@@ -35,7 +39,6 @@ class MobilepartsScraper(BaseScraper):
             "User-Agent": ua,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate",
             "Referer": ref,
             "DNT": "1",
             "Connection": "keep-alive",
@@ -49,9 +52,9 @@ class MobilepartsScraper(BaseScraper):
         )
         self.log(f"   🔍 Căutare: {search_url}", "INFO")
         try:
-            r = requests.get(search_url, headers=self._headers(), timeout=30)
+            r = self._get(search_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
+            soup = make_soup(r.content)
             for a in soup.select('a[href*="/product/"], a[href*="/p/"], a.product-link, .product-item-link'):
                 href = (a.get("href") or "").strip()
                 if href and ("product" in href or "/p/" in href):
@@ -78,28 +81,29 @@ class MobilepartsScraper(BaseScraper):
                 self.log("   ✗ Nu s-a găsit niciun produs.", "ERROR")
                 return None
 
-        # Session + homepage apoi produs; la 403 încercăm header-e minime
+        # Session partajat + homepage (o singură dată per domeniu) apoi produs; la 403 încercăm header-e minime.
+        # Pauzele între request-uri le face limiter-ul host-ului (rate_limit în config.json)
         parsed = urlparse(product_url)
         site_root = f"{parsed.scheme}://{parsed.netloc}"
         base_url = site_root  # folosim același domeniu ca în URL (ex. www.mobileparts.shop)
-        session = requests.Session()
-        session.headers.update(self._headers(referer=site_root + "/"))
-        try:
-            session.get(site_root + "/", timeout=15)
-            time.sleep(1)
-        except Exception:
-            pass
+        session = self._http_session()
+        if site_root not in self._warmed_roots:
+            self._warmed_roots.add(site_root)
+            try:
+                session.get(site_root + "/", headers=self._headers(referer=site_root + "/"), timeout=15)
+            except Exception:
+                pass
         last_error = None
         for use_minimal in (False, True):
             try:
                 h = self._headers(referer=site_root + "/", minimal=use_minimal)
-                r = session.get(product_url, headers=h, timeout=30, allow_redirects=True)
+                r = self._get(product_url, headers=h, timeout=30, allow_redirects=True)
                 if r.status_code == 403 and not use_minimal:
                     self.log("   ⚠️ 403 – reîncerc cu header-e minime...", "INFO")
                     continue
                 r.raise_for_status()
-                soup = BeautifulSoup(r.content, "html.parser")
-                page_text = soup.get_text(separator="\n")
+                soup = make_soup(r.content)
+                page_text = soup_text(soup, "\n")
                 self._save_debug_html(soup, product_url)
                 last_error = None
                 break
@@ -145,8 +149,8 @@ class MobilepartsScraper(BaseScraper):
                         page.wait_for_timeout(10000)
                         html = page.content()
                     browser.close()
-                soup = BeautifulSoup(html, "html.parser")
-                page_text = soup.get_text(separator="\n")
+                soup = make_soup(html)
+                page_text = soup_text(soup, "\n")
                 self._save_debug_html(soup, product_url)
             except ImportError:
                 self.log("   ✗ Site-ul MobileParts blochează accesul (403). Pentru a folosi acest furnizor:", "ERROR")
@@ -159,13 +163,16 @@ class MobilepartsScraper(BaseScraper):
                 return None
 
         selectors = self.config.get("selectors", {})
+        # JSON-LD / microdata / JS întâi; selectorii DOM doar pentru câmpurile lipsă
+        structured = self._structured_data(soup)
 
-        name = ""
-        for sel in selectors.get("name", ["h1", ".product-title", ".product-name", "[itemprop=name]", "h1[class*='title']", "[class*='product'] h1", ".article-title", ".page-title"]):
-            el = soup.select_one(sel)
-            if el and el.get_text(strip=True):
-                name = el.get_text(strip=True)
-                break
+        name = structured.get("name", "")
+        if not name:
+            for sel in selectors.get("name", ["h1", ".product-title", ".product-name", "[itemprop=name]", "h1[class*='title']", "[class*='product'] h1", ".article-title", ".page-title"]):
+                el = soup.select_one(sel)
+                if el and el.get_text(strip=True):
+                    name = el.get_text(strip=True)
+                    break
         if not name:
             # Fallback: din textul paginii – linie tip "Battery (Original), Apple iPhone Air"
             skip = ("available for", "here available", "Read more", "Description", "Specifications", "€", "Log in", "Register", "What are you looking")
@@ -189,19 +196,20 @@ class MobilepartsScraper(BaseScraper):
         name = re.sub(r"\s*-\s*Mobileparts?\.shop\s*$", "", name, flags=re.I)
         name = name.strip() or "Produs MobileParts"
 
-        price = 0.0
-        for sel in selectors.get("price", [".price", ".product-price", "span.price", "[data-price]", "[class*='price']", "[itemprop=price]"]):
-            el = soup.select_one(sel)
-            if el:
-                txt = el.get_text(strip=True)
-                m = re.search(r"[\d.,]+", txt.replace(",", "."))
-                if m:
-                    try:
-                        price = float(m.group(0).replace(",", "."))
-                    except ValueError:
-                        pass
-                    if price > 0:
-                        break
+        price = structured.get("price", 0.0)
+        if price <= 0:
+            for sel in selectors.get("price", [".price", ".product-price", "span.price", "[data-price]", "[class*='price']", "[itemprop=price]"]):
+                el = soup.select_one(sel)
+                if el:
+                    txt = el.get_text(strip=True)
+                    m = re.search(r"[\d.,]+", txt.replace(",", "."))
+                    if m:
+                        try:
+                            price = float(m.group(0).replace(",", "."))
+                        except ValueError:
+                            pass
+                        if price > 0:
+                            break
         if price <= 0:
             # Fallback: € 63.00 în textul paginii
             m = re.search(r"€\s*([\d]+[.,]\d{2})", page_text)
@@ -234,16 +242,17 @@ class MobilepartsScraper(BaseScraper):
         if not description:
             description = name
 
-        sku_furnizor = ""
-        ean_real = ""
-        for sel in selectors.get("sku", [".sku", ".product-sku", "[itemprop=sku]", "[class*='sku']", "[class*='article']", "[data-sku]"]):
-            el = soup.select_one(sel)
-            if el:
-                sku_furnizor = el.get_text(strip=True) or el.get("content") or el.get("data-sku") or ""
-                sku_furnizor = str(sku_furnizor).strip()
-                if sku_furnizor and re.match(r"^[\dA-Za-z-]+$", sku_furnizor) and len(sku_furnizor) >= 4:
-                    ean_real = sku_furnizor
-                    break
+        sku_furnizor = structured.get("sku", "")
+        ean_real = structured.get("gtin") or sku_furnizor
+        if not sku_furnizor:
+            for sel in selectors.get("sku", [".sku", ".product-sku", "[itemprop=sku]", "[class*='sku']", "[class*='article']", "[data-sku]"]):
+                el = soup.select_one(sel)
+                if el:
+                    sku_furnizor = el.get_text(strip=True) or el.get("content") or el.get("data-sku") or ""
+                    sku_furnizor = str(sku_furnizor).strip()
+                    if sku_furnizor and re.match(r"^[\dA-Za-z-]+$", sku_furnizor) and len(sku_furnizor) >= 4:
+                        ean_real = sku_furnizor
+                        break
         if not sku_furnizor:
             # Din URL: /article/parts/661-55235/ sau /parts/661-55235/
             m = re.search(r"/parts?/([0-9]+-[0-9]+)", parsed.path, re.I)
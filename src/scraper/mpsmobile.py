@@ -7,7 +7,8 @@ import re
 from typing import Dict, Optional
 
 import requests
-from bs4 import BeautifulSoup
+
+from src.core.parsing import make_soup, soup_text
 
 from .base import BaseScraper
 
@@ -32,9 +33,9 @@ class MpsmobileScraper(BaseScraper):
         search_url = f"{base_url}/{lang}/all-categories-c-0/search/{requests.utils.quote(sku_or_query)}"
         self.log(f"   🔍 Căutare: {search_url}", "INFO")
         try:
-            r = requests.get(search_url, headers=self._headers(), timeout=30)
+            r = self._get(search_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
+            soup = make_soup(r.content)
             for a in soup.select('a[href*="-p-"]'):
                 href = (a.get("href") or "").strip()
                 if href and "-p-" in href:
@@ -66,14 +67,11 @@ class MpsmobileScraper(BaseScraper):
                 return None
 
         try:
-            # Folosește session dacă există (după login), altfel requests normal
-            if self.session:
-                r = self.session.get(product_url, headers=self._headers(), timeout=30)
-            else:
-                r = requests.get(product_url, headers=self._headers(), timeout=30)
+            # Sesiunea autentificată dacă există (după login), altfel sesiunea keep-alive a furnizorului
+            r = self._get(product_url, headers=self._headers(), timeout=30)
             r.raise_for_status()
-            soup = BeautifulSoup(r.content, "html.parser")
-            page_text = soup.get_text(separator="\n")
+            soup = make_soup(r.content)
+            page_text = soup_text(soup, "\n")
             # Salvează HTML pentru debugging
             self._save_debug_html(soup, product_url)
         except Exception as e:
@@ -81,16 +79,21 @@ class MpsmobileScraper(BaseScraper):
             return None
 
         selectors = self.config.get("selectors", {})
+        # JSON-LD / microdata / JS întâi; selectorii DOM doar pentru câmpurile lipsă
+        structured = self._structured_data(soup)
 
-        name = ""
-        for sel in selectors.get("name", ["h1", ".product-title", ".product-name"]):
-            el = soup.select_one(sel)
-            if el and el.get_text(strip=True):
-                name = el.get_text(strip=True)
-                break
+        name = structured.get("name", "")
+        if not name:
+            for sel in selectors.get("name", ["h1", ".product-title", ".product-name"]):
+                el = soup.select_one(sel)
+                if el and el.get_text(strip=True):
+                    name = el.get_text(strip=True)
+                    break
         if not name:
             name = "Produs MPS Mobile"
 
+        # Prețul din DOM e cel afișat clientului (după login / cu discountul B2B);
+        # JSON-LD / ecommerce publică adesea prețul de listă – doar fallback
         price = 0.0
         for sel in selectors.get("price", [".price", ".product-price", "td"]):
             el = soup.select_one(sel)
@@ -106,6 +109,8 @@ class MpsmobileScraper(BaseScraper):
                         pass
                     if price > 0:
                         break
+        if price <= 0:
+            price = structured.get("price", 0.0)
 
         description = ""
         for sel in selectors.get("description", [".product-description", "#description", ".tab-content"]):
@@ -120,7 +125,9 @@ class MpsmobileScraper(BaseScraper):
         sku_furnizor = self._table_value_by_header(soup, selectors.get("sku_table_header", "Art-Nr."))
         if not sku_furnizor:
             sku_furnizor = self._table_value_by_header(soup, "Artículo Nro.")
-        ean_real = self._table_value_by_header(soup, selectors.get("ean_table_header", "GTIN"))
+        if not sku_furnizor:
+            sku_furnizor = structured.get("sku", "")
+        ean_real = structured.get("gtin") or self._table_value_by_header(soup, selectors.get("ean_table_header", "GTIN"))
         if not ean_real:
             ean_real = self._table_value_by_header(soup, "GTIN:")
         if not sku_furnizor:
@@ -234,10 +241,14 @@ class MpsmobileScraper(BaseScraper):
                 self.log("      ✓ Găsită imagine în og:image", "INFO")
 
             # 2. JSON-LD (array de imagini produs – ca la MobileSentrix, fără filtru path)
-            json_ld_scripts = soup.find_all("script", type="application/ld+json")
-            for script in json_ld_scripts:
-                try:
-                    data = json.loads(script.string or "{}")
+            json_ld_images = structured.get("images", [])[:5]
+            if not json_ld_images:
+                # Fără Product în date structurate: câmpul "image" din orice bloc JSON-LD (ex. WebPage, ImageObject)
+                for script in soup.find_all("script", type="application/ld+json"):
+                    try:
+                        data = json.loads(script.string or "{}")
+                    except ValueError:
+                        continue
                     if isinstance(data, dict) and "image" in data:
                         images = data["image"]
                         if isinstance(images, str):
@@ -247,11 +258,11 @@ class MpsmobileScraper(BaseScraper):
                         for img in images[:5]:
                             url = img.get("url", img) if isinstance(img, dict) else img
                             if isinstance(url, str):
-                                _add(_normalize(url))
-                        if images:
-                            self.log(f"      ✓ Găsite {len(images) if isinstance(images, list) else 1} imagini în JSON-LD", "INFO")
-                except Exception:
-                    pass
+                                json_ld_images.append(url)
+            for url in json_ld_images:
+                _add(_normalize(url))
+            if json_ld_images:
+                self.log(f"      ✓ Găsite {len(json_ld_images)} imagini în JSON-LD", "INFO")
 
             # 2b. Imagini cu data-src/data-image (galeria MPS – thumbnails care au URL mare în atribut)
             for img in soup.find_all("img"):
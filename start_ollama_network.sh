@@ -2,6 +2,8 @@
 # Pornește Ollama vizibil pe rețea (VM / alte PC-uri pot conecta).
 # Rulează pe Mac/Linux unde e instalat Ollama (NU în VM).
 export OLLAMA_HOST=0.0.0.0
+# Cereri procesate simultan de server – potriviți cu OLLAMA_PARALLEL din .env-ul scriptului de import
+# export OLLAMA_NUM_PARALLEL=2
 echo "Ollama va asculta pe toate interfețele (port 11434)."
 echo "Conectare din VM: OLLAMA_URL=http://IP_ACEST_PC:11434 în .env"
 echo ""
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Teste pentru parserul de stream Ollama (src/core/ollama_stream.py): ordinea câmpurilor în formatul pe linii,
+DESC_RO pe mai multe rânduri, acolade / ghilimele în stringurile JSON, spații după obiect și oprirea devreme.
+
+Rulare:
+    python -m pytest -q test_ollama_stream.py
+    python test_ollama_stream.py
+"""
+import json
+import sys
+
+from src.core.ollama_stream import StreamFieldParser, stream_generate
+
+LINES = (
+    "NAME_RO: Baterie iPhone 12\n"
+    "SHORT_DESC_RO: Baterie de schimb\n"
+    "DESC_RO: Capacitate: 2815 mAh\n"
+    "Compatibilitate: iPhone 12 | iPhone 12 Pro\n"
+    "SEO_TITLE: Baterie iPhone 12\n"
+    "SEO_DESC: Baterie de schimb pentru iPhone 12\n"
+    "FOCUS_KW: baterie iphone 12\n"
+    "TIP_PRODUS: Baterie\n"
+    "TAGS_RO: baterie, iphone 12\n"
+)
+ORDER = ["name_ro", "short_desc_ro", "desc_ro", "seo_title", "seo_desc", "focus_kw", "tip_produs", "tags_ro"]
+
+
+def feed_chars(parser, text):
+    """Trimite textul caracter cu caracter (cel mai fin stream posibil); returnează câmpurile în ordinea raportării."""
+    reported = []
+    for ch in text:
+        reported.extend(parser.feed(ch))
+    return reported
+
+
+def test_lines_fields_reported_in_order():
+    parser = StreamFieldParser("lines")
+    assert feed_chars(parser, LINES) == ORDER
+    assert parser.complete
+
+
+def test_lines_last_field_needs_its_newline():
+    parser = StreamFieldParser("lines")
+    feed_chars(parser, LINES[:-1])
+    assert not parser.complete
+    assert parser.feed("\n") == ["tags_ro"]
+    assert parser.complete
+
+
+def test_desc_ro_continuation_lines():
+    parser = StreamFieldParser("lines")
+    assert feed_chars(parser, "NAME_RO: x\nDESC_RO: rând 1\n") == ["name_ro"]
+    # Rândurile fără prefix continuă DESC_RO – câmpul nu e gata până nu începe cheia următoare
+    assert feed_chars(parser, "rând 2\nrând 3\n") == []
+    assert feed_chars(parser, "SEO_TITLE: t") == ["desc_ro"]
+    assert not parser.complete
+
+
+def _json_answer():
+    return {
+        "name_ro": 'Ecran {OLED} "Premium"',
+        "short_desc_ro": "}} închis în string",
+        "desc_ro": 'Dimensiuni: 6.1" | {Compatibilitate}: iPhone 12 \\ Pro',
+        "seo_title": "Ecran iPhone 12",
+        "seo_desc": "Ecran OLED",
+        "focus_kw": "ecran iphone 12",
+        "tip_produs": "Ecran",
+        "tags_ro": "ecran, oled",
+    }
+
+
+def test_json_braces_and_quotes_inside_strings():
+    text = json.dumps(_json_answer(), ensure_ascii=False)
+    parser = StreamFieldParser("json")
+    reported = feed_chars(parser, text[:-1])
+    assert not parser.complete  # acoladele / ghilimelele din valori nu închid obiectul
+    assert reported == ORDER[:-1]
+    assert parser.feed(text[-1]) == ["tags_ro"]
+    assert parser.complete
+
+
+def test_json_trailing_whitespace_after_object():
+    text = "\n " + json.dumps(_json_answer(), ensure_ascii=False) + "\n  \n"
+    parser = StreamFieldParser("json")
+    closed_at = None
+    for i, ch in enumerate(text):
+        parser.feed(ch)
+        if parser.complete and closed_at is None:
+            closed_at = i
+    assert closed_at == text.rindex("}")
+    assert json.loads(parser.text) == _json_answer()
+
+
+class FakeStreamResponse:
+    def __init__(self, chunks):
+        self._lines = [json.dumps({"response": c, "done": False}).encode() for c in chunks]
+        self._lines.append(json.dumps({"response": "", "done": True, "eval_duration": 1}).encode())
+        self.read = 0
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        for line in self._lines:
+            self.read += 1
+            yield line
+
+    def close(self):
+        self.closed = True
+
+
+def test_stream_generate_cuts_off_when_complete():
+    chunks = [LINES[i:i + 7] for i in range(0, len(LINES), 7)] + ["Text în plus după TAGS_RO\n"] * 50
+    response = FakeStreamResponse(chunks)
+    text, final, cut_off = stream_generate(lambda url, **kw: response, "http://x/api/generate", {}, 5, output="lines")
+    assert cut_off and final == {}
+    assert text.startswith(LINES) and response.read < len(chunks)
+    assert response.closed
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_") and callable(fn)]
+    for name, fn in tests:
+        fn()
+        print(f"[OK] {name}")
+    sys.exit(0)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Teste pentru scraper-ele MPS / MMS pe pagini fixe (fără rețea): prețul afișat în DOM are prioritate
+față de cel din JSON-LD, iar imaginile din orice bloc JSON-LD se folosesc când lipsește un Product.
+
+Rulare:
+    python -m pytest -q test_scraper_price.py
+    python test_scraper_price.py
+"""
+import sys
+
+from src.scraper.mmsmobile import MmsmobileScraper
+from src.scraper.mpsmobile import MpsmobileScraper
+
+# Preț de listă în JSON-LD (19.99) diferit de prețul B2B afișat după login (12.50)
+MPS_PAGE = """<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Product", "name": "Display iPhone 12 OLED", "sku": "MPS123",
+ "offers": {"@type": "Offer", "price": "19.99", "priceCurrency": "EUR"}}
+</script></head>
+<body><main><h1>Display iPhone 12 OLED</h1><span class="price">12,50 €</span></main></body></html>"""
+
+MMS_PAGE = """<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Product", "name": "Battery Galaxy S21", "sku": "MMS77",
+ "offers": {"@type": "Offer", "price": "24.00", "priceCurrency": "EUR"}}
+</script></head>
+<body><h1>Battery Galaxy S21</h1><h4>€ 17.40</h4></body></html>"""
+
+# Fără preț în DOM → prețul din JSON-LD; Product fără "image", imaginea doar în blocul WebPage
+MPS_PAGE_NO_DOM_PRICE = """<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "WebPage",
+ "image": ["https://mpsmobile.de/data/product/images/detail/normal/abc-123.jpg"]}
+</script>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "Product", "name": "Flex cable",
+ "offers": {"@type": "Offer", "price": "8.90", "priceCurrency": "EUR"}}
+</script></head>
+<body><main><h1>Flex cable</h1></main></body></html>"""
+
+
+class FakeApp:
+    def __init__(self):
+        self.messages = []
+
+    def log(self, message, level="INFO"):
+        self.messages.append((level, message))
+
+
+class FakeResponse:
+    def __init__(self, html):
+        self.content = html.encode("utf-8")
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+
+def _scraper(cls, name, html, skip_images=True):
+    class Fixture(cls):
+        downloaded = []
+
+        def _get(self, url, cache=True, **kwargs):
+            return FakeResponse(html)
+
+        def _download_images(self, urls, product_id, headers=None):
+            self.downloaded = list(urls)
+            return [{"src": u} for u in urls]
+
+    return Fixture({"name": name, "skip_images": skip_images}, FakeApp())
+
+
+def test_mps_dom_price_wins_over_json_ld():
+    product = _scraper(MpsmobileScraper, "mpsmobile", MPS_PAGE).scrape_product("https://mpsmobile.de/de/display-p-MPS123")
+    assert product["price"] == 12.5
+
+
+def test_mms_dom_price_wins_over_json_ld():
+    product = _scraper(MmsmobileScraper, "mmsmobile", MMS_PAGE).scrape_product("https://mmsmobile.de/shop/battery-77")
+    assert product["price"] == 17.4
+
+
+def test_mps_json_ld_fallback_price_and_images():
+    scraper = _scraper(MpsmobileScraper, "mpsmobile", MPS_PAGE_NO_DOM_PRICE, skip_images=False)
+    product = scraper.scrape_product("https://mpsmobile.de/de/flex-p-MPS9")
+    assert product["price"] == 8.9
+    assert scraper.downloaded == ["https://mpsmobile.de/data/product/images/detail/normal/abc-123.jpg"]
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_") and callable(fn)]
+    for name, fn in tests:
+        fn()
+        print(f"[OK] {name}")
+    sys.exit(0)
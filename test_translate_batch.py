@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Teste pentru traducerea în lot (src/core/translate_batch.py) cu un traducător fals:
+rândurile păstrate, unite sau pierdute de traducător și numărul de cereri trimise.
+
+Rulare:
+    python -m pytest -q test_translate_batch.py
+    python test_translate_batch.py
+"""
+import sys
+
+from src.core.translate_batch import BatchTranslator
+
+
+class FakeTranslator:
+    """Traducere = text cu majuscule; mode: "keep" (păstrează rândurile), "merge" (unește rândurile), "drop" (pierde ultimul rând)."""
+
+    def __init__(self, mode="keep"):
+        self.mode = mode
+        self.calls = []
+
+    def translate(self, text):
+        self.calls.append(text)
+        lines = text.upper().split("\n")
+        if "\n" in text.strip() and self.mode == "merge":
+            return " ".join(lines)
+        if "\n" in text.strip() and self.mode == "drop":
+            return "\n".join(lines[:-1])
+        return "\n".join(lines)
+
+
+TEXTS = ["Battery for iPhone 12", "Screen\n\nOLED display\nHigh quality", "", "Charging port flex"]
+
+
+def test_lines_kept_one_request():
+    fake = FakeTranslator("keep")
+    batch = BatchTranslator(fake.translate)
+    assert batch.translate(TEXTS) == [
+        "BATTERY FOR IPHONE 12", "SCREEN\n\nOLED DISPLAY\nHIGH QUALITY", "", "CHARGING PORT FLEX",
+    ]
+    assert batch.requests == len(fake.calls) == 1
+
+
+def test_merged_lines_fall_back_to_one_request_per_text():
+    fake = FakeTranslator("merge")
+    batch = BatchTranslator(fake.translate)
+    results = batch.translate(TEXTS)
+    # Fiecare text își păstrează traducerea proprie (nimic mutat pe alt produs)
+    assert results[0] == "BATTERY FOR IPHONE 12"
+    assert results[1] == "SCREEN  OLED DISPLAY HIGH QUALITY"
+    assert results[2] == ""
+    assert results[3] == "CHARGING PORT FLEX"
+    # 1 pachet nepotrivit + câte o cerere per text ne-gol (fără înjumătățiri)
+    assert batch.requests == 1 + 3
+    assert fake.calls[1:] == [TEXTS[0], TEXTS[1], TEXTS[3]]
+
+
+def test_dropped_line_falls_back():
+    fake = FakeTranslator("drop")
+    batch = BatchTranslator(fake.translate)
+    results = batch.translate(["One", "Two", "Three"])
+    assert results == ["ONE", "TWO", "THREE"]
+    assert batch.requests == 1 + 3
+
+
+def test_fallback_respects_max_chars():
+    # Descriere lungă: rândurile întregi se grupează în cereri ≤ max_chars, ordinea și rândurile goale rămân
+    fake = FakeTranslator("merge")
+    batch = BatchTranslator(fake.translate, max_chars=40)
+    long_text = "First line of the description\nSecond line here\n\nThird paragraph line\nFourth"
+    results = batch.translate(["Short title", long_text])
+    # 3 pachete (al treilea nepotrivit) + textul lung în 3 cereri, toate ≤ max_chars
+    assert len(fake.calls) == 3 + 3 and all(len(call) <= 40 for call in fake.calls)
+    assert results[0] == "SHORT TITLE"
+    # Traducătorul a unit rândurile doar în interiorul cererii "Second line here\n\nThird paragraph line"
+    assert results[1] == "FIRST LINE OF THE DESCRIPTION\nSECOND LINE HERE  THIRD PARAGRAPH LINE\nFOURTH"
+
+
+def test_long_line_split_on_sentences():
+    fake = FakeTranslator("keep")
+    batch = BatchTranslator(fake.translate, max_chars=30)
+    line = "Original quality part. Tested before shipping! Fits all models."
+    assert batch.translate([line]) == [line.upper()]
+    assert fake.calls == ["Original quality part.", "Tested before shipping!", "Fits all models."]
+
+
+def test_mismatch_stops_packing_for_later_packs():
+    fake = FakeTranslator("merge")
+    batch = BatchTranslator(fake.translate, max_chars=10)
+    texts = ["aaaa", "bbbb", "cccc", "dddd"]  # două pachete de câte două segmente
+    assert batch.translate(texts) == ["AAAA", "BBBB", "CCCC", "DDDD"]
+    # Doar primul pachet se trimite împachetat; restul textelor merg câte unul
+    assert batch.requests == 1 + 4
+
+
+def test_failed_request_leaves_texts_untranslated():
+    errors = []
+
+    def broken(text):
+        raise RuntimeError("quota")
+
+    batch = BatchTranslator(broken, on_error=errors.append)
+    assert batch.translate(["One", "Two"]) == [None, None]
+    assert batch.requests == 1 and len(errors) == 1
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_") and callable(fn)]
+    for name, fn in tests:
+        fn()
+        print(f"[OK] {name}")
+    sys.exit(0)